@@ -3,45 +3,58 @@ warnings.filterwarnings('ignore', message='Core Pydantic V1 functionality')
 
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-from modules.parsing.jd_parser import parse_jd
+from werkzeug.exceptions import RequestEntityTooLarge
 from modules.parsing.resume_parser import parse_resume
-from modules.recommender.jd_reume import  match_resume_jd_semantic
-from modules.recommender.job_semantic import recommend_jobs_semantic
+from routes import handlers
+from routes.handlers import SKILLS_CSV, warmup
 from routes.roadmap_routes import roadmap_bp
 from routes.personalized_roadmap_routes import personalized_roadmap_bp
+from modules.utils.streaming import ndjson_response
+from modules.utils.uploads import DEFAULT_MAX_UPLOAD_BYTES, InMemoryRequest, UploadTooLarge, read_upload
 
 import os
 
 app = Flask(__name__)
 CORS(app)  # Enable CORS for all routes
 
-UPLOAD_FOLDER = "uploads"
-os.makedirs(UPLOAD_FOLDER, exist_ok=True)
+# Uploads are parsed straight from memory, never written to disk
+MAX_UPLOAD_BYTES = int(os.environ.get("MAX_UPLOAD_BYTES", DEFAULT_MAX_UPLOAD_BYTES))
+app.request_class = InMemoryRequest
+# Leave room for multipart framing and the jd_text form field
+app.config["MAX_CONTENT_LENGTH"] = MAX_UPLOAD_BYTES + 1024 * 1024
 
 # REGISTER BLUEPRINTS
 app.register_blueprint(roadmap_bp, url_prefix="/api")
 app.register_blueprint(personalized_roadmap_bp, url_prefix="/api")
 
 
-SKILLS_CSV = "data/skills.csv"
+# Route bodies live in routes.handlers, shared with the ASGI app (asgi.py)
+def _respond(result):
+    body, status = result
+    if isinstance(body, dict):
+        return jsonify(body), status
+    return ndjson_response(body)
 
 
-@app.route("/parse-jd", methods=["POST"])
-def parse_jd_route():
+def _get_resume_file():
     try:
-        data = request.get_json()
+        file = request.files.get("file")
+    except RequestEntityTooLarge:
+        raise UploadTooLarge(MAX_UPLOAD_BYTES)
+    if file is None or file.filename == "":
+        return None
+    return file
 
-        if not data or "jd_text" not in data:
-            return jsonify({"error": "jd_text is required"}), 400
 
-        jd_text = data["jd_text"]
+def _parse_uploaded_resume(file) -> list[str]:
+    data = read_upload(file.stream, MAX_UPLOAD_BYTES)
+    return parse_resume(data, SKILLS_CSV, filename=file.filename)
 
-        jd_skill_weights = parse_jd(jd_text, SKILLS_CSV)
 
-        return jsonify({
-            "status": "success",
-            "jd_skill_weights": jd_skill_weights
-        }), 200
+@app.route("/parse-jd", methods=["POST"])
+def parse_jd_route():
+    try:
+        return _respond(handlers.parse_jd_body(request.get_json()))
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -51,23 +64,19 @@ def parse_jd_route():
 @app.route("/parse-resume", methods=["POST"])
 def parse_resume_route():
     try:
-        if "file" not in request.files:
+        file = _get_resume_file()
+        if file is None:
             return jsonify({"error": "Upload a PDF or DOCX resume"}), 400
 
-        file = request.files["file"]
-        if file.filename == "":
-            return jsonify({"error": "No file selected"}), 400
-
-        file_path = os.path.join(UPLOAD_FOLDER, file.filename)
-        file.save(file_path)
-
-        resume_skills = parse_resume(file_path, SKILLS_CSV)
+        resume_skills = _parse_uploaded_resume(file)
 
         return jsonify({
             "status": "success",
             "resume_skills": resume_skills
         }), 200
 
+    except UploadTooLarge as e:
+        return jsonify({"error": str(e)}), 413
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -78,72 +87,70 @@ def parse_resume_route():
 def match_jd_resume():
     try:
      
-        if "file" not in request.files:
+        file = _get_resume_file()
+        if file is None:
             return jsonify({"error": "Upload a resume file (.pdf or .docx)"}), 400
 
-        file = request.files["file"]
-        if file.filename == "":
-            return jsonify({"error": "No file selected"}), 400
-
       
-        file_path = os.path.join(UPLOAD_FOLDER, file.filename)
-        file.save(file_path)
+        resume_skills = _parse_uploaded_resume(file)
 
-      
-        resume_skills = parse_resume(file_path, SKILLS_CSV)
+        return _respond(handlers.match_jd_resume_body(resume_skills, request.form.get("jd_text")))
 
-      
-        jd_text = request.form.get("jd_text")
-        if not jd_text:
-            return jsonify({"error": "jd_text is required"}), 400
+    except UploadTooLarge as e:
+        return jsonify({"error": str(e)}), 413
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
 
-       
-        jd_skill_weights = parse_jd(jd_text, SKILLS_CSV)
-        jd_skills = list(jd_skill_weights.keys())
 
+@app.route("/match-skills", methods=["POST"])
+def match_skills():
+    try:
+        return _respond(handlers.match_skills_body(request.get_json()))
 
-        match_result = match_resume_jd_semantic(resume_skills, jd_skills)
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
 
-    
-        return jsonify({
-            "status": "success",
-            "resume_skills": resume_skills,
-            "jd_skills": jd_skills,
-            "match_result": match_result
-        }), 200
+
+
+
+@app.route("/match-skills-batch", methods=["POST"])
+def match_skills_batch():
+    """
+    One JD against many students in a single call.
+
+    Body: {"jd_skills": [...], "jd_skill_weights": {...} (optional),
+           "students": [{"id": ..., "skills": [...]}, ...],
+           "threshold": 75 (optional, minimum match_percentage to return),
+           "semantic_mode": "joined" | "composed" (optional),
+           "stream": true (optional)}
+    Each match_result is the same as /match-skills returns for that student.
+    With "stream", results are sent as NDJSON lines while later students are
+    still being scored, followed by a {"status", "total"} line.
+    """
+    try:
+        return _respond(handlers.match_skills_batch_body(request.get_json()))
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
-@app.route("/match-skills", methods=["POST"])
-def match_skills():
-    print("Request received in match-skills")
+
+
+@app.route("/match-matrix", methods=["POST"])
+def match_matrix_route():
+    """
+    Every student against every job, for the dashboards.
+
+    Body: {"students": [{"id": ..., "skills": [...]}, ...],
+           "jobs": [{"id": ..., "skills": [...], "skill_weights": {...} (optional)}, ...],
+           "top_k": 5 (optional), "semantic_mode": "joined" | "composed" (optional),
+           "stream": true (optional)}
+    Returns the top_k jobs for each student and the top_k students for each job.
+    With "stream", NDJSON lines {"student": ...} are sent as each chunk of
+    students is scored, then the {"job": ...} lines and a {"status"} line.
+    """
     try:
-        data = request.get_json()
-        print(f"Data received: {data}")
-
-        
-        if not data:
-            return jsonify({"error": "JSON data required"}), 400
-        
-        resume_skills = data.get("resume_skills", [])
-        jd_skills = data.get("jd_skills", [])
-        
-        if not resume_skills or not isinstance(resume_skills, list):
-            return jsonify({"error": "resume_skills must be a non-empty list"}), 400
-        
-        if not jd_skills or not isinstance(jd_skills, list):
-            return jsonify({"error": "jd_skills must be a non-empty list"}), 400
-        
-        match_result = match_resume_jd_semantic(resume_skills, jd_skills)
-        
-        return jsonify({
-            "status": "success",
-            "resume_skills": resume_skills,
-            "jd_skills": jd_skills,
-            "match_result": match_result
-        }), 200
+        return _respond(handlers.match_matrix_body(request.get_json()))
 
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -155,47 +162,32 @@ def match_skills():
 def full_process_route():
     try:
        
-        if "file" not in request.files:
+        file = _get_resume_file()
+        if file is None:
             return jsonify({"error": "Upload a resume file"}), 400
 
-        file = request.files["file"]
-        if file.filename == "":
-            return jsonify({"error": "No file selected"}), 400
-
-        file_path = os.path.join(UPLOAD_FOLDER, file.filename)
-        file.save(file_path)
-
     
-        resume_skills = parse_resume(file_path, SKILLS_CSV)
+        resume_skills = _parse_uploaded_resume(file)
 
+        return _respond(handlers.full_process_body(resume_skills, request.form.get("jd_text")))
 
-        jd_text = request.form.get("jd_text")
-        jd_skills = None
-        match_result = None
-
-        if jd_text:
-            jd_skill_weights = parse_jd(jd_text, SKILLS_CSV)
-            jd_skills = list(jd_skill_weights.keys())
-            match_result = match_resume_jd_semantic(resume_skills, jd_skills)
+    except UploadTooLarge as e:
+        return jsonify({"error": str(e)}), 413
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
 
-      
-        recommended_jobs = recommend_jobs_semantic(resume_skills, top_n=5)
 
-        return jsonify({
-            "status": "success",
-            "resume_skills": resume_skills,
-            "jd_skills": jd_skills,
-            "match_result": match_result,
-            "recommended_jobs": recommended_jobs
-        }), 200
 
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+@app.route("/cache-stats", methods=["GET"])
+def cache_stats_route():
+    return _respond(handlers.cache_stats_body())
 
 
 
 if __name__ == "__main__":
     port = int(os.environ.get('PORT', 5002))
+    if os.environ.get("WARMUP_ON_START", "1") != "0":
+        warmup()
     print(f"Starting server on port {port}")
     app.run(debug=False, host='0.0.0.0', port=port, threaded=True)
 
@@ -0,0 +1,325 @@
+"""
+ASGI variant of api.py, served by uvicorn:
+
+    uvicorn asgi:app --host 0.0.0.0 --port 5002
+
+Same routes, request bodies and responses as the Flask app, including the
+/api roadmap routes; the route bodies are shared through routes.handlers.
+What changes is where the work runs:
+- CPU-bound stages (JD/resume parsing, encoding, scoring) run in a bounded
+  thread pool of ASGI_CPU_THREADS workers, so the event loop never blocks
+  and at most that many requests compete for the CPU
+- resume files can be parsed in a pool of ASGI_PARSE_PROCESSES processes
+  instead (default 0: the thread pool), since PDF parsing holds the GIL;
+  each process then keeps its own resume cache
+- Gemini calls are awaited on the SDK's async client, concurrently for the
+  skills of one roadmap (GEMINI_CONCURRENCY)
+- NDJSON streams compute one batch at a time in the thread pool
+"""
+
+import warnings
+warnings.filterwarnings('ignore', message='Core Pydantic V1 functionality')
+
+import asyncio
+import json
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from modules.parsing.resume_parser import parse_resume
+from modules.parsing.taxonomy import get_taxonomy
+from modules.roadmap.personalized_roadmap import build_personalized_job_roadmap_async
+from modules.roadmap.roadmap_builder import build_roadmap_for_skills_async
+from modules.utils.streaming import NDJSON_HEADERS, NDJSON_MIMETYPE, ndjson_lines
+from modules.utils.uploads import DEFAULT_MAX_UPLOAD_BYTES, UploadTooLarge, parse_multipart, read_upload
+from routes import handlers
+from routes.handlers import SKILLS_CSV, warmup
+from routes.personalized_roadmap_routes import job_context, personalized_roadmap_args, roadmap_preview_body
+
+ASGI_CPU_THREADS = int(os.environ.get("ASGI_CPU_THREADS", max(2, os.cpu_count() or 1)))
+ASGI_PARSE_PROCESSES = int(os.environ.get("ASGI_PARSE_PROCESSES", 0))
+
+# Uploads are parsed straight from memory, never written to disk
+MAX_UPLOAD_BYTES = int(os.environ.get("MAX_UPLOAD_BYTES", DEFAULT_MAX_UPLOAD_BYTES))
+# Leave room for multipart framing and the jd_text form field
+MAX_CONTENT_LENGTH = MAX_UPLOAD_BYTES + 1024 * 1024
+_INLINE_JSON_BYTES = 64 * 1024
+
+_cpu_pool = None
+_parse_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_cpu_pool() -> ThreadPoolExecutor:
+    global _cpu_pool
+    if _cpu_pool is None:
+        with _pool_lock:
+            if _cpu_pool is None:
+                _cpu_pool = ThreadPoolExecutor(ASGI_CPU_THREADS, thread_name_prefix="asgi-cpu")
+    return _cpu_pool
+
+
+def _get_parse_pool():
+    global _parse_pool
+    if ASGI_PARSE_PROCESSES <= 0:
+        return _get_cpu_pool()
+    if _parse_pool is None:
+        with _pool_lock:
+            if _parse_pool is None:
+                # spawn: forking a process that already runs the event loop and pool threads is unsafe
+                _parse_pool = ProcessPoolExecutor(ASGI_PARSE_PROCESSES, mp_context=multiprocessing.get_context("spawn"),
+                                                  initializer=get_taxonomy, initargs=(SKILLS_CSV,))
+    return _parse_pool
+
+
+def _shutdown_pools() -> None:
+    global _cpu_pool, _parse_pool
+    with _pool_lock:
+        for pool in (_cpu_pool, _parse_pool):
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+        _cpu_pool = _parse_pool = None
+
+
+async def _run(func, *args, pool=None):
+    """Run a blocking call in ``pool`` (default: the CPU thread pool) and await it."""
+    return await asyncio.get_running_loop().run_in_executor(pool or _get_cpu_pool(), func, *args)
+
+
+async def _iterate(iterator):
+    # Each next() computes one NDJSON chunk, so it runs in the pool too
+    done = object()
+    while True:
+        chunk = await _run(next, iterator, done)
+        if chunk is done:
+            return
+        yield chunk
+
+
+def _error(message: str, status: int) -> JSONResponse:
+    return JSONResponse({"error": message}, status_code=status)
+
+
+def _respond(result):
+    body, status = result
+    if isinstance(body, dict):
+        return JSONResponse(body, status_code=status)
+    return StreamingResponse(_iterate(ndjson_lines(body)), media_type=NDJSON_MIMETYPE, headers=NDJSON_HEADERS)
+
+
+async def _json(request: Request):
+    # None for a missing or malformed body. Bulk bodies are decoded off the
+    # loop; for small ones the pool hop would cost more than the decode
+    body = await request.body()
+    try:
+        if len(body) > _INLINE_JSON_BYTES:
+            return await _run(json.loads, body)
+        return json.loads(body) if body else None
+    except ValueError:
+        return None
+
+
+async def _read_form(request: Request):
+    """Multipart form and files of an upload request, read into memory with a size cap."""
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > MAX_CONTENT_LENGTH:
+        raise UploadTooLarge(MAX_UPLOAD_BYTES)
+    body = bytearray()
+    async for chunk in request.stream():
+        body.extend(chunk)
+        if len(body) > MAX_CONTENT_LENGTH:
+            raise UploadTooLarge(MAX_UPLOAD_BYTES)
+    return await _run(parse_multipart, bytes(body), request.headers.get("content-type", ""))
+
+
+async def _parse_uploaded_resume(file) -> list[str]:
+    data = read_upload(file.stream, MAX_UPLOAD_BYTES)
+    return await _run(partial(parse_resume, data, SKILLS_CSV, filename=file.filename), pool=_get_parse_pool())
+
+
+def _resume_file(files):
+    file = files.get("file")
+    if file is None or file.filename == "":
+        return None
+    return file
+
+
+@asynccontextmanager
+async def lifespan(app):
+    if os.environ.get("WARMUP_ON_START", "1") != "0":
+        await _run(warmup)
+    yield
+    _shutdown_pools()
+
+
+app = FastAPI(title="hybrid_roadmap", lifespan=lifespan)
+app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
+
+
+@app.post("/parse-jd")
+async def parse_jd_route(request: Request):
+    try:
+        return _respond(await _run(handlers.parse_jd_body, await _json(request)))
+    except Exception as e:
+        return _error(str(e), 500)
+
+
+@app.post("/parse-resume")
+async def parse_resume_route(request: Request):
+    try:
+        _, files = await _read_form(request)
+        file = _resume_file(files)
+        if file is None:
+            return _error("Upload a PDF or DOCX resume", 400)
+
+        resume_skills = await _parse_uploaded_resume(file)
+
+        return JSONResponse({
+            "status": "success",
+            "resume_skills": resume_skills
+        })
+
+    except UploadTooLarge as e:
+        return _error(str(e), 413)
+    except Exception as e:
+        return _error(str(e), 500)
+
+
+@app.post("/match-jd-resume")
+async def match_jd_resume(request: Request):
+    try:
+        form, files = await _read_form(request)
+        file = _resume_file(files)
+        if file is None:
+            return _error("Upload a resume file (.pdf or .docx)", 400)
+
+        resume_skills = await _parse_uploaded_resume(file)
+
+        return _respond(await _run(handlers.match_jd_resume_body, resume_skills, form.get("jd_text")))
+
+    except UploadTooLarge as e:
+        return _error(str(e), 413)
+    except Exception as e:
+        return _error(str(e), 500)
+
+
+@app.post("/match-skills")
+async def match_skills(request: Request):
+    try:
+        return _respond(await _run(handlers.match_skills_body, await _json(request)))
+    except Exception as e:
+        return _error(str(e), 500)
+
+
+@app.post("/match-skills-batch")
+async def match_skills_batch(request: Request):
+    """One JD against many students; see the Flask route in api.py for the body."""
+    try:
+        return _respond(await _run(handlers.match_skills_batch_body, await _json(request)))
+    except Exception as e:
+        return _error(str(e), 500)
+
+
+@app.post("/match-matrix")
+async def match_matrix_route(request: Request):
+    """Every student against every job; see the Flask route in api.py for the body."""
+    try:
+        return _respond(await _run(handlers.match_matrix_body, await _json(request)))
+    except Exception as e:
+        return _error(str(e), 500)
+
+
+@app.post("/full-process")
+async def full_process_route(request: Request):
+    try:
+        form, files = await _read_form(request)
+        file = _resume_file(files)
+        if file is None:
+            return _error("Upload a resume file", 400)
+
+        resume_skills = await _parse_uploaded_resume(file)
+
+        return _respond(await _run(handlers.full_process_body, resume_skills, form.get("jd_text")))
+
+    except UploadTooLarge as e:
+        return _error(str(e), 413)
+    except Exception as e:
+        return _error(str(e), 500)
+
+
+@app.get("/cache-stats")
+async def cache_stats_route():
+    return _respond(await _run(handlers.cache_stats_body))
+
+
+# ------------- /api roadmap routes (the Flask blueprints) -------------
+roadmap_router = APIRouter()
+personalized_roadmap_router = APIRouter()
+
+
+@roadmap_router.post("/generate-roadmap")
+async def generate_roadmap(request: Request):
+    try:
+        data = await _json(request)
+        if not data or "skills" not in data:
+            return _error("skills list is required", 400)
+
+        result = await build_roadmap_for_skills_async(data["skills"])
+
+        return JSONResponse({
+            "status": "success",
+            "roadmap": result
+        })
+
+    except Exception as e:
+        return _error(str(e), 500)
+
+
+@personalized_roadmap_router.post("/personalized-job-roadmap")
+async def generate_personalized_job_roadmap(request: Request):
+    """Request body as for the Flask route in routes/personalized_roadmap_routes.py."""
+    try:
+        data = await _json(request)
+        roadmap_args, error = personalized_roadmap_args(data)
+        if error:
+            return _error(error, 400)
+
+        roadmap = await build_personalized_job_roadmap_async(**roadmap_args)
+        roadmap["job_context"] = job_context(data)
+
+        return JSONResponse({
+            "status": "success",
+            "roadmap": roadmap
+        })
+
+    except Exception as e:
+        print(f"❌ Error generating personalized roadmap: {str(e)}")
+        return _error(str(e), 500)
+
+
+@personalized_roadmap_router.post("/roadmap-preview")
+async def roadmap_preview(request: Request):
+    try:
+        body, status = roadmap_preview_body(await _json(request))
+        return JSONResponse(body, status_code=status)
+    except Exception as e:
+        return _error(str(e), 500)
+
+
+app.include_router(roadmap_router, prefix="/api")
+app.include_router(personalized_roadmap_router, prefix="/api")
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    port = int(os.environ.get('PORT', 5002))
+    print(f"Starting ASGI server on port {port}")
+    uvicorn.run(app, host='0.0.0.0', port=port)
@@ -0,0 +1,98 @@
+"""
+ANN BENCHMARK
+Recall@k and query latency of the approximate job embedding indexes against
+exact brute-force search, on synthetic clustered 384-dim embeddings (the
+MiniLM size) for catalogs of 10k to 1M jobs.
+
+faiss / hnswlib rows are skipped when those packages are not installed.
+
+Run from the hybrid_roadmap directory:
+    python benchmarks/bench_ann.py [--sizes 10000 100000] [--queries 100] [--k 10]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from modules.recommender.ann import FAISS_AVAILABLE, HNSWLIB_AVAILABLE, build_ann_index
+
+DIM = 384
+
+CONFIGS = [
+    ("ivf", {"nprobe": 1}),
+    ("ivf", {"nprobe": 4}),
+    ("ivf", {"nprobe": 16}),
+    ("ivf", {"nprobe": 64}),
+]
+if FAISS_AVAILABLE:
+    CONFIGS += [("faiss", {"ef_search": ef}) for ef in (16, 64, 256)]
+if HNSWLIB_AVAILABLE:
+    CONFIGS += [("hnswlib", {"ef_search": ef}) for ef in (16, 64, 256)]
+
+
+def embeddings(n: int, centers: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Job-like embeddings: many topical clusters with spread inside each."""
+    clusters = len(centers)
+    out = np.empty((n, DIM), dtype=np.float32)
+    for start in range(0, n, 100_000):
+        stop = min(n, start + 100_000)
+        labels = rng.integers(clusters, size=stop - start)
+        out[start:stop] = centers[labels] + 0.6 * rng.normal(size=(stop - start, DIM)).astype(np.float32)
+    return out
+
+
+def run(index, queries: np.ndarray, k: int) -> tuple[list[np.ndarray], float]:
+    found = []
+    start = time.perf_counter()
+    for q in queries:
+        found.append(index.search(q, k)[0])
+    return found, (time.perf_counter() - start) / len(queries)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--k", type=int, default=10)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    for n in args.sizes:
+        # Resumes are drawn from the same topics as the jobs
+        centers = rng.normal(size=(500, DIM)).astype(np.float32)
+        vectors = embeddings(n, centers, rng)
+        queries = embeddings(args.queries, centers, rng)
+
+        start = time.perf_counter()
+        exact = build_ann_index(vectors, "exact")
+        exact_build = time.perf_counter() - start
+        truth, exact_ms = run(exact, queries, args.k)
+        del exact
+
+        print(f"\n{n:,} jobs x {DIM} dims, {args.queries} queries, k={args.k}")
+        print(f"{'backend':<28} | {'build s':>7} | {'ms/query':>8} | {'speedup':>7} | {'recall@k':>8}")
+        print("-" * 72)
+        print(f"{'exact':<28} | {exact_build:>7.2f} | {exact_ms * 1000:>8.2f} | {1.0:>6.1f}x | {1.0:>8.3f}")
+
+        built = {}
+        for backend, params in CONFIGS:
+            # Build once per backend, then vary only the search-time parameter
+            if backend not in built:
+                start = time.perf_counter()
+                built[backend] = (build_ann_index(vectors, backend, {}), time.perf_counter() - start)
+            index, build_s = built[backend]
+            for name, value in params.items():
+                setattr(index, name, value)
+            found, ms = run(index, queries, args.k)
+            recall = np.mean([len(set(t) & set(f)) / args.k for t, f in zip(truth, found)])
+            label = f"{backend} " + " ".join(f"{k}={v}" for k, v in params.items())
+            print(f"{label:<28} | {build_s:>7.2f} | {ms * 1000:>8.2f} | {exact_ms / ms:>6.1f}x | {recall:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
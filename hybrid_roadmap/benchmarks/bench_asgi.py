@@ -0,0 +1,168 @@
+"""
+ASGI VS FLASK THROUGHPUT BENCHMARK
+Serves the Flask app (api.py, threaded werkzeug server as `python api.py`
+runs it) and the ASGI app (asgi.py under uvicorn) one after the other, each
+in its own single-worker process, and drives both with the same concurrent
+httpx clients. Every request carries distinct skills / resume bytes so the
+parse and match caches do not answer for the server.
+
+Gemini is replaced in the server process by a client that takes --llm-ms per
+call (time.sleep on the sync path, asyncio.sleep on the async path), so the
+roadmap scenario measures how each server waits on the LLM, not quota.
+
+Run from the hybrid_roadmap directory (ENCODER_BACKEND=stub needs no model):
+    python benchmarks/bench_asgi.py [--llm-ms 300] [--backend stub]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import random
+import subprocess
+import sys
+import time
+from types import SimpleNamespace
+
+import httpx
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+RESUME = "Bhoomika_agrawal.resume.pdf"
+JD_TEXT = "Backend engineer with Python, SQL, Docker, AWS and Kubernetes experience."
+
+
+class SimulatedGemini:
+    """Returns a fixed subtopic list after ``delay`` seconds, like a remote LLM call."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.models = SimpleNamespace(generate_content=self._generate)
+        self.aio = SimpleNamespace(models=SimpleNamespace(generate_content=self._generate_async))
+
+    def _generate(self, model, contents):
+        time.sleep(self.delay)
+        return SimpleNamespace(text='["Basics", "Core Concepts", "Tooling", "Projects"]')
+
+    async def _generate_async(self, model, contents):
+        await asyncio.sleep(self.delay)
+        return SimpleNamespace(text='["Basics", "Core Concepts", "Tooling", "Projects"]')
+
+
+def serve(kind: str, port: int, llm_ms: float) -> None:
+    from modules.roadmap import gemini_agent, llama_agent
+
+    gemini_agent.client = SimulatedGemini(llm_ms / 1000)
+    gemini_agent.GEMINI_AVAILABLE = llama_agent.GEMINI_AVAILABLE = True
+    if kind == "flask":
+        from api import app, warmup
+
+        # No per-request access log on either server
+        logging.getLogger("werkzeug").setLevel(logging.WARNING)
+        warmup()
+        app.run(host="127.0.0.1", port=port, threaded=True)
+    else:
+        import uvicorn
+
+        uvicorn.run("asgi:app", host="127.0.0.1", port=port, log_level="warning")
+
+
+def scenarios(skills: list[str], resume: bytes):
+    """(name, requests, concurrency, make_request(client, i)) per workload."""
+    rng = random.Random(7)
+    sample = lambda low, high: rng.sample(skills, rng.randint(low, high))
+    small = [(sample(3, 15), sample(3, 10)) for _ in range(400)]
+    batches = [[{"id": s, "skills": sample(3, 15)} for s in range(200)] for _ in range(40)]
+    roadmaps = [["Python"] + sample(4, 4) for _ in range(64)]
+
+    return [
+        ("match-skills", 400, 32, lambda c, i: c.post(
+            "/match-skills", json={"resume_skills": small[i][0], "jd_skills": small[i][1]})),
+        ("match-skills-batch x200", 40, 8, lambda c, i: c.post(
+            "/match-skills-batch", json={"jd_skills": small[i][1], "students": batches[i]})),
+        # A PDF comment after %%EOF gives every upload its own cache key
+        ("match-jd-resume (PDF)", 60, 8, lambda c, i: c.post(
+            "/match-jd-resume", files={"file": (RESUME, resume + f"\n% {i}\n".encode(), "application/pdf")},
+            data={"jd_text": f"{JD_TEXT} Ref {i}."})),
+        ("personalized-job-roadmap", 64, 32, lambda c, i: c.post(
+            "/api/personalized-job-roadmap", json={"resume_skills": ["Python"], "jd_skills": roadmaps[i]})),
+    ]
+
+
+async def drive(port: int, count: int, concurrency: int, make_request) -> tuple[float, float, float]:
+    """Requests per second, p50 ms and p99 ms for ``count`` requests at ``concurrency``."""
+    latencies = []
+    next_index = iter(range(count))
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=300) as client:
+        await make_request(client, 0)  # warm the route
+
+        async def worker():
+            for i in next_index:
+                start = time.perf_counter()
+                response = await make_request(client, i)
+                latencies.append(time.perf_counter() - start)
+                assert response.status_code == 200, response.text[:200]
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    return count / elapsed, p50, p99
+
+
+def wait_ready(port: int, process: subprocess.Popen) -> None:
+    for _ in range(600):
+        if process.poll() is not None:
+            raise RuntimeError("server exited during startup")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/cache-stats", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError("server did not start")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--llm-ms", type=float, default=300)
+    parser.add_argument("--backend", default="stub")
+    parser.add_argument("--port", type=int, default=5099)
+    parser.add_argument("--serve", choices=["flask", "asgi"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.serve:
+        serve(args.serve, args.port, args.llm_ms)
+        return
+
+    from modules.parsing.taxonomy import get_taxonomy
+
+    skills = get_taxonomy("data/skills.csv").skills
+    with open(RESUME, "rb") as f:
+        resume = f.read()
+    env = {**os.environ, "ENCODER_BACKEND": args.backend, "WARMUP_ON_START": "1"}
+
+    results = {}
+    for kind in ("flask", "asgi"):
+        process = subprocess.Popen(
+            [sys.executable, __file__, "--serve", kind, "--port", str(args.port), "--llm-ms", str(args.llm_ms)],
+            env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            wait_ready(args.port, process)
+            for name, count, concurrency, make_request in scenarios(skills, resume):
+                results[name, kind] = asyncio.run(drive(args.port, count, concurrency, make_request))
+        finally:
+            process.terminate()
+            process.wait()
+
+    print(f"{os.cpu_count()} CPUs, encoder {args.backend}, simulated Gemini {args.llm_ms:g} ms per call\n")
+    print(f"{'scenario':<26} | {'server':<6} | {'req/s':>7} | {'p50 ms':>8} | {'p99 ms':>8}")
+    print("-" * 68)
+    for name, *_ in scenarios(skills, resume):
+        for kind in ("flask", "asgi"):
+            rps, p50, p99 = results[name, kind]
+            print(f"{name:<26} | {kind:<6} | {rps:>7.1f} | {p50:>8.1f} | {p99:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+ENCODE BATCHING BENCHMARK
+Throughput and latency of concurrent encode calls (two short texts each, as
+/match-skills makes) with and without the cross-request BatchingEncoder.
+
+By default the encoder is a CPU-cost model: a fixed per-call overhead plus a
+small per-text cost, spent outside the GIL like a torch forward pass. Pass
+--backend torch / onnx to measure a real model instead.
+
+Run from the hybrid_roadmap directory:
+    python benchmarks/bench_batching.py [--backend simulated] [--requests 400]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from modules.recommender.batching import BatchingEncoder
+from modules.recommender.encoders import StubEncoder, get_encoder
+
+CONCURRENCY = [1, 8, 32]
+
+
+class SimulatedEncoder(StubEncoder):
+    """Fixed 4 ms per call + 0.1 ms per text, serialized like a model sharing the CPU."""
+
+    def __init__(self):
+        super().__init__()
+        self._cpu = threading.Lock()
+
+    def encode(self, texts):
+        with self._cpu:
+            time.sleep(0.004 + 0.0001 * len(texts))
+        return super().encode(texts)
+
+
+def run(encoder, concurrency: int, requests: int) -> tuple[float, float, float]:
+    latencies = []
+    per_thread = requests // concurrency
+
+    def worker(seed: int):
+        for i in range(per_thread):
+            start = time.perf_counter()
+            encoder.encode([f"python sql docker {seed} {i}", "python flask aws"])
+            latencies.append(time.perf_counter() - start)
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(concurrency)]
+    start = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    elapsed = time.perf_counter() - start
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    return len(latencies) / elapsed, p50, p99
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--backend", default="simulated", choices=["simulated", "torch", "onnx"])
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=5)
+    args = parser.parse_args()
+
+    base = SimulatedEncoder() if args.backend == "simulated" else get_encoder(backend=args.backend)
+    base.encode(["warmup"])
+
+    print(f"{'threads':>7} | {'mode':<8} | {'req/s':>7} | {'p50 ms':>7} | {'p99 ms':>7} | {'mean batch':>10}")
+    print("-" * 62)
+    for concurrency in CONCURRENCY:
+        rps, p50, p99 = run(base, concurrency, args.requests)
+        print(f"{concurrency:>7} | {'direct':<8} | {rps:>7.0f} | {p50:>7.2f} | {p99:>7.2f} | {2:>10.1f}")
+
+        # max_wait 0 only batches what queued up while the previous batch ran
+        for max_wait_ms in dict.fromkeys([args.max_wait_ms, 0]):
+            batcher = BatchingEncoder(base, args.batch_size, max_wait_ms)
+            rps, p50, p99 = run(batcher, concurrency, args.requests)
+            mean_batch = batcher.stats()["batch_size"]["mean"]
+            mode = f"wait {max_wait_ms:g}"
+            print(f"{concurrency:>7} | {mode:<8} | {rps:>7.0f} | {p50:>7.2f} | {p99:>7.2f} | {mean_batch:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+BULK MATCH BENCHMARK
+Times BulkMatcher.top_k (top-k jobs per student and students per job in one
+chunked pass) against per-pair match_resume_jd_semantic calls. The per-pair
+time is extrapolated from a sample of pairs. Also reports the peak traced
+memory of the bulk pass, which the chunking bounds.
+
+Run from the hybrid_roadmap directory (ENCODER_BACKEND=stub needs no model):
+    python benchmarks/bench_bulk_match.py [--mode joined|composed] [--block-mb 64]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from modules.parsing.taxonomy import get_taxonomy
+from modules.recommender.bulk_match import BulkMatcher
+from modules.recommender.jd_reume import match_resume_jd_semantic
+
+SIZES = [(1_000, 100), (10_000, 1_000), (50_000, 2_000)]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mode", choices=["joined", "composed"], default="composed")
+    parser.add_argument("--block-mb", type=float, default=64)
+    parser.add_argument("--top-k", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    skills = get_taxonomy("data/skills.csv").skills
+    sample = lambda: rng.sample(skills, rng.randint(3, 20))
+    match_resume_jd_semantic(sample(), sample(), semantic_mode=args.mode)
+
+    pairs = [(sample(), sample()) for _ in range(200)]
+    start = time.perf_counter()
+    for student, job in pairs:
+        match_resume_jd_semantic(student, job, semantic_mode=args.mode)
+    pair_s = (time.perf_counter() - start) / len(pairs)
+
+    print(f"{'students x jobs':>17} | {'chunk':>6} | {'bulk s':>7} | {'per-pair s (est.)':>17} | "
+          f"{'speedup':>8} | {'peak MB':>8}")
+    print("-" * 80)
+    for n_students, n_jobs in SIZES:
+        students = [sample() for _ in range(n_students)]
+        jobs = [sample() for _ in range(n_jobs)]
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        matcher = BulkMatcher(jobs, semantic_mode=args.mode, block_bytes=int(args.block_mb * 1024 * 1024))
+        matcher.top_k(students, args.top_k)
+        bulk_s = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        tracemalloc.stop()
+
+        loop_s = pair_s * n_students * n_jobs
+        print(f"{n_students:>8,} x {n_jobs:>6,} | {matcher.chunk_rows():>6,} | {bulk_s:>7.2f} | {loop_s:>17,.0f} | "
+              f"{loop_s / bulk_s:>7,.0f}x | {peak:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
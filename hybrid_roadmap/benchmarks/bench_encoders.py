@@ -0,0 +1,77 @@
+"""
+ENCODER BACKEND BENCHMARK
+Single-text latency (p50 / p99) and batched throughput of each sentence
+encoder backend on this machine's CPU, over the same skill-list texts the
+matchers encode.
+
+Backends that cannot be loaded here (no model in the local cache, no
+onnxruntime, no exported ONNX model) are reported as unavailable. Export the
+ONNX model once with:
+    python -m modules.recommender.encoders
+
+Run from the hybrid_roadmap directory:
+    python benchmarks/bench_encoders.py [--calls 200] [--batch 32] [--threads N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from modules.parsing.taxonomy import get_taxonomy
+from modules.recommender.encoders import ENCODER_BACKENDS, get_encoder
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--batch", type=int, default=32)
+    parser.add_argument("--threads", type=int, default=None, help="torch / onnxruntime intra-op threads")
+    args = parser.parse_args()
+
+    if args.threads:
+        os.environ["OMP_NUM_THREADS"] = str(args.threads)
+        try:
+            import torch
+
+            torch.set_num_threads(args.threads)
+        except ImportError:
+            pass
+
+    rng = random.Random(0)
+    skills = get_taxonomy("data/skills.csv").skills
+    texts = [" ".join(rng.sample(skills, rng.randint(3, 20))) for _ in range(max(args.calls, args.batch * 16))]
+
+    print(f"{'backend':<8} | {'p50 ms':>7} | {'p99 ms':>7} | {'texts/s (batch ' + str(args.batch) + ')':>20}")
+    print("-" * 52)
+    for backend in ENCODER_BACKENDS:
+        try:
+            encoder = get_encoder(backend=backend)
+            encoder.encode(texts[:2])
+        except Exception as e:
+            print(f"{backend:<8} | unavailable: {type(e).__name__}: {str(e).splitlines()[0][:60]}")
+            continue
+
+        latencies = []
+        for text in texts[:args.calls]:
+            start = time.perf_counter()
+            encoder.encode([text])
+            latencies.append(time.perf_counter() - start)
+
+        batches = [texts[i:i + args.batch] for i in range(0, args.batch * 16, args.batch)]
+        start = time.perf_counter()
+        for batch in batches:
+            encoder.encode(batch)
+        throughput = args.batch * len(batches) / (time.perf_counter() - start)
+
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+        print(f"{backend:<8} | {p50:>7.2f} | {p99:>7.2f} | {throughput:>20.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+JD PARSER BENCHMARK
+Compares the single-pass segmenter in weight_jd_skills with the original
+regex-per-section implementation on job descriptions from 1 KB to 100 KB.
+
+Run from the hybrid_roadmap directory:
+    python benchmarks/bench_jd_parser.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from modules.parsing.jd_parser import _weight_jd_skills_regex, weight_jd_skills
+from modules.parsing.taxonomy import get_taxonomy
+
+SIZES_KB = [1, 10, 50, 100]
+
+BLOCKS = [
+    "About the role: you will build and operate data products for our customers.",
+    "Responsibilities: design services, review code, mentor engineers and own releases.",
+    "Technical skills: {skills}.",
+    "Must have: {skills}. Nice to have: {skills}.",
+    "Experience with {skills} is expected; knowledge of {skills} is a plus.",
+    "Preferred qualifications: {skills}. Education: BS in Computer Science.",
+    "We offer flexible hours, a learning budget and a friendly team.",
+]
+
+
+def synthetic_jd(skills: list[str], size_kb: int, rng: random.Random) -> str:
+    parts = []
+    length = 0
+    while length < size_kb * 1024:
+        block = rng.choice(BLOCKS).format(skills=", ".join(rng.sample(skills, 4)))
+        parts.append(block)
+        length += len(block) + 1
+    return "\n".join(parts)
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    rng = random.Random(3)
+    taxonomy = get_taxonomy("data/skills.csv")
+    matcher = taxonomy.matcher
+
+    print(f"{'JD size':>8} | {'segmenter ms':>12} | {'regex ms':>9} | {'speedup':>8}")
+    print("-" * 48)
+    for size_kb in SIZES_KB:
+        jd = synthetic_jd(taxonomy.skills, size_kb, rng)
+        assert weight_jd_skills(jd, matcher) == _weight_jd_skills_regex(jd, matcher)
+
+        new_ms = timed(lambda: weight_jd_skills(jd, matcher), repeat=5) * 1000
+        old_ms = timed(lambda: _weight_jd_skills_regex(jd, matcher), repeat=3) * 1000
+        print(f"{size_kb:>6}KB | {new_ms:>12.2f} | {old_ms:>9.1f} | {old_ms / new_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+BATCH MATCHING BENCHMARK
+Compares scoring one JD against N students with one match_resume_jd_semantic
+call per student (what the Node server did through /match-skills) with a
+single match_resumes_jd_semantic call, and checks the results are the same.
+
+Run from the hybrid_roadmap directory (ENCODER_BACKEND=stub needs no model):
+    python benchmarks/bench_match_batch.py [--mode joined|composed]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from modules.parsing.taxonomy import get_taxonomy
+from modules.recommender import jd_reume
+from modules.recommender.jd_reume import match_resume_jd_semantic, match_resumes_jd_semantic
+
+SIZES = [10, 100, 1_000]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--mode", choices=["joined", "composed"], default="joined")
+    args = parser.parse_args()
+
+    rng = random.Random(3)
+    skills = get_taxonomy("data/skills.csv").skills
+    jd_skills = rng.sample(skills, 10)
+    match_resume_jd_semantic(jd_skills, jd_skills, semantic_mode=args.mode)
+
+    print(f"{'students':>8} | {'per student ms':>14} | {'batch ms':>9} | {'speedup':>8} | {'identical':>9}")
+    print("-" * 60)
+    for n in SIZES:
+        students = [rng.sample(skills, rng.randint(3, 20)) for _ in range(n)]
+
+        # Both sides score every pair; bench_match_cache.py covers cached rescoring
+        jd_reume._match_cache.clear()
+        start = time.perf_counter()
+        single = [match_resume_jd_semantic(resume, jd_skills, semantic_mode=args.mode) for resume in students]
+        loop_ms = (time.perf_counter() - start) * 1000
+
+        jd_reume._match_cache.clear()
+        start = time.perf_counter()
+        batch = match_resumes_jd_semantic(students, jd_skills, semantic_mode=args.mode)
+        batch_ms = (time.perf_counter() - start) * 1000
+
+        identical = sum(a == b for a, b in zip(single, batch)) / n
+        print(f"{n:>8,} | {loop_ms:>14.1f} | {batch_ms:>9.1f} | {loop_ms / batch_ms:>7.1f}x | {identical:>9.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+PAIR MATCH CACHE BENCHMARK
+Replays what the Node server sends on a dashboard refresh: every student
+scored against every job through match_resumes_jd_semantic (one call per
+job, as matchStudentsWithJD does). The first pass scores every pair. The
+refresh after it repeats the same requests with each skill list shuffled,
+which the order-insensitive key still answers from the cache. The last pass
+edits one job, so only that job's pairs are scored again.
+
+Run from the hybrid_roadmap directory (ENCODER_BACKEND=stub needs no model):
+    python benchmarks/bench_match_cache.py [--students 1000] [--jobs 50] [--mode joined|composed]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from modules.parsing.taxonomy import get_taxonomy
+from modules.recommender import jd_reume
+from modules.recommender.jd_reume import match_cache_stats, match_resumes_jd_semantic
+
+
+def refresh(students, jobs, mode) -> tuple[float, list]:
+    start = time.perf_counter()
+    results = [match_resumes_jd_semantic(students, job, semantic_mode=mode) for job in jobs]
+    return (time.perf_counter() - start) * 1000, results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--students", type=int, default=1000)
+    parser.add_argument("--jobs", type=int, default=50)
+    parser.add_argument("--mode", choices=["joined", "composed"], default="joined")
+    args = parser.parse_args()
+
+    rng = random.Random(5)
+    skills = get_taxonomy("data/skills.csv").skills
+    students = [rng.sample(skills, rng.randint(3, 20)) for _ in range(args.students)]
+    jobs = [rng.sample(skills, rng.randint(3, 15)) for _ in range(args.jobs)]
+    match_resumes_jd_semantic(students[:2], jobs[0], semantic_mode=args.mode)
+    jd_reume._match_cache.clear()
+    if jd_reume.MATCH_CACHE_SIZE < args.students * (args.jobs + 1):
+        print(f"⚠️ MATCH_CACHE_SIZE={jd_reume.MATCH_CACHE_SIZE} holds fewer than the "
+              f"{args.students * (args.jobs + 1):,} pairs replayed; later passes will miss\n")
+
+    shuffled_students = [rng.sample(s, len(s)) for s in students]
+    shuffled_jobs = [rng.sample(j, len(j)) for j in jobs]
+    edited_jobs = jobs[:-1] + [jobs[-1] + [rng.choice(skills)]]
+
+    print(f"{args.students:,} students x {args.jobs:,} jobs, {args.mode} mode\n")
+    print(f"{'pass':<26} | {'ms':>9} | {'hit rate':>8} | {'identical':>9}")
+    print("-" * 62)
+    baseline = None
+    for name, pass_students, pass_jobs in (
+        ("cold", students, jobs),
+        ("refresh (shuffled lists)", shuffled_students, shuffled_jobs),
+        ("one job edited", students, edited_jobs),
+    ):
+        before = match_cache_stats()
+        ms, results = refresh(pass_students, pass_jobs, args.mode)
+        after = match_cache_stats()
+        hits = after["hits"] - before["hits"]
+        lookups = hits + after["misses"] - before["misses"]
+        baseline = baseline or results
+        same = sum(a == b for job_a, job_b in zip(baseline[:-1], results[:-1]) for a, b in zip(job_a, job_b))
+        print(f"{name:<26} | {ms:>9.1f} | {hits / lookups:>8.1%} | {same / (args.students * (args.jobs - 1)):>9.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+MODEL MEMORY REPORT
+Compares resident memory when every recommender builds its own
+SentenceTransformer (the old behaviour: jd_reume, job_semantic and each
+HybridJobMatcher) with the shared model registry.
+
+Each scenario runs in a fresh interpreter so the numbers do not mix.
+
+Run from the hybrid_roadmap directory:
+    python benchmarks/bench_model_memory.py
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+SCENARIOS = {
+    "separate instances (old)": """
+from sentence_transformers import SentenceTransformer
+from modules.recommender.model_registry import DEFAULT_MODEL
+models = [SentenceTransformer(DEFAULT_MODEL) for _ in range(3)]
+""",
+    "shared registry (new)": """
+from modules.recommender import jd_reume, job_semantic
+from modules.recommender.hybrid_matcher import HybridJobMatcher
+from modules.recommender.model_registry import get_model
+models = [get_model() for _ in range(3)]
+assert all(m is models[0] for m in models)
+""",
+}
+
+REPORT_RSS = """
+import resource
+def rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * resource.getpagesize() / 2**20
+    except OSError:
+        # ru_maxrss is KB on Linux, bytes on macOS
+        scale = 2**20 if sys.platform == "darwin" else 2**10
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+"""
+
+
+def run(code: str) -> tuple[float, float]:
+    script = "\n".join([
+        "import sys",
+        REPORT_RSS,
+        "import torch, sentence_transformers",
+        "before = rss_mb()",
+        code,
+        "print(before, rss_mb())",
+    ])
+    out = subprocess.run([sys.executable, "-c", script], cwd=ROOT, capture_output=True, text=True, check=True)
+    before, after = out.stdout.strip().splitlines()[-1].split()
+    return float(before), float(after)
+
+
+def main():
+    print(f"{'scenario':<28} | {'baseline MB':>11} | {'after MB':>9} | {'models MB':>9}")
+    print("-" * 66)
+    results = {}
+    for name, code in SCENARIOS.items():
+        before, after = run(code)
+        results[name] = after - before
+        print(f"{name:<28} | {before:>11.1f} | {after:>9.1f} | {after - before:>9.1f}")
+    old, new = results.values()
+    print(f"\nSaved per worker: {old - new:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+EMBEDDING QUANTIZATION BENCHMARK
+Memory, scoring throughput and ranking agreement of compressed job embeddings
+(float16, int8 with per-vector scale, optionally after PCA) against the
+float32 matrix.
+
+Embeddings are synthetic 384-dim vectors (the MiniLM size) with a decaying
+spectrum and topical clusters, so PCA behaves roughly as it does on real
+sentence embeddings. Ranking agreement is Kendall's tau over all job scores
+and recall@10 of the float32 top 10.
+
+Run from the hybrid_roadmap directory:
+    python benchmarks/bench_quantization.py [--jobs 100000] [--queries 50]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+from scipy.stats import kendalltau
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from modules.recommender.quantization import CompressedEmbeddings
+
+DIM = 384
+
+CONFIGS = [
+    ("float32", None),
+    ("float16", None),
+    ("int8", None),
+    ("float32", 128),
+    ("int8", 128),
+    ("int8", 64),
+]
+
+
+def make_sampler(rng: np.random.Generator):
+    spectrum = 0.9 ** np.arange(DIM)
+    basis = np.linalg.qr(rng.normal(size=(DIM, DIM)))[0].astype(np.float32)
+    centers = rng.normal(size=(300, DIM)) * spectrum
+
+    def sample(n: int) -> np.ndarray:
+        out = np.empty((n, DIM), dtype=np.float32)
+        for start in range(0, n, 50_000):
+            count = min(n, start + 50_000) - start
+            latent = centers[rng.integers(len(centers), size=count)] + 0.7 * rng.normal(size=(count, DIM)) * spectrum
+            out[start:start + count] = latent.astype(np.float32) @ basis
+        return out
+
+    return sample
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--jobs", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=50)
+    args = parser.parse_args()
+
+    sample = make_sampler(np.random.default_rng(0))
+    vectors = sample(args.jobs)
+    queries = sample(args.queries)
+    exact = CompressedEmbeddings(vectors, "float32", None)
+    exact_scores = [exact.scores(q) for q in queries]
+    exact_top = [set(np.argsort(-s)[:10]) for s in exact_scores]
+
+    print(f"{args.jobs:,} jobs x {DIM} dims, {args.queries} queries\n")
+    print(f"{'form':<14} | {'MB':>7} | {'saved':>6} | {'build s':>7} | {'queries/s':>9} | {'tau':>6} | {'recall@10':>9}")
+    print("-" * 78)
+    base_mb = base_qps = None
+    for dtype, pca_dim in CONFIGS:
+        start = time.perf_counter()
+        compressed = CompressedEmbeddings(vectors, dtype, pca_dim)
+        build_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        scores = [compressed.scores(q) for q in queries]
+        qps = len(queries) / (time.perf_counter() - start)
+
+        tau = np.mean([kendalltau(e, s)[0] for e, s in zip(exact_scores[:10], scores[:10])])
+        recall = np.mean([len(t & set(np.argsort(-s)[:10])) / 10 for t, s in zip(exact_top, scores)])
+        mb = compressed.nbytes / 2**20
+        base_mb = base_mb or mb
+        base_qps = base_qps or qps
+        label = dtype + (f" pca{pca_dim}" if pca_dim else "")
+        print(f"{label:<14} | {mb:>7.1f} | {1 - mb / base_mb:>5.0%} | {build_s:>7.2f} | "
+              f"{qps:>9.1f} | {tau:>6.3f} | {recall:>9.3f}")
+    print(f"\n(throughput relative to float32 = queries/s / {base_qps:.1f})")
+
+
+if __name__ == "__main__":
+    main()
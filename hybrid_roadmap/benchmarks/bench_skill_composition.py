@@ -0,0 +1,85 @@
+"""
+SKILL COMPOSITION BENCHMARK
+Compares the semantic score of match_resume_jd_semantic when both skill lists
+are encoded as joined strings by the transformer ("joined") with the score
+built from cached per-skill vectors ("composed").
+
+Reports, over random resumes against the sample job descriptions:
+- Pearson correlation and mean absolute difference of the semantic scores
+- how often both modes rank the same job first for a resume, and the mean
+  Spearman correlation of each resume's job ranking
+- per-pair latency of each mode once the caches are warm
+
+Run from the hybrid_roadmap directory:
+    python benchmarks/bench_skill_composition.py [--resumes N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from modules.parsing.jd_parser import parse_jd
+from modules.parsing.taxonomy import get_taxonomy
+from modules.recommender.jd_reume import _semantic_score
+from modules.recommender.job_semantic import load_sample_jobs
+from modules.recommender.skill_embeddings import get_skill_embeddings
+
+
+def ranks(values: np.ndarray) -> np.ndarray:
+    return np.argsort(np.argsort(values)).astype(float)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    taxonomy = get_taxonomy("data/skills.csv")
+    jobs = [parse_jd(job["description"], "data/skills.csv") for job in load_sample_jobs()]
+    jobs = [weights for weights in jobs if weights]
+    resumes = [rng.sample(taxonomy.skills, rng.randint(5, 25)) for _ in range(args.resumes)]
+
+    # Warm both paths so latency excludes model load and taxonomy preload
+    get_skill_embeddings().vectors(taxonomy.skills)
+    _semantic_score(resumes[0], list(jobs[0]), jobs[0], "joined")
+
+    scores = {}
+    seconds = {}
+    for mode in ("joined", "composed"):
+        start = time.perf_counter()
+        scores[mode] = np.array([
+            [_semantic_score(resume, list(weights), weights, mode) for weights in jobs]
+            for resume in resumes
+        ])
+        seconds[mode] = time.perf_counter() - start
+
+    joined, composed = scores["joined"], scores["composed"]
+    pearson = float(np.corrcoef(joined.ravel(), composed.ravel())[0, 1])
+    mae = float(np.abs(joined - composed).mean())
+    same_top = float(np.mean(joined.argmax(axis=1) == composed.argmax(axis=1)))
+    spearman = float(np.mean([
+        np.corrcoef(ranks(j), ranks(c))[0, 1] for j, c in zip(joined, composed)
+    ])) if len(jobs) > 1 else float("nan")
+
+    pairs = len(resumes) * len(jobs)
+    print(f"{len(resumes)} resumes x {len(jobs)} jobs = {pairs} pairs\n")
+    print(f"{'mode':<10} | {'ms / pair':>9} | {'mean score':>10}")
+    print("-" * 36)
+    for mode in ("joined", "composed"):
+        print(f"{mode:<10} | {seconds[mode] / pairs * 1000:>9.3f} | {scores[mode].mean():>10.4f}")
+    print(f"\nspeedup           : {seconds['joined'] / seconds['composed']:.1f}x")
+    print(f"pearson r         : {pearson:.4f}")
+    print(f"mean |difference| : {mae:.4f}")
+    print(f"same top job      : {same_top:.1%}")
+    print(f"mean spearman rho : {spearman:.4f}")
+
+
+if __name__ == "__main__":
+    main()
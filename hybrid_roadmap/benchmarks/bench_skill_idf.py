@@ -0,0 +1,100 @@
+"""
+SKILL IDF PARITY REPORT
+Compares the TF-IDF signal of match_resume_jd_semantic before and after
+global IDF. The old signal fitted a TfidfVectorizer on each resume/JD pair.
+The new one uses IDF precomputed from the job catalog and the skill
+taxonomy.
+
+Reports, over random resumes against the sample job descriptions:
+- per-pair latency of the TF-IDF signal in each version
+- how the TF-IDF and hybrid scores shift (the semantic and overlap parts are
+  unchanged, so the hybrid shifts by 0.35 x the TF-IDF shift)
+- how often both versions rank the same job first for a resume, and the mean
+  Spearman correlation of each resume's job ranking by hybrid score
+
+Run from the hybrid_roadmap directory (ENCODER_BACKEND=stub needs no model):
+    python benchmarks/bench_skill_idf.py [--resumes N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from modules.parsing.jd_parser import parse_jd
+from modules.parsing.taxonomy import get_taxonomy
+from modules.recommender.jd_reume import _build_overlap_score, _semantic_score
+from modules.recommender.job_semantic import load_sample_jobs
+from modules.recommender.skill_idf import get_skill_idf
+
+
+def _tfidf_per_pair(resume_text: str, jd_text: str) -> float:
+    """The previous TF-IDF signal: a vectorizer fitted on the two texts alone."""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    vectorizer = TfidfVectorizer()
+    tfidf_matrix = vectorizer.fit_transform([resume_text.lower(), jd_text.lower()])
+    return float(cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0])
+
+
+def ranks(values: np.ndarray) -> np.ndarray:
+    return np.argsort(np.argsort(values)).astype(float)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--resumes", type=int, default=50)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    taxonomy = get_taxonomy("data/skills.csv")
+    jobs = [parse_jd(job["description"], "data/skills.csv") for job in load_sample_jobs()]
+    jobs = [weights for weights in jobs if weights]
+    resumes = [rng.sample(taxonomy.skills, rng.randint(5, 25)) for _ in range(args.resumes)]
+    pairs = [(resume, weights) for resume in resumes for weights in jobs]
+
+    idf = get_skill_idf()
+    idf.similarity("warmup", "warmup")
+    _tfidf_per_pair("warmup", "warmup")
+
+    scores = {}
+    seconds = {}
+    for name, fn in (("per-pair fit", _tfidf_per_pair), ("global idf", idf.similarity)):
+        start = time.perf_counter()
+        scores[name] = np.array([fn(" ".join(resume), " ".join(weights)) for resume, weights in pairs])
+        seconds[name] = time.perf_counter() - start
+
+    rest = np.array([
+        0.45 * _semantic_score(resume, list(weights), weights, "composed")
+        + 0.20 * _build_overlap_score({s.lower() for s in resume}, {s.lower() for s in weights}, weights)
+        for resume, weights in pairs
+    ])
+    hybrid = {name: (rest + 0.35 * values).reshape(len(resumes), len(jobs)) for name, values in scores.items()}
+    old, new = hybrid["per-pair fit"], hybrid["global idf"]
+    tfidf_shift = scores["global idf"] - scores["per-pair fit"]
+    hybrid_shift = np.abs(new - old).ravel()
+
+    print(f"{len(resumes)} resumes x {len(jobs)} jobs = {len(pairs)} pairs\n")
+    print(f"{'tf-idf signal':<13} | {'ms / pair':>9} | {'mean tf-idf':>11} | {'mean hybrid':>11}")
+    print("-" * 54)
+    for name in scores:
+        print(f"{name:<13} | {seconds[name] / len(pairs) * 1000:>9.3f} | "
+              f"{scores[name].mean():>11.4f} | {hybrid[name].mean():>11.4f}")
+    print(f"\nspeedup                 : {seconds['per-pair fit'] / seconds['global idf']:.0f}x")
+    print(f"mean tf-idf shift       : {tfidf_shift.mean():+.4f}")
+    print(f"hybrid |shift| mean/p95 : {hybrid_shift.mean():.4f} / {np.percentile(hybrid_shift, 95):.4f}"
+          f"  (max {hybrid_shift.max():.4f})")
+    print(f"pairs shifted > 0.02    : {np.mean(hybrid_shift > 0.02):.1%}")
+    print(f"same top job            : {np.mean(old.argmax(axis=1) == new.argmax(axis=1)):.1%}")
+    spearman = np.mean([np.corrcoef(ranks(o), ranks(n))[0, 1] for o, n in zip(old, new)])
+    print(f"mean spearman           : {spearman:.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+SKILL MATCHER BENCHMARK
+Compares the compiled single-pass matcher with the original per-skill regex
+loop at 300, 5k and 50k skills.
+
+Run from the hybrid_roadmap directory:
+    python benchmarks/bench_skill_matcher.py
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from modules.parsing.taxonomy import get_taxonomy
+from modules.parsing.skill_extractor import _extract_skills_regex
+from modules.parsing.skill_matcher import SkillMatcher
+
+SIZES = [300, 5_000, 50_000]
+SYLLABLES = ["ka", "lo", "mi", "ne", "ro", "ta", "vu", "zi", "qua", "dex", "ion", "sys"]
+
+
+def synthetic_taxonomy(base: list[str], size: int, rng: random.Random) -> list[str]:
+    """Pad the real taxonomy with pseudo skill names up to ``size`` entries."""
+    skills = list(base)
+    seen = {s.lower() for s in skills}
+    while len(skills) < size:
+        words = ["".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+                 for _ in range(rng.randint(1, 3))]
+        name = rng.choice([" ", "-", "."]).join(words)
+        if name not in seen:
+            seen.add(name)
+            skills.append(name)
+    return skills[:size]
+
+
+def sample_document(skills: list[str], rng: random.Random, words: int = 600) -> str:
+    filler = ["experience", "with", "team", "built", "projects", "using", "and", "the", "of", "in"]
+    parts = []
+    for _ in range(words):
+        parts.append(rng.choice(skills) if rng.random() < 0.1 else rng.choice(filler))
+    return ", ".join(parts)
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    rng = random.Random(42)
+    base = get_taxonomy("data/skills.csv").skills
+
+    print(f"{'skills':>8} | {'build ms':>9} | {'matcher ms':>10} | {'regex ms':>10} | {'speedup':>8}")
+    print("-" * 58)
+    for size in SIZES:
+        skills = synthetic_taxonomy(base, size, rng)
+        text = sample_document(skills, rng)
+
+        start = time.perf_counter()
+        matcher = SkillMatcher(skills)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        assert matcher.extract(text) == _extract_skills_regex(text, skills)
+
+        matcher_ms = timed(lambda: matcher.extract(text), repeat=20) * 1000
+        regex_ms = timed(lambda: _extract_skills_regex(text, skills), repeat=3 if size < 50_000 else 1) * 1000
+        print(f"{size:>8} | {build_ms:>9.1f} | {matcher_ms:>10.2f} | {regex_ms:>10.1f} | {regex_ms / matcher_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
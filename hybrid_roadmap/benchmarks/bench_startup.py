@@ -0,0 +1,76 @@
+"""
+STARTUP TIME BENCHMARK
+Measures how long it takes to import the Flask app and each service module in
+a fresh interpreter, and which heavy libraries each import drags in.
+
+Run from the hybrid_roadmap directory:
+    python benchmarks/bench_startup.py [--repeat N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+MODULES = [
+    "api",
+    "routes.roadmap_routes",
+    "routes.personalized_roadmap_routes",
+    "modules.parsing.jd_parser",
+    "modules.parsing.resume_parser",
+    "modules.recommender.jd_reume",
+    "modules.recommender.job_semantic",
+    "modules.recommender.job_tfidf",
+    "modules.recommender.hybrid_matcher",
+]
+
+HEAVY = ["torch", "sentence_transformers", "sklearn", "scipy", "google.genai"]
+
+PROBE = """
+import sys, time
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+loaded = [m for m in {heavy!r} if m in sys.modules]
+print(elapsed, ",".join(loaded))
+"""
+
+
+def measure(module: str, repeat: int) -> tuple[float, str]:
+    times = []
+    loaded = ""
+    for _ in range(repeat):
+        out = subprocess.run(
+            [sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY)],
+            cwd=ROOT, capture_output=True, text=True,
+        )
+        if out.returncode != 0:
+            return float("nan"), "import failed: " + out.stderr.strip().splitlines()[-1]
+        elapsed, loaded = out.stdout.strip().splitlines()[-1].partition(" ")[::2]
+        times.append(float(elapsed))
+    return statistics.median(times), loaded or "-"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'module':<38} | {'import ms':>9} | heavy libraries loaded")
+    print("-" * 80)
+    for module in MODULES:
+        seconds, loaded = measure(module, args.repeat)
+        print(f"{module:<38} | {seconds * 1000:>9.0f} | {loaded}")
+
+    # For reference: what the deferred imports cost when they do happen
+    print()
+    for lib in HEAVY:
+        seconds, _ = measure(lib, args.repeat)
+        print(f"{'(deferred) ' + lib:<38} | {seconds * 1000:>9.0f} |")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+STREAMING RESPONSE BENCHMARK
+Compares the buffered JSON and streamed NDJSON forms of /match-skills-batch
+and /match-matrix. The routes are driven through the Flask test client, and
+the client discards each chunk as it arrives. Reports the time to the first
+result, the total time, and the peak memory traced during the request.
+
+Run from the hybrid_roadmap directory (ENCODER_BACKEND=stub needs no model):
+    python benchmarks/bench_streaming.py [--students 5000] [--jobs 500]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from api import app
+from modules.parsing.taxonomy import get_taxonomy
+from modules.recommender import jd_reume
+
+
+def measure(client, route: str, body: dict) -> tuple[float, float, float]:
+    """(ms to first chunk, total ms, peak MB) for one request."""
+    jd_reume._match_cache.clear()  # score every pair, not cached results
+    tracemalloc.start()
+    start = time.perf_counter()
+    response = client.post(route, json=body, buffered=False)
+    first = None
+    for _ in response.iter_encoded():
+        if first is None:
+            first = time.perf_counter()
+    end = time.perf_counter()
+    peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    response.close()
+    assert response.status_code == 200
+    return (first - start) * 1000, (end - start) * 1000, peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--students", type=int, default=5000)
+    parser.add_argument("--jobs", type=int, default=500)
+    args = parser.parse_args()
+
+    rng = random.Random(11)
+    skills = get_taxonomy("data/skills.csv").skills
+    students = [{"id": f"s{i}", "skills": rng.sample(skills, rng.randint(3, 20))} for i in range(args.students)]
+    jobs = [{"id": f"j{i}", "skills": rng.sample(skills, rng.randint(3, 15))} for i in range(args.jobs)]
+
+    client = app.test_client()
+    requests = [
+        ("/match-skills-batch", {"jd_skills": jobs[0]["skills"], "students": students}),
+        ("/match-matrix", {"students": students, "jobs": jobs, "top_k": 5}),
+    ]
+    client.post(requests[0][0], json={**requests[0][1], "students": students[:10]})
+
+    print(f"{args.students:,} students, {args.jobs:,} jobs\n")
+    print(f"{'route':<19} | {'response':<8} | {'first result ms':>15} | {'total ms':>9} | {'peak MB':>8}")
+    print("-" * 72)
+    for route, body in requests:
+        for name, stream in (("buffered", False), ("ndjson", True)):
+            first, total, peak = measure(client, route, {**body, "stream": stream})
+            print(f"{route:<19} | {name:<8} | {first:>15.1f} | {total:>9.1f} | {peak:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
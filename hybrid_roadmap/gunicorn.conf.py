@@ -0,0 +1,10 @@
+# Picked up automatically by `gunicorn api:app` (see Procfile).
+import os
+
+
+def post_worker_init(worker):
+    # Load the taxonomy and embedding model before the worker takes requests,
+    # so the first real request does not pay for it. WARMUP_ON_START=0 skips it.
+    if os.environ.get("WARMUP_ON_START", "1") != "0":
+        from api import warmup
+        warmup()
@@ -1,6 +1,12 @@
-import csv
+import hashlib
+import os
 import re
+from bisect import bisect_left, bisect_right
+
 from .skill_extractor import extract_skills
+from .skill_matcher import SkillMatcher, get_matcher
+from .taxonomy import get_taxonomy
+from modules.utils.cache import LRUCache
 
 SECTION_PATTERNS = [
     (3, r"(technical skills|skills & technologies|skills and technologies|tech stack|technology stack|core competencies|competencies)(.*?)(?=(experience|education|projects|certifications|about|responsibilities|qualifications|requirements|$))"),
@@ -13,17 +19,55 @@ CONTEXT_PATTERNS = [
     (2, r"(experience in|expertise in|skilled in|skill in)([\s\S]{0,200})"),
 ]
 
+# The same rules as plain phrase lists, used by the single-pass segmenter.
+# Headers are listed in the order the regex alternations try them; for the
+# patterns above, ``min(?:imum)?`` expands to both spellings.
+SECTION_RULES = [
+    ("skills", 3,
+     ["technical skills", "skills & technologies", "skills and technologies", "tech stack",
+      "technology stack", "core competencies", "competencies"],
+     ["experience", "education", "projects", "certifications", "about", "responsibilities",
+      "qualifications", "requirements"]),
+    ("must_have", 3,
+     ["must have", "required", "essential", "mandatory", "minimum qualifications",
+      "min qualifications", "minimum requirements", "min requirements", "required qualifications"],
+     ["good to have", "preferred", "nice to have", "optional", "responsibilities", "qualifications"]),
+    ("nice_to_have", 2,
+     ["good to have", "preferred", "nice to have", "optional", "nice-to-have", "desired skills"],
+     ["must have", "required", "essential", "mandatory", "responsibilities", "qualifications"]),
+]
 
-def _load_skills(skills_csv_path: str) -> list[str]:
-    skills = []
-    with open(skills_csv_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.reader(csvfile)
-        next(reader, None)
-        for row in reader:
-            if not row or not row[0].strip():
-                continue
-            skills.append(row[0].strip())
-    return skills
+CONTEXT_RULES = [
+    ("context", 2,
+     ["experience with", "proficiency in", "knowledge of", "familiarity with", "working knowledge of",
+      "hands-on experience with", "strong experience in", "solid experience with"]),
+    ("context", 2,
+     ["experience in", "expertise in", "skilled in", "skill in"]),
+]
+CONTEXT_WINDOW = 200
+
+_PHRASES = sorted({p for _, _, headers, stops in SECTION_RULES for p in headers + stops}
+                  | {p for _, _, headers in CONTEXT_RULES for p in headers},
+                  key=len, reverse=True)
+# Zero-width search: reports every position where a phrase starts, with the
+# longest phrase there. Any shorter phrase at the same position is a prefix of it.
+_PHRASE_SCAN = re.compile("(?=(" + "|".join(re.escape(p) for p in _PHRASES) + "))")
+_PREFIXES = {p: [q for q in _PHRASES if p.startswith(q)] for p in _PHRASES}
+# Lower-cased characters that re.IGNORECASE still treats as ASCII letters.
+# Folding them keeps the case-sensitive scan equivalent to the original patterns.
+_CASE_FOLD = str.maketrans({"\u0131": "i", "\u017f": "s"})
+
+# Parsed JDs keyed by normalized JD text + taxonomy version. Entries expire
+# after JD_CACHE_TTL seconds; size is bounded by count and approximate bytes.
+_jd_cache = LRUCache(
+    max_entries=int(os.environ.get("JD_CACHE_SIZE", 2048)),
+    max_bytes=int(os.environ.get("JD_CACHE_MAX_BYTES", 16 * 1024 * 1024)),
+    ttl=float(os.environ.get("JD_CACHE_TTL", 6 * 60 * 60)),
+    sizeof=lambda key, weights: len(key) + sum(len(skill) + 16 for skill in weights),
+)
+
+_NON_SKILL_CHARS = re.compile(r'[^a-z0-9+#./\-\s]')
+_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
 
 
 def _normalize_text(text: str) -> str:
@@ -34,7 +78,62 @@ def _find_section_text(text: str, pattern: str) -> list[str]:
     return [match.group(2) for match in re.finditer(pattern, text, flags=re.IGNORECASE | re.DOTALL)]
 
 
-def weight_jd_skills(jd_text: str, all_skills: list[str]) -> dict[str, int]:
+def segment_jd(text: str) -> list[tuple[str, int, list[tuple[int, int]]]]:
+    """
+    Split normalized JD text into typed sections in one scan.
+
+    Returns ``(kind, weight, spans)`` for every section and context rule, in
+    rule order, where ``spans`` are sorted, non-overlapping ``(start, end)``
+    offsets into ``text``. The spans are exactly the ``group(2)`` ranges the
+    ``SECTION_PATTERNS`` / ``CONTEXT_PATTERNS`` regexes would produce.
+    """
+    n = len(text)
+    starts: dict[str, list[int]] = {}
+    for match in _PHRASE_SCAN.finditer(text.translate(_CASE_FOLD)):
+        pos = match.start()
+        for phrase in _PREFIXES[match.group(1)]:
+            starts.setdefault(phrase, []).append(pos)
+
+    def header_hits(headers):
+        # Leftmost position wins; at one position the first header in order wins.
+        best: dict[int, int] = {}
+        for header in reversed(headers):
+            for pos in starts.get(header, ()):
+                best[pos] = len(header)
+        positions = sorted(best)
+        return positions, [pos + best[pos] for pos in positions]
+
+    segments = []
+    for kind, weight, headers, stops in SECTION_RULES:
+        positions, header_ends = header_hits(headers)
+        stop_positions = sorted(pos for stop in stops for pos in starts.get(stop, ()))
+        spans = []
+        idx = 0
+        while idx < len(positions):
+            begin = header_ends[idx]
+            k = bisect_left(stop_positions, begin)
+            end = stop_positions[k] if k < len(stop_positions) else n
+            spans.append((begin, end))
+            idx = bisect_left(positions, end, idx + 1)
+        segments.append((kind, weight, spans))
+
+    for kind, weight, headers in CONTEXT_RULES:
+        positions, header_ends = header_hits(headers)
+        spans = []
+        idx = 0
+        while idx < len(positions):
+            begin = header_ends[idx]
+            end = min(begin + CONTEXT_WINDOW, n)
+            spans.append((begin, end))
+            idx = bisect_left(positions, end, idx + 1)
+        segments.append((kind, weight, spans))
+
+    return segments
+
+
+def _weight_jd_skills_regex(jd_text: str, all_skills: list[str] | SkillMatcher) -> dict[str, int]:
+    # Original implementation (one regex pass and one extraction per section),
+    # kept as the reference for parity tests and benchmarks.
     t = _normalize_text(jd_text)
     weights: dict[str, int] = {}
 
@@ -58,6 +157,71 @@ def weight_jd_skills(jd_text: str, all_skills: list[str]) -> dict[str, int]:
     return dict(sorted(weights.items(), key=lambda item: (-item[1], item[0])))
 
 
+def weight_jd_skills(jd_text: str, all_skills: list[str] | SkillMatcher) -> dict[str, int]:
+    """
+    Weight each skill in the JD by the strongest section it appears in:
+    skills / must-have sections 3, nice-to-have sections and context phrases 2,
+    anywhere else 1.
+
+    The JD is segmented once and scanned for skills once; each match is mapped
+    to its sections by offset. A section counts a skill exactly when
+    extracting skills from that section's text alone would find it.
+    """
+    t = _normalize_text(jd_text)
+    matcher = get_matcher(all_skills)
+    segments = segment_jd(t)
+
+    # Same character filter as skill extraction, but without collapsing
+    # whitespace so offsets line up with the segment spans.
+    clean = _NON_SKILL_CHARS.sub(' ', t)
+    n = len(clean)
+
+    cuts = set()
+    rules = []
+    for _, weight, spans in segments:
+        if spans:
+            for begin, end in spans:
+                cuts.add(begin)
+                cuts.add(end)
+            rules.append((weight, [begin for begin, _ in spans], spans))
+
+    weights: dict[str, int] = {}
+    for start, end, skills in matcher.scan(clean, cuts):
+        left_ok = start == 0 or clean[start - 1] not in _WORD_CHARS
+        right_ok = end == n or clean[end] not in _WORD_CHARS
+        best = 1 if left_ok and right_ok else 0
+
+        for weight, begins, spans in rules:
+            if weight <= best:
+                continue
+            idx = bisect_right(begins, start) - 1
+            if idx < 0:
+                continue
+            begin, stop = spans[idx]
+            if end <= stop and (left_ok or start == begin) and (right_ok or end == stop):
+                best = weight
+
+        if best:
+            for skill in skills:
+                if best > weights.get(skill, 0):
+                    weights[skill] = best
+
+    return dict(sorted(weights.items(), key=lambda item: (-item[1], item[0])))
+
+
 def parse_jd(jd_text: str, skills_csv_path: str) -> dict[str, int]:
-    all_skills = _load_skills(skills_csv_path)
-    return weight_jd_skills(jd_text, all_skills)
+    taxonomy = get_taxonomy(skills_csv_path)
+    # Weights only depend on the normalized text, so it is a safe cache key
+    digest = hashlib.sha256(_normalize_text(jd_text).encode("utf-8")).hexdigest()
+    key = f"{digest}:{taxonomy.version}"
+
+    cached = _jd_cache.get(key)
+    if cached is None:
+        cached = weight_jd_skills(jd_text, taxonomy.matcher)
+        _jd_cache.put(key, cached)
+    return dict(cached)
+
+
+def jd_cache_stats() -> dict:
+    """Hit/miss counters for the parsed-JD cache."""
+    return _jd_cache.stats()
@@ -1,46 +1,89 @@
-import csv
+import hashlib
+import io
+import os
 import PyPDF2
 from docx import Document
 from modules.parsing.skill_extractor import extract_skills
+from modules.parsing.taxonomy import get_taxonomy
+from modules.utils.cache import LRUCache, SQLiteCache, TieredCache
 
-def _load_skills(skills_csv_path: str) -> list[str]:
-    skills = []
-    with open(skills_csv_path, newline='', encoding='utf-8') as csvfile:
-        reader = csv.reader(csvfile)
-        next(reader, None)
-        for row in reader:
-            if not row or not row[0].strip():
-                continue
-            skills.append(row[0].strip())
-    return skills
+# Parsed resumes keyed by file content + taxonomy version. Set RESUME_CACHE_DB
+# to a file path to keep results across worker restarts.
+_resume_cache = TieredCache(
+    LRUCache(int(os.environ.get("RESUME_CACHE_SIZE", 512))),
+    SQLiteCache(os.environ["RESUME_CACHE_DB"], table="resume_skills") if os.environ.get("RESUME_CACHE_DB") else None,
+)
 
-def _extract_text_from_docx(path: str) -> str:
-    doc = Document(path)
+def _extract_text_from_docx(source) -> str:
+    doc = Document(source)
     return ' '.join(p.text for p in doc.paragraphs)
 
-def _extract_text_from_pdf(path: str) -> str:
+def _extract_text_from_pdf(source) -> str:
     text = ''
-    with open(path, 'rb') as f:
-        reader = PyPDF2.PdfReader(f)
-        for page in reader.pages:
-            text += page.extract_text() or ''
+    if isinstance(source, str):
+        with open(source, 'rb') as f:
+            return _extract_text_from_pdf(f)
+    reader = PyPDF2.PdfReader(source)
+    for page in reader.pages:
+        text += page.extract_text() or ''
     return text
 
-def parse_resume(file_path: str, skills_csv_path: str) -> list[str]:
+def _detect_format(name: str | None, head: bytes) -> str:
+    if name:
+        # A filename must carry a supported extension, whatever the content
+        lower = name.lower()
+        if lower.endswith('.pdf'):
+            return 'pdf'
+        if lower.endswith('.docx'):
+            return 'docx'
+        raise ValueError('Unsupported resume format. Use .pdf or .docx')
+    # No filename (bytes / stream input): fall back to the file signature
+    if head.startswith(b'%PDF'):
+        return 'pdf'
+    if head.startswith(b'PK\x03\x04'):
+        return 'docx'
+    raise ValueError('Unsupported resume format. Use .pdf or .docx')
+
+def parse_resume(resume, skills_csv_path: str, filename: str | None = None) -> list[str]:
     """
     Parses a resume and extracts only valid skills found in the skills CSV taxonomy.
     This prevents junk data, random noun phrases, and non-skills from polluting the system.
+
+    ``resume`` may be a file path, the raw file bytes, or a binary file-like
+    object. For bytes and streams pass the original ``filename``: as for paths,
+    its extension decides the format. Without one the format is detected from
+    the content.
+
+    Results are cached under a hash of the file bytes and the taxonomy
+    version, so re-uploading the same file skips text extraction entirely.
     """
-    all_skills = _load_skills(skills_csv_path)
-    
-    if file_path.lower().endswith('.pdf'):
-        text = _extract_text_from_pdf(file_path)
-    elif file_path.lower().endswith('.docx'):
-        text = _extract_text_from_docx(file_path)
+    taxonomy = get_taxonomy(skills_csv_path)
+
+    if isinstance(resume, str):
+        # Paths must carry a supported extension
+        fmt = _detect_format(resume, b'')
+        with open(resume, 'rb') as f:
+            data = f.read()
     else:
-        raise ValueError('Unsupported resume format. Use .pdf or .docx')
-        
+        data = bytes(resume) if isinstance(resume, (bytes, bytearray)) else resume.read()
+        fmt = _detect_format(filename, data[:4])
+
+    key = f"{hashlib.sha256(data).hexdigest()}:{fmt}:{taxonomy.version}"
+    cached = _resume_cache.get(key)
+    if cached is not None:
+        return list(cached)
+
+    if fmt == 'pdf':
+        text = _extract_text_from_pdf(io.BytesIO(data))
+    else:
+        text = _extract_text_from_docx(io.BytesIO(data))
+
     # Strictly extract only verified skills from our taxonomy list
-    skills = extract_skills(text, all_skills)
-    
+    skills = extract_skills(text, taxonomy.matcher)
+
+    _resume_cache.put(key, tuple(skills))
     return skills
+
+def resume_cache_stats() -> dict:
+    """Hit/miss counters for the parsed-resume cache."""
+    return _resume_cache.stats()
@@ -1,4 +1,15 @@
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+
+from .skill_matcher import SkillMatcher, get_matcher
+
+# Batches smaller than this are matched in-process; forking workers costs more
+# than it saves for a handful of documents.
+PARALLEL_MIN_TEXTS = 256
+DEFAULT_CHUNK_SIZE = 64
+
+_worker_matcher: SkillMatcher | None = None
 
 
 def _skill_pattern(skill: str) -> str:
@@ -8,7 +19,9 @@ def _skill_pattern(skill: str) -> str:
     return escaped
 
 
-def extract_skills(text: str, skill_list: list[str]) -> list[str]:
+def _extract_skills_regex(text: str, skill_list: list[str]) -> list[str]:
+    # Original per-skill regex loop, kept as the reference for parity tests
+    # and benchmarks of the compiled matcher.
     text_l = text.lower()
     clean = re.sub(r'[^a-z0-9+#./\-\s]', ' ', text_l)
     clean = re.sub(r'\s+', ' ', clean)
@@ -21,3 +34,52 @@ def extract_skills(text: str, skill_list: list[str]) -> list[str]:
         if re.search(pattern, clean):
             found.add(skill)
     return sorted(list(found))
+
+
+def extract_skills(text: str, skill_list: list[str] | SkillMatcher) -> list[str]:
+    """Return the sorted skills from ``skill_list`` that appear in ``text``."""
+    return get_matcher(skill_list).extract(text)
+
+
+def _init_worker(skills: list[str]) -> None:
+    global _worker_matcher
+    _worker_matcher = SkillMatcher(skills)
+
+
+def _extract_chunk(texts: list[str]) -> list[list[str]]:
+    return [_worker_matcher.extract(text) for text in texts]
+
+
+def extract_skills_many(
+    texts: list[str],
+    skill_list: list[str] | SkillMatcher,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_workers: int | None = None,
+    parallel_min_texts: int = PARALLEL_MIN_TEXTS,
+) -> list[list[str]]:
+    """
+    Extract skills from many documents, returning one result per text in input order.
+
+    All texts share one compiled matcher. Batches of at least
+    ``parallel_min_texts`` documents are split into chunks of ``chunk_size``
+    and spread over a process pool (``max_workers`` defaults to the CPU
+    count); each worker compiles the matcher once. The output is identical to
+    calling ``extract_skills`` on each text.
+    """
+    texts = list(texts)
+    matcher = get_matcher(skill_list)
+    workers = max_workers or os.cpu_count() or 1
+
+    if len(texts) < parallel_min_texts or workers < 2:
+        return [matcher.extract(text) for text in texts]
+
+    chunk_size = max(1, chunk_size)
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    workers = min(workers, len(chunks))
+
+    results: list[list[str]] = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(matcher.skills,)) as pool:
+        for chunk_result in pool.map(_extract_chunk, chunks):
+            results.extend(chunk_result)
+    return results
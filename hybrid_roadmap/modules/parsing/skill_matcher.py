@@ -0,0 +1,142 @@
+"""
+Compiled skill matcher.
+
+Builds a character trie over a skill taxonomy once and finds every skill in a
+single left-to-right scan of the text, instead of running one regex per skill.
+Matching follows the same rules as the original per-skill patterns:
+
+- skills are matched case-insensitively against the cleaned text
+- a space inside a skill matches one or more spaces, hyphens or slashes
+- a match must not be preceded or followed by a word character
+"""
+
+import re
+from functools import lru_cache
+
+# Trie node keys. Children are keyed by single characters, so integer keys
+# can never collide with them.
+_END = 0    # tuple of original skill names ending at this node
+_SEP = 1    # child reached by a space in the skill (matches [\s\-/]+)
+_LOOP = 2   # set on separator nodes: further separators stay on this node
+
+_SEPARATORS = frozenset(" -/")
+_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+
+_DISALLOWED = re.compile(r'[^a-z0-9+#./\-\s]')
+_WHITESPACE = re.compile(r'\s+')
+
+
+def clean_text(text: str) -> str:
+    """Lower-case the text and keep only characters that can appear in a skill."""
+    clean = _DISALLOWED.sub(' ', text.lower())
+    return _WHITESPACE.sub(' ', clean)
+
+
+class SkillMatcher:
+    """
+    Matches a fixed list of skills against text in one pass.
+
+    Build it once per taxonomy and reuse it; construction is linear in the
+    total length of the skill names and each scan is linear in the text length
+    (times the depth of the longest partial match).
+    """
+
+    def __init__(self, skill_list: list[str]):
+        self.skills = list(skill_list)
+        self._root: dict = {}
+        for skill in self.skills:
+            s = skill.lower().strip()
+            if s:
+                self._insert(s, skill)
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def _insert(self, key: str, skill: str) -> None:
+        node = self._root
+        for ch in key:
+            if ch == ' ':
+                child = node.get(_SEP)
+                if child is None:
+                    child = node[_SEP] = {_LOOP: True}
+            else:
+                child = node.get(ch)
+                if child is None:
+                    child = node[ch] = {}
+            node = child
+        ends = node.get(_END, ())
+        if skill not in ends:
+            node[_END] = ends + (skill,)
+
+    def scan(self, clean: str, cuts=()):
+        """
+        Yield ``(start, end, skills)`` for every skill occurrence in ``clean``.
+
+        ``clean`` must already be cleaned (see ``clean_text``); whitespace does
+        not need to be collapsed. Positions listed in ``cuts`` are treated as
+        word boundaries, which lets callers match inside slices of the text
+        without copying them.
+        """
+        root = self._root
+        n = len(clean)
+        word = _WORD_CHARS
+        seps = _SEPARATORS
+
+        for i, ch in enumerate(clean):
+            node = root.get(ch)
+            if node is None:
+                continue
+            if i and clean[i - 1] in word and i not in cuts:
+                continue
+
+            states = [node]
+            j = i
+            while states:
+                end = j + 1
+                for state in states:
+                    skills = state.get(_END)
+                    if skills and (end == n or clean[end] not in word or end in cuts):
+                        yield i, end, skills
+                if end == n:
+                    break
+                c = clean[end]
+                nxt = []
+                for state in states:
+                    child = state.get(c)
+                    if child is not None:
+                        nxt.append(child)
+                    if c in seps:
+                        sep = state.get(_SEP)
+                        if sep is not None:
+                            nxt.append(sep)
+                        if _LOOP in state:
+                            nxt.append(state)
+                if len(nxt) > 1:
+                    nxt = list({id(state): state for state in nxt}.values())
+                states = nxt
+                j = end
+
+    def extract(self, text: str) -> list[str]:
+        """Return the sorted list of skills that occur anywhere in ``text``."""
+        found = set()
+        for _, _, skills in self.scan(clean_text(text)):
+            found.update(skills)
+        return sorted(found)
+
+
+@lru_cache(maxsize=8)
+def _cached_matcher(skills: tuple) -> SkillMatcher:
+    return SkillMatcher(list(skills))
+
+
+def get_matcher(skill_list) -> SkillMatcher:
+    """
+    Return a compiled matcher for ``skill_list``, reusing one built earlier.
+
+    Matchers are cached by the skills the list holds, so a list changed
+    between calls gets a matcher for its new contents. Hot paths should pass
+    the taxonomy's own matcher (``SkillTaxonomy.matcher``) and skip the lookup.
+    """
+    if isinstance(skill_list, SkillMatcher):
+        return skill_list
+    return _cached_matcher(tuple(skill_list))
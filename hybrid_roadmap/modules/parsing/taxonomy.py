@@ -0,0 +1,101 @@
+"""
+Process-wide skill taxonomy registry.
+
+The skills CSV is read once per process and kept in memory together with its
+normalized forms, the category column and a compiled matcher. Every lookup
+checks the file's mtime and reloads it when it changes; the new taxonomy is
+built completely before it replaces the old one, so readers never see a
+half-loaded state.
+"""
+
+import csv
+import hashlib
+import io
+import os
+import threading
+
+from .skill_matcher import SkillMatcher
+
+
+class SkillTaxonomy:
+    """An immutable snapshot of one skills CSV."""
+
+    def __init__(self, path: str, content: bytes, mtime_ns: int):
+        self.path = path
+        self.mtime_ns = mtime_ns
+        self.size = len(content)
+        # Content digest, stable across processes and restarts, so it can be
+        # part of persistent cache keys.
+        self.version = hashlib.sha256(content).hexdigest()[:16]
+
+        self.skills: list[str] = []
+        self.categories: dict[str, str] = {}
+        reader = csv.reader(io.StringIO(content.decode("utf-8"), newline=""))
+        next(reader, None)
+        for row in reader:
+            if not row or not row[0].strip():
+                continue
+            skill = row[0].strip()
+            self.skills.append(skill)
+            if len(row) > 1 and skill not in self.categories:
+                self.categories[skill] = row[1].strip()
+
+        # lower-cased form -> first original spelling in the CSV
+        self.normalized: dict[str, str] = {}
+        for skill in self.skills:
+            self.normalized.setdefault(skill.lower(), skill)
+
+        self.matcher = SkillMatcher(self.skills)
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def canonical(self, skill: str) -> str | None:
+        """Return the taxonomy spelling of ``skill`` (case-insensitive), if any."""
+        return self.normalized.get(skill.lower().strip())
+
+    def category(self, skill: str) -> str:
+        canonical = self.canonical(skill)
+        return self.categories.get(canonical, "") if canonical else ""
+
+
+class TaxonomyRegistry:
+    """Caches one ``SkillTaxonomy`` per CSV path and reloads it on mtime change."""
+
+    def __init__(self):
+        self._taxonomies: dict[str, SkillTaxonomy] = {}
+        self._lock = threading.Lock()
+
+    def get(self, skills_csv_path: str) -> SkillTaxonomy:
+        path = os.path.abspath(skills_csv_path)
+        stat = os.stat(path)
+
+        current = self._taxonomies.get(path)
+        if current is not None and self._is_fresh(current, stat):
+            return current
+
+        with self._lock:
+            current = self._taxonomies.get(path)
+            if current is not None and self._is_fresh(current, stat):
+                return current
+            with open(path, "rb") as f:
+                content = f.read()
+            taxonomy = SkillTaxonomy(path, content, stat.st_mtime_ns)
+            self._taxonomies[path] = taxonomy
+            return taxonomy
+
+    def clear(self) -> None:
+        with self._lock:
+            self._taxonomies.clear()
+
+    @staticmethod
+    def _is_fresh(taxonomy: SkillTaxonomy, stat: os.stat_result) -> bool:
+        return taxonomy.mtime_ns == stat.st_mtime_ns and taxonomy.size == stat.st_size
+
+
+_registry = TaxonomyRegistry()
+
+
+def get_taxonomy(skills_csv_path: str) -> SkillTaxonomy:
+    """Return the current taxonomy for ``skills_csv_path``, reloading it if the file changed."""
+    return _registry.get(skills_csv_path)
@@ -0,0 +1,201 @@
+"""
+Nearest-neighbour search over job embeddings.
+
+All indexes rank by cosine similarity and share one interface,
+``search(query, k) -> (ids, scores)`` with the best match first:
+
+- ``exact``:   brute-force matrix product (the reference)
+- ``ivf``:     inverted-file index implemented here in NumPy. Spherical k-means
+               splits the catalog into ``nlist`` cells and a query scans the
+               ``nprobe`` nearest cells. More probes give higher recall and
+               slower queries
+- ``faiss``:   HNSW from faiss-cpu, if installed (``m``, ``ef_construction``,
+               ``ef_search``)
+- ``hnswlib``: HNSW from hnswlib, if installed (same parameters)
+
+The backend and its parameters come from ANN_BACKEND (default "exact") and
+ANN_PARAMS (a JSON object), e.g. ANN_BACKEND=ivf ANN_PARAMS='{"nprobe": 16}'.
+"""
+
+import importlib.util
+import json
+import os
+
+import numpy as np
+
+FAISS_AVAILABLE = importlib.util.find_spec("faiss") is not None
+HNSWLIB_AVAILABLE = importlib.util.find_spec("hnswlib") is not None
+
+DEFAULT_BACKEND = os.environ.get("ANN_BACKEND", "exact")
+DEFAULT_PARAMS = json.loads(os.environ.get("ANN_PARAMS", "{}"))
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    vectors = np.asarray(vectors, dtype=np.float32)
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+def top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Positions of the k highest scores, best first, ties in position order
+    (the same result as a stable descending sort cut to k, without sorting
+    everything).
+    """
+    n = len(scores)
+    if k >= n:
+        return np.argsort(-scores, kind="stable")
+    if k <= 0:
+        return np.zeros(0, dtype=np.int64)
+    kth = np.partition(scores, n - k)[n - k]
+    candidates = np.flatnonzero(scores >= kth)
+    return candidates[np.argsort(-scores[candidates], kind="stable")][:k]
+
+
+def _nearest(x: np.ndarray, centroids: np.ndarray, max_block: int = 1 << 24) -> np.ndarray:
+    """Index of the most similar centroid for each row, in bounded-memory blocks."""
+    if not len(x):
+        return np.zeros(0, dtype=np.int64)
+    rows = max(1, max_block // max(1, len(centroids)))
+    return np.concatenate([np.argmax(x[i:i + rows] @ centroids.T, axis=1) for i in range(0, len(x), rows)])
+
+
+class ExactIndex:
+    """Brute-force cosine search."""
+
+    def __init__(self, vectors: np.ndarray):
+        self._vectors = _normalize(vectors)
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def search(self, query: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        scores = self._vectors @ _normalize(query)
+        top = top_k(scores, k)
+        return top, scores[top]
+
+
+class IVFIndex:
+    """Inverted-file index: vectors grouped by nearest k-means centroid."""
+
+    def __init__(self, vectors: np.ndarray, nlist: int | None = None, nprobe: int = 8,
+                 n_iter: int = 10, seed: int = 0):
+        x = _normalize(vectors)
+        n = len(x)
+        self.nlist = max(1, min(n, nlist or int(4 * np.sqrt(n))))
+        self.nprobe = nprobe
+        rng = np.random.default_rng(seed)
+
+        # Train centroids on a sample; 64 points per cell is plenty for k-means
+        sample = x[rng.choice(n, min(n, self.nlist * 64), replace=False)] if n else x
+        centroids = sample[rng.choice(len(sample), self.nlist, replace=False)].copy() if n else x[:0]
+        for _ in range(n_iter if n else 0):
+            assign = _nearest(sample, centroids)
+            counts = np.bincount(assign, minlength=self.nlist)
+            empty = counts == 0
+            starts = np.cumsum(counts) - counts
+            sums = np.zeros_like(centroids)
+            sums[~empty] = np.add.reduceat(sample[np.argsort(assign, kind="stable")], starts[~empty], axis=0)
+            if empty.any():
+                # Re-seed empty cells with random sample points
+                sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+            centroids = _normalize(sums)
+        self._centroids = centroids
+
+        assign = _nearest(x, centroids)
+        # Cell c holds the job ids self._ids[offsets[c]:offsets[c + 1]]
+        order = np.argsort(assign, kind="stable")
+        self._ids = order
+        self._vectors = x
+        self._offsets = np.searchsorted(assign[order], np.arange(self.nlist + 1))
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def search(self, query: np.ndarray, k: int, nprobe: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+        q = _normalize(query)
+        nprobe = min(nprobe or self.nprobe, self.nlist)
+        cells = top_k(self._centroids @ q, nprobe)
+        ids = np.concatenate([self._ids[self._offsets[c]:self._offsets[c + 1]] for c in cells])
+        scores = self._vectors[ids] @ q
+        top = top_k(scores, k)
+        return ids[top], scores[top]
+
+
+class FaissHNSWIndex:
+    """HNSW graph from faiss-cpu over inner product of unit vectors."""
+
+    def __init__(self, vectors: np.ndarray, m: int = 32, ef_construction: int = 200, ef_search: int = 64):
+        import faiss
+
+        x = _normalize(vectors)
+        self.ef_search = ef_search
+        self._index = faiss.IndexHNSWFlat(x.shape[1], m, faiss.METRIC_INNER_PRODUCT)
+        self._index.hnsw.efConstruction = ef_construction
+        self._index.add(x)
+
+    def __len__(self) -> int:
+        return self._index.ntotal
+
+    def search(self, query: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        self._index.hnsw.efSearch = max(self.ef_search, k)
+        scores, ids = self._index.search(_normalize(query)[None, :], k)
+        found = ids[0] >= 0
+        return ids[0][found], scores[0][found]
+
+
+class HnswlibIndex:
+    """HNSW graph from hnswlib over inner product of unit vectors."""
+
+    def __init__(self, vectors: np.ndarray, m: int = 32, ef_construction: int = 200, ef_search: int = 64):
+        import hnswlib
+
+        x = _normalize(vectors)
+        self.ef_search = ef_search
+        self._index = hnswlib.Index(space="ip", dim=x.shape[1])
+        self._index.init_index(max_elements=max(1, len(x)), ef_construction=ef_construction, M=m)
+        if len(x):
+            self._index.add_items(x, np.arange(len(x)))
+
+    def __len__(self) -> int:
+        return self._index.get_current_count()
+
+    def search(self, query: np.ndarray, k: int) -> tuple[np.ndarray, np.ndarray]:
+        k = min(k, len(self))
+        # hnswlib needs ef >= k
+        self._index.set_ef(max(self.ef_search, k))
+        labels, distances = self._index.knn_query(_normalize(query)[None, :], k=k)
+        # "ip" distance is 1 - inner product
+        return labels[0].astype(np.int64), 1.0 - distances[0]
+
+
+ANN_BACKENDS = {
+    "exact": ExactIndex,
+    "ivf": IVFIndex,
+    "faiss": FaissHNSWIndex,
+    "hnswlib": HnswlibIndex,
+}
+
+_AVAILABLE = {"faiss": FAISS_AVAILABLE, "hnswlib": HNSWLIB_AVAILABLE}
+
+
+def build_ann_index(vectors: np.ndarray, backend: str | None = None, params: dict | None = None):
+    """
+    Build a nearest-neighbour index over ``vectors``.
+
+    Without ``backend`` the ANN_BACKEND / ANN_PARAMS settings are used. An
+    optional backend that is not installed falls back to the local IVF index
+    (keeping only the parameters IVF understands).
+    """
+    if backend is None:
+        backend = DEFAULT_BACKEND
+        params = DEFAULT_PARAMS if params is None else params
+    params = dict(params or {})
+    if backend not in ANN_BACKENDS:
+        raise ValueError(f"ANN backend must be one of {list(ANN_BACKENDS)}")
+    if not _AVAILABLE.get(backend, True):
+        print(f"⚠️ {backend} is not installed, falling back to the local IVF index")
+        backend = "ivf"
+        params = {key: value for key, value in params.items() if key in ("nlist", "nprobe", "n_iter", "seed")}
+    return ANN_BACKENDS[backend](vectors, **params)
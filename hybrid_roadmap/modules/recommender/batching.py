@@ -0,0 +1,110 @@
+"""
+Cross-request micro-batching for sentence encoding.
+
+Under threaded Flask / gthread gunicorn, concurrent requests each encode one
+or two short skill strings, so most of the time goes to per-call overhead
+and the threads compete for the same cores. BatchingEncoder puts the texts
+from all callers on one queue. A single worker thread runs one batched
+``encode`` whenever the batch is full, or when the oldest queued request
+has waited ``max_wait_ms``.
+
+Callers either block in ``encode`` (the normal encoder interface) or take
+a Future from ``submit``. Enabled with ENCODE_BATCHING=1. The limits come
+from ENCODE_BATCH_SIZE (texts per batch, default 64) and
+ENCODE_MAX_WAIT_MS (default 5).
+"""
+
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+from modules.utils.metrics import Histogram
+
+BATCHING_ENABLED = os.environ.get("ENCODE_BATCHING", "0") == "1"
+DEFAULT_BATCH_SIZE = int(os.environ.get("ENCODE_BATCH_SIZE", 64))
+DEFAULT_MAX_WAIT_MS = float(os.environ.get("ENCODE_MAX_WAIT_MS", 5))
+
+BATCH_SIZE_BUCKETS = [1, 2, 4, 8, 16, 32, 64, 128, 256]
+WAIT_MS_BUCKETS = [0.5, 1, 2, 5, 10, 20, 50, 100, 250]
+
+
+class BatchingEncoder:
+    """Wraps an encoder so concurrent ``encode`` calls share batched forward passes."""
+
+    def __init__(self, encoder, max_batch_size: int = DEFAULT_BATCH_SIZE, max_wait_ms: float = DEFAULT_MAX_WAIT_MS):
+        self.encoder = encoder
+        self.name = encoder.name
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000
+        self._queue: queue.Queue = queue.Queue()
+        self._worker = None
+        self._lock = threading.Lock()
+        self.batch_sizes = Histogram(BATCH_SIZE_BUCKETS)
+        self.queue_wait_ms = Histogram(WAIT_MS_BUCKETS)
+
+    def _ensure_worker(self) -> None:
+        # Started on first use, so gunicorn workers each get their own thread after fork
+        if self._worker is None or not self._worker.is_alive():
+            with self._lock:
+                if self._worker is None or not self._worker.is_alive():
+                    self._worker = threading.Thread(target=self._run, name="encode-batcher", daemon=True)
+                    self._worker.start()
+
+    def submit(self, texts: list[str]) -> Future:
+        """Queue ``texts`` for encoding; the Future resolves to their (len(texts), dim) array."""
+        future: Future = Future()
+        if not texts:
+            future.set_result(np.zeros((0, 0), dtype=np.float32))
+            return future
+        self._ensure_worker()
+        self._queue.put((list(texts), future, time.monotonic()))
+        return future
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        return self.submit(texts).result()
+
+    def _next_batch(self) -> list:
+        batch = [self._queue.get()]
+        size = len(batch[0][0])
+        deadline = batch[0][2] + self.max_wait
+        while size < self.max_batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            batch.append(item)
+            size += len(item[0])
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            started = time.monotonic()
+            texts = [text for item in batch for text in item[0]]
+            for _, _, enqueued in batch:
+                self.queue_wait_ms.observe((started - enqueued) * 1000)
+            self.batch_sizes.observe(len(texts))
+            try:
+                vectors = np.asarray(self.encoder.encode(texts), dtype=np.float32)
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+            offset = 0
+            for item_texts, future, _ in batch:
+                future.set_result(vectors[offset:offset + len(item_texts)])
+                offset += len(item_texts)
+
+    def stats(self) -> dict:
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "queued": self._queue.qsize(),
+            "batch_size": self.batch_sizes.stats(),
+            "queue_wait_ms": self.queue_wait_ms.stats(),
+        }
@@ -0,0 +1,237 @@
+"""
+Students x jobs match matrix for the dashboards.
+
+BulkMatcher scores every student against every job with the same signals as
+``match_resume_jd_semantic``: skill overlap, global-IDF TF-IDF and semantic
+similarity, blended into the hybrid score. Instead of N x M pair calls, it
+builds the job side once:
+- a sparse skill matrix (JD weights for the overlap),
+- a sparse TF-IDF matrix,
+- a dense matrix of unit embeddings.
+Students are then processed in row chunks. Each chunk is encoded and
+multiplied against the job matrices, and the chunk size keeps the score
+blocks under BULK_MATCH_BLOCK_MB (default 64) whatever the catalog size.
+
+``top_k`` keeps the best jobs per student and the best students per job in
+the same pass over the chunks (``iter_top_k`` hands out each chunk's student
+results as soon as they are ready). ``blocks`` yields the raw score blocks for
+callers that need every pair.
+"""
+
+import os
+
+import numpy as np
+
+from .encoders import get_encoder
+from .jd_reume import DEFAULT_SEMANTIC_MODE, SEMANTIC_MODES
+from .skill_embeddings import get_skill_embeddings
+from .skill_idf import get_skill_idf
+
+DEFAULT_BLOCK_BYTES = int(float(os.environ.get("BULK_MATCH_BLOCK_MB", 64)) * 1024 * 1024)
+
+# Chunk-sized float64 arrays alive at the peak of a chunk: the four signals
+# plus the temporaries of the products, the blend and the top-k selection
+_BLOCKS_PER_CHUNK = 8
+
+
+def _skill_set(skills: list[str]) -> set[str]:
+    # Same normalization as jd_reume._normalize_skills
+    return {skill.lower().strip() for skill in skills if skill and isinstance(skill, str)}
+
+
+def _csr(values, rows, cols, shape):
+    # scipy is imported on first use, not when the routes import this module
+    from scipy import sparse
+
+    return sparse.csr_matrix((values, (rows, cols)), shape=shape)
+
+
+def _top_k_columns(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    Row positions of the k highest scores in every column, best first, ties
+    in row order. Returns a (min(k, rows), columns) array.
+    """
+    rows, columns = scores.shape
+    k = min(k, rows)
+    if k <= 0:
+        return np.zeros((0, columns), dtype=np.int64)
+    kth = np.partition(scores, rows - k, axis=0)[rows - k]
+    # At least k entries per column reach the k-th value; usually exactly k
+    cand_rows, cand_cols = np.nonzero(scores >= kth)
+    order = np.lexsort((cand_rows, -scores[cand_rows, cand_cols], cand_cols))
+    cand_rows, cand_cols = cand_rows[order], cand_cols[order]
+    rank = np.arange(len(cand_cols)) - np.searchsorted(cand_cols, np.arange(columns))[cand_cols]
+    keep = rank < k
+    out = np.empty((k, columns), dtype=np.int64)
+    out[rank[keep], cand_cols[keep]] = cand_rows[keep]
+    return out
+
+
+class BulkMatcher:
+    """A job set prepared for scoring against many students at once."""
+
+    def __init__(self, jobs: list[list[str]], job_weights: list[dict[str, float] | None] | None = None,
+                 semantic_mode: str | None = None, block_bytes: int = DEFAULT_BLOCK_BYTES,
+                 max_chunk_rows: int | None = None):
+        self.semantic_mode = semantic_mode or DEFAULT_SEMANTIC_MODE
+        if self.semantic_mode not in SEMANTIC_MODES:
+            raise ValueError(f"semantic_mode must be one of {SEMANTIC_MODES}")
+        self.jobs = [list(skills) for skills in jobs]
+        self.job_weights = list(job_weights) if job_weights is not None else [None] * len(self.jobs)
+        if len(self.job_weights) != len(self.jobs):
+            raise ValueError("job_weights must have one entry per job")
+        self.block_bytes = block_bytes
+        # Smaller chunks hand out results sooner when streaming
+        self.max_chunk_rows = max_chunk_rows
+        self.idf = get_skill_idf()
+
+        # ------------- OVERLAP -------------
+        # matched weight = student skills . job weights (0 for unweighted skills
+        # of a weighted JD); total weight defaults to 1 per skill, as in
+        # jd_reume._build_overlap_score
+        self._skills: dict[str, int] = {}
+        rows, cols, matched = [], [], []
+        self._total = np.zeros(len(self.jobs))
+        for j, (skills, weights) in enumerate(zip(self.jobs, self.job_weights)):
+            lookup = {skill.lower().strip(): float(w) for skill, w in weights.items()} if weights else None
+            for skill in _skill_set(skills):
+                rows.append(j)
+                cols.append(self._skills.setdefault(skill, len(self._skills)))
+                matched.append(lookup.get(skill, 0.0) if lookup else 1.0)
+                self._total[j] += lookup.get(skill, 1.0) if lookup else 1.0
+        self._job_skills = _csr(matched, rows, cols, (len(self.jobs), len(self._skills)))
+
+        # ------------- TF-IDF -------------
+        self._terms: dict[str, int] = {}
+        self._job_tfidf = self._tfidf_matrix([" ".join(skills) for skills in self.jobs], grow=True)
+
+        # ------------- SEMANTIC -------------
+        self._job_vectors = self._unit(self._embed(self.jobs, self.job_weights))
+
+    # ------------- student / job features -------------
+    def _tfidf_matrix(self, texts: list[str], grow: bool = False):
+        rows, cols, values = [], [], []
+        for i, text in enumerate(texts):
+            for term, weight in self.idf.vector(text).items():
+                col = self._terms.setdefault(term, len(self._terms)) if grow else self._terms.get(term)
+                # Terms no job contains add to the student's norm but not to any dot product
+                if col is not None:
+                    rows.append(i)
+                    cols.append(col)
+                    values.append(weight)
+        return _csr(values, rows, cols, (len(texts), len(self._terms)))
+
+    def _skill_matrix(self, students: list[list[str]]):
+        rows, cols = [], []
+        for i, skills in enumerate(students):
+            for skill in _skill_set(skills):
+                col = self._skills.get(skill)
+                if col is not None:
+                    rows.append(i)
+                    cols.append(col)
+        return _csr(np.ones(len(rows)), rows, cols, (len(students), len(self._skills)))
+
+    def _embed(self, skill_lists: list[list[str]], weights: list | None = None) -> np.ndarray:
+        if self.semantic_mode == "composed":
+            embeddings = get_skill_embeddings()
+            vectors = [embeddings.compose(skills, w) for skills, w in zip(skill_lists, weights or [None] * len(skill_lists))]
+            dim = next((v.size for v in vectors if v.size), 0)
+            return np.stack([v if v.size else np.zeros(dim, dtype=np.float32) for v in vectors]) \
+                if dim else np.zeros((len(skill_lists), 0), dtype=np.float32)
+        if not skill_lists:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.asarray(get_encoder().encode([" ".join(skills) for skills in skill_lists]), dtype=np.float32)
+
+    @staticmethod
+    def _unit(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    def chunk_rows(self) -> int:
+        """Students per chunk so the chunk's score blocks fit in ``block_bytes``."""
+        rows = max(1, self.block_bytes // (max(1, len(self.jobs)) * 8 * _BLOCKS_PER_CHUNK))
+        return min(rows, self.max_chunk_rows) if self.max_chunk_rows else rows
+
+    # ------------- scoring -------------
+    def _score_chunk(self, students: list[list[str]]) -> dict[str, np.ndarray]:
+        if self._job_vectors.shape[1]:
+            semantic = (self._unit(self._embed(students)) @ self._job_vectors.T).astype(np.float64)
+        else:
+            semantic = np.zeros((len(students), len(self.jobs)))
+        tfidf = (self._tfidf_matrix([" ".join(skills) for skills in students]) @ self._job_tfidf.T).toarray()
+        matched = (self._skill_matrix(students) @ self._job_skills.T).toarray()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            overlap = np.where(self._total > 0, matched / np.where(self._total > 0, self._total, 1.0), 0.0)
+        # Rounded before blending, like the single-pair result
+        overlap = np.round(overlap, 4)
+        hybrid = np.round(0.45 * semantic + 0.35 * tfidf + 0.20 * overlap, 4)
+        return {"semantic": semantic, "tfidf": tfidf, "overlap": overlap, "hybrid": hybrid}
+
+    def blocks(self, students: list[list[str]]):
+        """Yield ``(start, scores)`` per student chunk; each score is a (chunk, jobs) array."""
+        step = self.chunk_rows()
+        for start in range(0, len(students), step):
+            yield start, self._score_chunk(students[start:start + step])
+
+    @staticmethod
+    def _entry(key: str, index: int, scores: dict, row: int, col: int) -> dict:
+        return {
+            key: int(index),
+            "hybrid_score": float(scores["hybrid"][row, col]),
+            "semantic_score": round(float(scores["semantic"][row, col]), 4),
+            "tfidf_score": round(float(scores["tfidf"][row, col]), 4),
+            "overlap_score": float(scores["overlap"][row, col]),
+            "match_percentage": round(float(scores["overlap"][row, col]) * 100, 2),
+        }
+
+    def iter_top_k(self, students: list[list[str]], k: int = 5):
+        """
+        Streaming form of ``top_k``. Yields ``("students", start, matches)`` once
+        per chunk, as soon as that chunk is scored, then one final
+        ``("jobs", 0, matches)`` once every student has been seen.
+        """
+        names = ("hybrid", "semantic", "tfidf", "overlap")
+        # Running best students per job: scores (k, jobs) for every signal plus student ids
+        best = {name: np.zeros((0, len(self.jobs))) for name in names}
+        best_ids = np.zeros((0, len(self.jobs)), dtype=np.int64)
+        columns = np.arange(len(self.jobs))
+
+        for start, scores in self.blocks(students):
+            top_jobs = _top_k_columns(scores["hybrid"].T, k).T
+            yield "students", start, [
+                [self._entry("job", col, scores, row, col) for col in cols] for row, cols in enumerate(top_jobs)
+            ]
+
+            # Earlier students come first, so row order in the stack is id order on ties
+            kept = len(best_ids)
+            keep = _top_k_columns(np.vstack([best["hybrid"], scores["hybrid"]]), k)
+            from_block = keep >= kept
+            old, new = np.minimum(keep, max(kept - 1, 0)), np.maximum(keep - kept, 0)
+            best = {
+                name: np.where(from_block, scores[name][new, columns], best[name][old, columns] if kept else 0.0)
+                for name in names
+            }
+            best_ids = np.where(from_block, start + new, best_ids[old, columns] if kept else 0)
+
+        yield "jobs", 0, [
+            [self._entry("student", best_ids[rank, col], best, rank, col) for rank in range(len(best_ids))]
+            for col in range(len(self.jobs))
+        ]
+
+    def top_k(self, students: list[list[str]], k: int = 5) -> dict:
+        """
+        Best ``k`` jobs for every student and best ``k`` students for every job
+        by hybrid score, in one pass over the student chunks. Ties go to the
+        lower index.
+        """
+        result = {"students": [], "jobs": []}
+        for side, _, matches in self.iter_top_k(students, k):
+            result[side].extend(matches)
+        return result
+
+
+def match_matrix(students: list[list[str]], jobs: list[list[str]], job_weights: list | None = None,
+                 k: int = 5, semantic_mode: str | None = None) -> dict:
+    """Top-k jobs per student and top-k students per job (see ``BulkMatcher.top_k``)."""
+    return BulkMatcher(jobs, job_weights, semantic_mode).top_k(students, k)
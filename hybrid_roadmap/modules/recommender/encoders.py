@@ -0,0 +1,198 @@
+"""
+Sentence encoders behind one interface.
+
+Everything that embeds text (JD/resume matching, the job store and index,
+the skill embedding cache) calls ``get_encoder().encode(texts)``, which
+returns a float32 array of shape (len(texts), dim). ``encoder.name``
+identifies the backend and model. Persistent caches key on it, so vectors
+from different backends are never mixed.
+
+Backends, chosen with ENCODER_BACKEND:
+- ``torch`` (default): SentenceTransformer from the shared model registry
+- ``onnx``:  ONNX Runtime over a model exported to a local directory with
+             ``export_onnx`` (ONNX_MODEL_DIR, default models/<model>-onnx)
+- ``stub``:  deterministic hashed bag-of-words vectors for tests; no model
+             download, no heavy imports
+
+With ENCODE_BATCHING=1 the encoder is wrapped in a BatchingEncoder so
+concurrent requests share batched forward passes (see batching.py).
+"""
+
+import hashlib
+import os
+import re
+import threading
+
+import numpy as np
+
+from .batching import BATCHING_ENABLED, BatchingEncoder
+from .model_registry import DEFAULT_MODEL, get_model
+
+ENCODER_BACKENDS = ("torch", "onnx", "stub")
+
+DEFAULT_BACKEND = os.environ.get("ENCODER_BACKEND", "torch")
+ONNX_MODEL_DIR = os.environ.get("ONNX_MODEL_DIR")
+
+
+def _default_onnx_dir(model_name: str) -> str:
+    stem = model_name.rsplit("/", 1)[-1]
+    return os.path.join(os.path.dirname(__file__), "..", "..", "models", f"{stem}-onnx")
+
+
+class TorchEncoder:
+    """PyTorch SentenceTransformer (loaded once per process by the model registry)."""
+
+    def __init__(self, model_name: str = DEFAULT_MODEL):
+        self.model_name = model_name
+        self.name = f"torch:{model_name}"
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        return np.asarray(get_model(self.model_name).encode(list(texts)), dtype=np.float32)
+
+
+class OnnxEncoder:
+    """
+    ONNX Runtime encoder for a locally exported sentence-transformer.
+
+    Reproduces the all-MiniLM pipeline: tokenizer, transformer, attention-mask
+    mean pooling, L2 normalization.
+    """
+
+    def __init__(self, model_name: str = DEFAULT_MODEL, model_dir: str | None = None,
+                 max_length: int = 256, threads: int | None = None):
+        import onnxruntime
+        from tokenizers import Tokenizer
+
+        self.model_name = model_name
+        self.name = f"onnx:{model_name}"
+        model_dir = model_dir or ONNX_MODEL_DIR or _default_onnx_dir(model_name)
+        options = onnxruntime.SessionOptions()
+        if threads:
+            options.intra_op_num_threads = threads
+        self._session = onnxruntime.InferenceSession(
+            os.path.join(model_dir, "model.onnx"), options, providers=["CPUExecutionProvider"]
+        )
+        self._input_names = {i.name for i in self._session.get_inputs()}
+        self._tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+        self._tokenizer.enable_truncation(max_length)
+        self._tokenizer.enable_padding()
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        batch = self._tokenizer.encode_batch(list(texts))
+        mask = np.array([e.attention_mask for e in batch], dtype=np.int64)
+        feeds = {
+            "input_ids": np.array([e.ids for e in batch], dtype=np.int64),
+            "attention_mask": mask,
+            "token_type_ids": np.array([e.type_ids for e in batch], dtype=np.int64),
+        }
+        hidden = self._session.run(None, {k: v for k, v in feeds.items() if k in self._input_names})[0]
+        weights = mask[:, :, None].astype(np.float32)
+        pooled = (hidden * weights).sum(axis=1) / np.clip(weights.sum(axis=1), 1e-9, None)
+        norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (pooled / norms).astype(np.float32)
+
+
+class StubEncoder:
+    """
+    Deterministic encoder for tests: signed feature hashing of lower-cased
+    word tokens into ``dim`` buckets, L2-normalized. Texts sharing words get
+    similar vectors, which is enough to exercise ranking code.
+    """
+
+    def __init__(self, dim: int = 384):
+        self.dim = dim
+        self.name = f"stub:{dim}"
+
+    def _bucket(self, token: str) -> tuple[int, float]:
+        digest = hashlib.md5(token.encode("utf-8")).digest()
+        return int.from_bytes(digest[:4], "little") % self.dim, (1.0 if digest[4] & 1 else -1.0)
+
+    def encode(self, texts: list[str]) -> np.ndarray:
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for token in re.findall(r"[a-z0-9+#.]+", text.lower()):
+                bucket, sign = self._bucket(token)
+                out[row, bucket] += sign
+        norms = np.linalg.norm(out, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return out / norms
+
+
+_encoders: dict = {}
+_lock = threading.Lock()
+
+
+def get_encoder(model_name: str = DEFAULT_MODEL, backend: str | None = None):
+    """Return the shared encoder for ``model_name`` on ``backend`` (default ENCODER_BACKEND)."""
+    backend = backend or DEFAULT_BACKEND
+    key = (backend, model_name)
+    encoder = _encoders.get(key)
+    if encoder is None:
+        with _lock:
+            encoder = _encoders.get(key)
+            if encoder is None:
+                if backend == "torch":
+                    encoder = TorchEncoder(model_name)
+                elif backend == "onnx":
+                    encoder = OnnxEncoder(model_name)
+                elif backend == "stub":
+                    encoder = StubEncoder()
+                else:
+                    raise ValueError(f"ENCODER_BACKEND must be one of {ENCODER_BACKENDS}")
+                if BATCHING_ENABLED:
+                    encoder = BatchingEncoder(encoder)
+                _encoders[key] = encoder
+    return encoder
+
+
+def encoder_stats(model_name: str = DEFAULT_MODEL) -> dict:
+    """Backend in use and, when batching is enabled, its batch-size / queue-wait histograms."""
+    encoder = _encoders.get((DEFAULT_BACKEND, model_name))
+    stats = {"backend": DEFAULT_BACKEND, "loaded": encoder is not None, "batching": BATCHING_ENABLED}
+    if isinstance(encoder, BatchingEncoder):
+        stats.update(encoder.stats())
+    return stats
+
+
+def warmup(model_name: str = DEFAULT_MODEL) -> None:
+    """Load the configured encoder and run one encode."""
+    get_encoder(model_name).encode(["warmup"])
+
+
+def export_onnx(model_name: str = DEFAULT_MODEL, output_dir: str | None = None, opset: int = 17) -> str:
+    """
+    Export a locally available sentence-transformer to ONNX for OnnxEncoder.
+
+    Writes model.onnx (transformer only; pooling runs in NumPy) and
+    tokenizer.json to ``output_dir`` and returns that directory. Uses the
+    local Hugging Face cache only, so it works on machines without network
+    access once the model has been downloaded.
+    """
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+
+    output_dir = output_dir or _default_onnx_dir(model_name)
+    os.makedirs(output_dir, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(model_name, local_files_only=True)
+    model = AutoModel.from_pretrained(model_name, local_files_only=True).eval()
+
+    sample = tokenizer(["export"], return_tensors="pt")
+    names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+    axes = {name: {0: "batch", 1: "tokens"} for name in names}
+    with torch.no_grad():
+        torch.onnx.export(
+            model, tuple(sample[name] for name in names), os.path.join(output_dir, "model.onnx"),
+            input_names=names, output_names=["last_hidden_state"],
+            dynamic_axes={**axes, "last_hidden_state": {0: "batch", 1: "tokens"}},
+            opset_version=opset,
+        )
+    tokenizer.backend_tokenizer.save(os.path.join(output_dir, "tokenizer.json"))
+    return output_dir
+
+
+if __name__ == "__main__":
+    # python -m modules.recommender.encoders  -> export the default model for ENCODER_BACKEND=onnx
+    print(f"✅ Exported ONNX model to {export_onnx()}")
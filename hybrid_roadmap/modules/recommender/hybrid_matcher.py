@@ -3,12 +3,12 @@ HYBRID JOB MATCHING ENGINE
 Combines Semantic & TF-IDF matching with detailed percentage breakdowns
 """
 
-import json
-import os
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.feature_extraction.text import TfidfVectorizer
+import threading
 import numpy as np
+from .ann import top_k
+from .job_index import JobIndex, get_job_index
+from .encoders import get_encoder
+from .tfidf_store import make_tfidf_vectorizer
 
 
 class HybridJobMatcher:
@@ -18,21 +18,25 @@ class HybridJobMatcher:
     2. TF-IDF Matching (30%) - keyword frequency matching
     """
 
-    def __init__(self):
-        # Load pre-trained semantic model
-        self.semantic_model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
-        self.tfidf_vectorizer = None
+    SEMANTIC_WEIGHT = 0.7
+    TFIDF_WEIGHT = 0.3
+
+    def __init__(self, index: JobIndex | None = None):
+        self._index = index
+
+    @property
+    def job_index(self) -> JobIndex:
+        """Job catalog with its precomputed embeddings and TF-IDF (shared by default)"""
+        return self._index if self._index is not None else get_job_index()
+
+    @property
+    def encoder(self):
+        """Configured sentence encoder backend (see ENCODER_BACKEND)"""
+        return get_encoder()
 
     def load_sample_jobs(self):
-        """Load job descriptions from JSON"""
-        base_dir = os.path.dirname(__file__)
-        json_path = os.path.join(base_dir, "sample_jds.json")
-        
-        if not os.path.exists(json_path):
-            raise FileNotFoundError(f"sample_jds.json not found at {json_path}")
-        
-        with open(json_path, "r") as f:
-            return json.load(f)
+        """Jobs currently in the index"""
+        return self.job_index.jobs
 
     def calculate_semantic_scores(self, resume_text: str, job_texts: list) -> list:
         """
@@ -43,11 +47,16 @@ class HybridJobMatcher:
         2. Encode all jobs as semantic vectors
         3. Calculate cosine similarity (0-1 range)
         
+        Recommendations score against the job index instead; this is for
+        ad-hoc job texts.
+        
         Returns: List of scores (0-1)
         """
+        from sklearn.metrics.pairwise import cosine_similarity
+
         # Encode resume and jobs into embeddings
-        resume_embedding = self.semantic_model.encode([resume_text])
-        job_embeddings = self.semantic_model.encode(job_texts)
+        resume_embedding = self.encoder.encode([resume_text])
+        job_embeddings = self.encoder.encode(job_texts)
         
         # Calculate cosine similarity between resume and each job
         semantic_scores = cosine_similarity(resume_embedding, job_embeddings)[0]
@@ -59,30 +68,28 @@ class HybridJobMatcher:
         Calculate TF-IDF similarity using keyword frequency
         
         Process:
-        1. Vectorize resume and jobs using TF-IDF
-        2. Calculate term frequency importance
+        1. Fit the shared TF-IDF config on the job texts
+        2. Transform the resume with the fitted vocabulary
         3. Calculate cosine similarity
         
+        Recommendations score against the job index instead; this is for
+        ad-hoc job texts.
+        
         Returns: List of scores (0-1)
         """
-        # Combine all texts for vectorizer
-        all_texts = [resume_text] + job_texts
+        # Same vectorizer settings as the job index; the resume does not
+        # contribute to the vocabulary or IDF
+        vectorizer = make_tfidf_vectorizer()
+        job_matrix = vectorizer.fit_transform(job_texts)
+        resume_vector = vectorizer.transform([resume_text])
         
-        # Create TF-IDF vectors
-        vectorizer = TfidfVectorizer(
-            max_features=500,           # Limit to 500 most important terms
-            stop_words='english',        # Remove common English words
-            lowercase=True
-        )
-        tfidf_matrix = vectorizer.fit_transform(all_texts)
-        
-        # Calculate similarity between resume (index 0) and jobs (index 1+)
-        tfidf_scores = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:])[0]
+        # Rows are L2-normalized, so the dot product is the cosine similarity
+        tfidf_scores = (job_matrix @ resume_vector.T).toarray().ravel()
         
         return tfidf_scores.tolist()
 
     def calculate_hybrid_score(self, semantic_score: float, tfidf_score: float, 
-                              semantic_weight: float = 0.7, tfidf_weight: float = 0.3) -> float:
+                              semantic_weight: float = SEMANTIC_WEIGHT, tfidf_weight: float = TFIDF_WEIGHT) -> float:
         """
         Combine semantic and TF-IDF scores with weighted average
         
@@ -114,7 +121,40 @@ class HybridJobMatcher:
         """
         return round(hybrid_score * 100, 2)
 
-    def recommend_jobs_hybrid(self, resume_skills: list, top_n: int = 5) -> dict:
+    def _match(self, job: dict, idx: int, sem_score: float, tf_score: float, hybrid_score: float, rank: int) -> dict:
+        """Result entry for one ranked job"""
+        return {
+            "id": job.get("id", str(idx)),
+            "title": job.get("title", "Unknown"),
+            "company": job.get("company", "Unknown"),
+            "description": job.get("description", ""),
+            "semantic_score": round(float(sem_score), 4),      # 0-1
+            "tfidf_score": round(float(tf_score), 4),          # 0-1
+            "hybrid_score": float(hybrid_score),                # 0-1 (weighted)
+            "match_percentage": self.calculate_match_percentage(float(hybrid_score)),  # 0-100
+            "semantic_percentage": round(float(sem_score) * 100, 2),
+            "tfidf_percentage": round(float(tf_score) * 100, 2),
+            "rank": rank
+        }
+
+    def _rank_matches(self, jobs: list, semantic_scores, tfidf_scores, start: int, stop: int | None) -> list:
+        """
+        Ranked results start..stop (0-based, stop exclusive, None = all) by hybrid score.
+
+        Scores are fused as arrays and only the first ``stop`` jobs are
+        selected (argpartition) and turned into dicts.
+        """
+        semantic_scores = np.asarray(semantic_scores, dtype=np.float64)
+        tfidf_scores = np.asarray(tfidf_scores, dtype=np.float64)
+        hybrid_scores = np.round(semantic_scores * self.SEMANTIC_WEIGHT + tfidf_scores * self.TFIDF_WEIGHT, 4)
+        order = top_k(hybrid_scores, len(jobs) if stop is None else stop)[start:]
+        return [
+            self._match(jobs[i], int(i), semantic_scores[i], tfidf_scores[i], hybrid_scores[i], rank)
+            for rank, i in enumerate(order, start + 1)
+        ]
+
+    def recommend_jobs_hybrid(self, resume_skills: list, top_n: int = 5, include_all: bool = False,
+                              offset: int = 0, limit: int | None = None) -> dict:
         """
         Get job recommendations using hybrid matching
         
@@ -126,6 +166,9 @@ class HybridJobMatcher:
         Args:
             resume_skills: List of skills from resume (e.g., ["Python", "SQL", "Excel"])
             top_n: Number of top recommendations to return
+            include_all: Also return a page of the full ranking as "all_matches"
+            offset: First rank (0-based) of the "all_matches" page
+            limit: Size of the "all_matches" page (None = to the end of the catalog)
         
         Returns:
             Dictionary with:
@@ -142,63 +185,32 @@ class HybridJobMatcher:
                         "match_percentage": float (0-100),
                         "rank": int
                     }
-                ]
+                ],
+                # only with include_all=True:
+                "all_matches": [...],
+                "all_matches_page": {"offset": int, "limit": int | None, "total": int}
             }
         """
-        # Load job data
-        jobs = self.load_sample_jobs()
-        
         # Create resume text from skills
         resume_text = " ".join(resume_skills)
         
-        # Extract job descriptions
-        job_texts = [job.get("description", "") for job in jobs]
-        
-        # Calculate both types of scores
-        print("🔄 Calculating semantic scores...")
-        semantic_scores = self.calculate_semantic_scores(resume_text, job_texts)
+        # Score against the precomputed job embeddings and TF-IDF matrix
+        print("🔄 Calculating semantic and TF-IDF scores...")
+        jobs, semantic_scores, tfidf_scores = self.job_index.scores(resume_text)
         
-        print("🔄 Calculating TF-IDF scores...")
-        tfidf_scores = self.calculate_tfidf_scores(resume_text, job_texts)
-        
-        # Combine scores and create results
+        # Fuse scores and rank only what is returned
         print("🔄 Combining scores...")
-        job_matches = []
-        
-        for idx, (job, sem_score, tf_score) in enumerate(zip(jobs, semantic_scores, tfidf_scores)):
-            # Calculate hybrid score
-            hybrid_score = self.calculate_hybrid_score(sem_score, tf_score)
-            
-            # Convert to percentage
-            match_percentage = self.calculate_match_percentage(hybrid_score)
-            
-            job_matches.append({
-                "id": job.get("id", str(idx)),
-                "title": job.get("title", "Unknown"),
-                "company": job.get("company", "Unknown"),
-                "description": job.get("description", ""),
-                "semantic_score": round(float(sem_score), 4),      # 0-1
-                "tfidf_score": round(float(tf_score), 4),          # 0-1
-                "hybrid_score": hybrid_score,                       # 0-1 (weighted)
-                "match_percentage": match_percentage,               # 0-100
-                "semantic_percentage": round(float(sem_score) * 100, 2),
-                "tfidf_percentage": round(float(tf_score) * 100, 2)
-            })
-        
-        # Sort by hybrid score (highest first)
-        job_matches.sort(key=lambda x: x["hybrid_score"], reverse=True)
-        
-        # Add rank
-        for rank, match in enumerate(job_matches, 1):
-            match["rank"] = rank
-        
-        # Return top N
-        return {
+        results = {
             "total_jobs": len(jobs),
             "resume_skills": resume_skills,
-            "matches": job_matches[:top_n],
-            "all_matches": job_matches  # For detailed analysis
+            "matches": self._rank_matches(jobs, semantic_scores, tfidf_scores, 0, top_n)
         }
+        if include_all:
+            offset = max(0, offset)
+            stop = len(jobs) if limit is None else min(len(jobs), offset + max(0, limit))
+            results["all_matches"] = self._rank_matches(jobs, semantic_scores, tfidf_scores, offset, stop)
+            results["all_matches_page"] = {"offset": offset, "limit": limit, "total": len(jobs)}
+        return results
 
     def get_detailed_comparison(self, resume_skills: list) -> dict:
         """
@@ -212,12 +224,8 @@ class HybridJobMatcher:
             - Hybrid ranking
             - Individual percentages
         """
-        jobs = self.load_sample_jobs()
         resume_text = " ".join(resume_skills)
-        job_texts = [job.get("description", "") for job in jobs]
-        
-        semantic_scores = self.calculate_semantic_scores(resume_text, job_texts)
-        tfidf_scores = self.calculate_tfidf_scores(resume_text, job_texts)
+        jobs, semantic_scores, tfidf_scores = self.job_index.scores(resume_text)
         
         results = {
             "semantic_ranking": [],
@@ -262,16 +270,31 @@ class HybridJobMatcher:
         return results
 
 
+_default_matcher = None
+_default_matcher_lock = threading.Lock()
+
+
+def _get_default_matcher() -> HybridJobMatcher:
+    """Shared matcher for the convenience functions below"""
+    global _default_matcher
+    if _default_matcher is None:
+        with _default_matcher_lock:
+            if _default_matcher is None:
+                _default_matcher = HybridJobMatcher()
+    return _default_matcher
+
+
 # Convenience functions for backward compatibility
-def recommend_jobs_hybrid(resume_skills: list, top_n: int = 5) -> dict:
+def recommend_jobs_hybrid(resume_skills: list, top_n: int = 5, include_all: bool = False,
+                          offset: int = 0, limit: int | None = None) -> dict:
     """Quick function to get hybrid recommendations"""
-    matcher = HybridJobMatcher()
-    return matcher.recommend_jobs_hybrid(resume_skills, top_n)
+    matcher = _get_default_matcher()
+    return matcher.recommend_jobs_hybrid(resume_skills, top_n, include_all, offset, limit)
 
 
 def get_match_percentage(resume_skills: list, job_title: str = None) -> dict:
     """Get match percentages for all jobs"""
-    matcher = HybridJobMatcher()
+    matcher = _get_default_matcher()
     results = matcher.recommend_jobs_hybrid(resume_skills, top_n=10)
     return results
 
@@ -0,0 +1,102 @@
+"""
+Posting-list scoring over the job TF-IDF matrix.
+
+A resume query is a few skill tokens. Scoring it as ``matrix @ query`` still
+visits every job row. InvertedIndex keeps the matrix column-major, so each
+term's postings (the jobs containing it and their weights) are contiguous. A
+query walks only the postings of its own terms and accumulates the
+contributions, and the top-k is selected from the jobs it touched. The cost
+depends on how many jobs contain the query terms, not on catalog size. The
+rows and the query are L2-normalized by the vectorizer, so the accumulated
+dot products are cosine similarities.
+"""
+
+import threading
+
+import numpy as np
+
+from .ann import top_k
+
+
+class InvertedIndex:
+    """Term -> (job rows, weights) postings of a TF-IDF matrix."""
+
+    def __init__(self, matrix):
+        # CSC: column t holds the postings of term t (a no-op for a CSC input)
+        matrix = matrix.tocsc()
+        matrix.sort_indices()
+        self.n_rows = matrix.shape[0]
+        self._indptr = matrix.indptr
+        self._rows = matrix.indices
+        self._weights = matrix.data
+        # Per-thread accumulator, reset after each query so it stays all zeros
+        self._scratch = threading.local()
+
+    def __len__(self) -> int:
+        return self.n_rows
+
+    @property
+    def nnz(self) -> int:
+        return len(self._rows)
+
+    def _accumulator(self) -> tuple[np.ndarray, np.ndarray]:
+        scratch = self._scratch
+        if getattr(scratch, "size", None) != self.n_rows:
+            scratch.scores = np.zeros(self.n_rows, dtype=np.float64)
+            scratch.seen = np.zeros(self.n_rows, dtype=bool)
+            scratch.size = self.n_rows
+        return scratch.scores, scratch.seen
+
+    def accumulate(self, query) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Walk the postings of the query's terms. Returns ``(rows, scores)`` for
+        every job sharing at least one term with ``query`` (a 1 x vocabulary
+        sparse row), in no particular order.
+        """
+        query = query.tocsr()
+        terms, weights = query.indices, query.data
+        if len(terms) == 1:
+            # A single posting list already has one entry per job
+            start, stop = self._indptr[terms[0]], self._indptr[terms[0] + 1]
+            return self._rows[start:stop].copy(), self._weights[start:stop] * weights[0]
+
+        acc, seen = self._accumulator()
+        touched = []
+        for term, weight in zip(terms, weights):
+            start, stop = self._indptr[term], self._indptr[term + 1]
+            rows = self._rows[start:stop]
+            # Rows are unique within one posting list, so fancy-index += is exact
+            acc[rows] += self._weights[start:stop] * weight
+            new = rows[~seen[rows]]
+            seen[new] = True
+            touched.append(new)
+        rows = np.concatenate(touched) if touched else np.zeros(0, dtype=self._rows.dtype)
+        scores = acc[rows]
+        acc[rows] = 0.0
+        seen[rows] = False
+        return rows, scores
+
+    def scores(self, query, rows: np.ndarray | None = None) -> np.ndarray:
+        """Cosine similarity of ``query`` with every job, or with ``rows``."""
+        touched, values = self.accumulate(query)
+        if rows is None:
+            out = np.zeros(self.n_rows)
+            out[touched] = values
+            return out
+        if not len(touched):
+            return np.zeros(len(rows))
+        order = np.argsort(touched)
+        touched, values = touched[order], values[order]
+        pos = np.minimum(np.searchsorted(touched, rows), len(touched) - 1)
+        return np.where(touched[pos] == rows, values[pos], 0.0)
+
+    def search(self, query, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        The k best-scoring jobs that share a term with ``query``, best first,
+        ties in row order. Jobs with a zero score are not returned.
+        """
+        rows, scores = self.accumulate(query)
+        order = np.argsort(rows, kind="stable")
+        rows, scores = rows[order], scores[order]
+        best = top_k(scores, k)
+        return rows[best], scores[best]
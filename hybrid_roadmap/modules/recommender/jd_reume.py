@@ -1,12 +1,21 @@
 import os
 import json
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.feature_extraction.text import TfidfVectorizer
+import numpy as np
+from modules.utils.cache import LRUCache
+from .encoders import get_encoder
+from .skill_embeddings import get_skill_embeddings
+from .skill_idf import get_skill_idf
 
+# "joined": encode the space-joined skill lists with the transformer (default)
+# "composed": average cached per-skill vectors, no forward pass per request
+SEMANTIC_MODES = ("joined", "composed")
+DEFAULT_SEMANTIC_MODE = os.environ.get("SEMANTIC_MODE", "joined")
 
-# ----------- LOAD SEMANTIC MODEL -------------
-model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+# Pair results keyed by both skill lists (order-insensitive), the JD weights,
+# the semantic mode and the encoder + IDF/taxonomy version. An entry takes
+# roughly 1 KB; MATCH_CACHE_SIZE=0 disables the cache.
+MATCH_CACHE_SIZE = int(os.environ.get("MATCH_CACHE_SIZE", 65536))
+_match_cache = LRUCache(max_entries=MATCH_CACHE_SIZE)
 
 
 def _normalize_skills(skills: list[str]) -> tuple[list[str], dict[str, str], dict[str, str]]:
@@ -16,13 +25,20 @@ def _normalize_skills(skills: list[str]) -> tuple[list[str], dict[str, str], dic
     return normalized, resume_map, {skill.lower(): skill for skill in skills}
 
 
+def _skill_key(skills: list[str]) -> tuple[str, ...]:
+    """Cache key order of a skill list: case-insensitive sort, duplicates kept."""
+    return tuple(sorted(skills, key=lambda skill: (skill.lower(), skill)))
+
+
 def _build_overlap_score(resume_set: set[str], jd_set: set[str], jd_skill_weights: dict[str, float] | None = None) -> float:
     if not jd_set:
         return 0.0
 
     if jd_skill_weights:
-        matched_weight = sum(jd_skill_weights.get(skill, 0.0) for skill in resume_set.intersection(jd_set))
-        total_weight = sum(jd_skill_weights.get(skill, 1.0) for skill in jd_set) or 1.0
+        # Skill sets are lower-cased; parse_jd weights use the taxonomy spelling
+        weights = {skill.lower().strip(): weight for skill, weight in jd_skill_weights.items()}
+        matched_weight = sum(weights.get(skill, 0.0) for skill in resume_set.intersection(jd_set))
+        total_weight = sum(weights.get(skill, 1.0) for skill in jd_set) or 1.0
         return round(matched_weight / total_weight, 4)
 
     matched_count = len(resume_set.intersection(jd_set))
@@ -36,54 +52,147 @@ def _format_skill_list(skill_set: set[str], resume_case_map: dict[str, str], jd_
     return formatted
 
 
-def match_resume_jd_semantic(resume_skills: list[str], jd_skills: list[str], jd_skill_weights: dict[str, float] | None = None):
+def _semantic_scores(resumes: list[list[str]], jd_skills: list[str],
+                     jd_skill_weights: dict[str, float] | None, mode: str) -> np.ndarray:
+    """Semantic similarity of each resume to the JD; the JD is embedded once."""
+    if mode == "composed":
+        embeddings = get_skill_embeddings()
+        jd_vec = embeddings.compose(jd_skills, jd_skill_weights)
+        if not jd_vec.size:
+            return np.zeros(len(resumes))
+        resume_vecs = np.zeros((len(resumes), jd_vec.size), dtype=np.float32)
+        for row, resume_skills in enumerate(resumes):
+            vec = embeddings.compose(resume_skills)
+            if vec.size:
+                resume_vecs[row] = vec
+        denom = np.linalg.norm(resume_vecs, axis=1).astype(np.float64) * float(np.linalg.norm(jd_vec))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(denom > 0, (resume_vecs @ jd_vec) / denom, 0.0)
+
+    if mode != "joined":
+        raise ValueError(f"semantic_mode must be one of {SEMANTIC_MODES}")
+
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    # One forward pass for the JD and every resume
+    embs = get_encoder().encode([" ".join(jd_skills)] + [" ".join(resume_skills) for resume_skills in resumes])
+    return cosine_similarity(embs[1:], embs[:1])[:, 0]
+
+
+def _semantic_score(resume_skills: list[str], jd_skills: list[str],
+                    jd_skill_weights: dict[str, float] | None, mode: str) -> float:
+    return float(_semantic_scores([resume_skills], jd_skills, jd_skill_weights, mode)[0])
+
+
+def match_resume_jd_semantic(resume_skills: list[str], jd_skills: list[str], jd_skill_weights: dict[str, float] | None = None,
+                             semantic_mode: str | None = None):
     """
     Compare resume skills and JD skills using multiple signals:
     1. exact overlap match score (case-insensitive)
     2. semantic similarity via sentence-transformer embeddings
-    3. TF-IDF similarity over skill text
+    3. TF-IDF similarity over skill text, weighted by IDF precomputed from
+       the job catalog and skill taxonomy (no per-call fitting)
 
     The hybrid score blends all signals for more stable and efficient scoring.
-    """
-    resume_lower, resume_original, _ = _normalize_skills(resume_skills)
-    jd_lower, _, jd_original = _normalize_skills(jd_skills)
 
-    resume_text = " ".join(resume_skills)
-    jd_text = " ".join(jd_skills)
+    semantic_mode "composed" builds both embeddings from cached per-skill
+    vectors (JD skills weighted by jd_skill_weights) instead of running the
+    transformer on the joined skill text; defaults to SEMANTIC_MODE.
 
-    # ------------- SEMANTIC SIMILARITY -------------
-    resume_emb = model.encode([resume_text])
-    jd_emb = model.encode([jd_text])
-    semantic_score = float(cosine_similarity(resume_emb, jd_emb)[0][0])
-
-    # ------------- TF-IDF SIMILARITY -------------
-    vectorizer = TfidfVectorizer()
-    tfidf_matrix = vectorizer.fit_transform([resume_text.lower(), jd_text.lower()])
-    tfidf_score = float(cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0])
-
-    # ------------- EXACT OVERLAP SCORE -------------
-    resume_set = set(resume_lower)
-    jd_set = set(jd_lower)
-    overlap_score = _build_overlap_score(resume_set, jd_set, jd_skill_weights)
+    Results are memoized (see ``match_cache_stats``): the order of either
+    skill list does not matter, so rescoring an unchanged pair is a lookup.
+    """
+    return match_resumes_jd_semantic([resume_skills], jd_skills, jd_skill_weights, semantic_mode)[0]
 
-    # ------------- HYBRID SCORE -------------
-    # combine semantic, tfidf and exact overlap for a more robust metric
-    hybrid_score = round(0.45 * semantic_score + 0.35 * tfidf_score + 0.20 * overlap_score, 4)
 
-    matched_lower = resume_set.intersection(jd_set)
-    missing_lower = jd_set - resume_set
+def match_resumes_jd_semantic(resumes: list[list[str]], jd_skills: list[str],
+                              jd_skill_weights: dict[str, float] | None = None,
+                              semantic_mode: str | None = None) -> list[dict]:
+    """
+    Batch form of ``match_resume_jd_semantic``: one JD against many resumes.
 
-    matched_skills = _format_skill_list(matched_lower, resume_original, jd_original)
-    missing_skills = _format_skill_list(missing_lower, resume_original, jd_original)
+    The JD is normalized, embedded and IDF-weighted once, the semantic
+    scores of all resumes come from one encoder call (or one matrix product
+    in "composed" mode), and each result is identical to the single-pair
+    result for that resume. Pairs already in the match cache are not
+    rescored; the JD-side work only runs when some resume misses.
+    """
+    mode = semantic_mode or DEFAULT_SEMANTIC_MODE
+    if mode not in SEMANTIC_MODES:
+        raise ValueError(f"semantic_mode must be one of {SEMANTIC_MODES}")
+    if MATCH_CACHE_SIZE <= 0:
+        return _score_resumes(resumes, jd_skills, jd_skill_weights, mode)
+
+    # The model and taxonomy version go into the key, so a reload never serves stale scores
+    jd_key = (
+        _skill_key(jd_skills),
+        tuple(sorted(jd_skill_weights.items())) if jd_skill_weights else None,
+        mode,
+        get_encoder().name,
+        get_skill_idf().version,
+    )
+    keys = [(_skill_key(resume_skills), jd_key) for resume_skills in resumes]
+    results = [_match_cache.get(key) for key in keys]
+
+    misses = [row for row, result in enumerate(results) if result is None]
+    if misses:
+        # Scored on the lists as given, so caching never changes a score. In
+        # joined mode the encoder sees the skills in order; a reordered list
+        # then gets the score of the ordering that was cached first
+        scored = _score_resumes([resumes[row] for row in misses], jd_skills, jd_skill_weights, mode)
+        for row, result in zip(misses, scored):
+            _match_cache.put(keys[row], result)
+            results[row] = result
+    # Callers may modify the result lists; the cached entry stays untouched
+    return [_copy_result(result) for result in results]
+
+
+def _copy_result(result: dict) -> dict:
+    return {**result, "matched_skills": list(result["matched_skills"]),
+            "missing_skills": list(result["missing_skills"])}
+
+
+def match_cache_stats() -> dict:
+    """Hit/miss counters for the pairwise match cache."""
+    return {**_match_cache.stats(), "enabled": MATCH_CACHE_SIZE > 0}
+
+
+def _score_resumes(resumes: list[list[str]], jd_skills: list[str],
+                   jd_skill_weights: dict[str, float] | None, mode: str) -> list[dict]:
+    jd_lower, _, jd_original = _normalize_skills(jd_skills)
+    jd_set = set(jd_lower)
 
-    match_percentage = round(overlap_score * 100, 2)
+    # ------------- SEMANTIC SIMILARITY -------------
+    semantic_scores = _semantic_scores(resumes, jd_skills, jd_skill_weights, mode)
 
-    return {
-        "matched_skills": matched_skills,
-        "missing_skills": missing_skills,
-        "semantic_score": round(semantic_score, 4),
-        "tfidf_score": round(tfidf_score, 4),
-        "overlap_score": round(overlap_score, 4),
-        "hybrid_score": hybrid_score,
-        "match_percentage": match_percentage
-    }
+    # ------------- TF-IDF SIMILARITY -------------
+    idf = get_skill_idf()
+    jd_vector = idf.vector(" ".join(jd_skills))
+
+    results = []
+    for resume_skills, semantic_score in zip(resumes, semantic_scores):
+        semantic_score = float(semantic_score)
+        resume_lower, resume_original, _ = _normalize_skills(resume_skills)
+        tfidf_score = idf.dot(idf.vector(" ".join(resume_skills)), jd_vector)
+
+        # ------------- EXACT OVERLAP SCORE -------------
+        resume_set = set(resume_lower)
+        overlap_score = _build_overlap_score(resume_set, jd_set, jd_skill_weights)
+
+        # ------------- HYBRID SCORE -------------
+        # combine semantic, tfidf and exact overlap for a more robust metric
+        hybrid_score = round(0.45 * semantic_score + 0.35 * tfidf_score + 0.20 * overlap_score, 4)
+
+        matched_lower = resume_set.intersection(jd_set)
+        missing_lower = jd_set - resume_set
+
+        results.append({
+            "matched_skills": _format_skill_list(matched_lower, resume_original, jd_original),
+            "missing_skills": _format_skill_list(missing_lower, resume_original, jd_original),
+            "semantic_score": round(semantic_score, 4),
+            "tfidf_score": round(tfidf_score, 4),
+            "overlap_score": round(overlap_score, 4),
+            "hybrid_score": hybrid_score,
+            "match_percentage": round(overlap_score * 100, 2)
+        })
+    return results
@@ -0,0 +1,280 @@
+"""
+In-memory job index shared by the job recommenders.
+
+The catalog is loaded once and everything derived from it lives here: the job
+embedding matrix (backed by the persistent job embedding store) and the
+TF-IDF vectorizer fitted on the job descriptions together with its sparse
+matrix (backed by the persistent job TF-IDF store), held as posting lists.
+A recommendation request only encodes / transforms the resume and scores it
+against the prepared matrices; TF-IDF scoring walks only the postings of the
+resume's terms. Derived state is rebuilt lazily after
+``add_jobs`` / ``remove_jobs``.
+"""
+
+import json
+import os
+import threading
+
+import numpy as np
+
+from .ann import DEFAULT_BACKEND as DEFAULT_ANN_BACKEND, DEFAULT_PARAMS as DEFAULT_ANN_PARAMS, build_ann_index, top_k
+from .job_store import JobEmbeddingStore, get_job_store
+from .model_registry import DEFAULT_MODEL
+from .inverted_index import InvertedIndex
+from .quantization import DEFAULT_DTYPE, DEFAULT_PCA_DIM, CompressedEmbeddings
+from .tfidf_store import JobTfidfStore, get_tfidf_store
+
+CATALOG_PATH = os.path.join(os.path.dirname(__file__), "sample_jds.json")
+
+# mode -> (semantic weight, TF-IDF weight); every mode shares the one TF-IDF
+# config in tfidf_store
+QUERY_MODES = {
+    "tfidf": (0.0, 1.0),
+    "semantic": (0.7, 0.3),
+    "hybrid": (0.7, 0.3),
+}
+
+# Minimum number of ANN neighbours re-ranked per query when an ANN backend is used
+ANN_CANDIDATES = int(os.environ.get("ANN_CANDIDATES", 200))
+
+
+def load_catalog(path: str = CATALOG_PATH) -> list[dict]:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+class JobIndex:
+    """Job catalog plus its embedding matrix and fitted TF-IDF matrix."""
+
+    def __init__(self, jobs: list[dict] | None = None, model_name: str = DEFAULT_MODEL,
+                 store: JobEmbeddingStore | None = None, encoder=None, ann_backend: str | None = None,
+                 ann_params: dict | None = None, ann_candidates: int = ANN_CANDIDATES,
+                 embedding_dtype: str = DEFAULT_DTYPE, pca_dim: int | None = DEFAULT_PCA_DIM,
+                 tfidf_store: JobTfidfStore | None = None):
+        self.model_name = model_name
+        self.embedding_dtype = embedding_dtype
+        self.pca_dim = pca_dim
+        self.store = store or get_job_store(model_name)
+        self.encoder = encoder or self.store.encoder
+        self.tfidf_store = tfidf_store or get_tfidf_store()
+        # None means the ANN_BACKEND / ANN_PARAMS settings
+        self.ann_backend = ann_backend or DEFAULT_ANN_BACKEND
+        self.ann_params = ann_params if ann_backend else DEFAULT_ANN_PARAMS
+        self.ann_candidates = ann_candidates
+        self._jobs = list(jobs or [])
+        self._lock = threading.Lock()
+        self._embeddings = None  # (jobs, stored matrix, compressed matrix used for scoring)
+        self._tfidf = None  # (jobs, vectorizer, inverted index over the sparse matrix)
+        self._ann = None  # (jobs, nearest-neighbour index)
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    @property
+    def jobs(self) -> list[dict]:
+        return list(self._jobs)
+
+    @staticmethod
+    def _job_id(job: dict) -> str | None:
+        # Jobs without an "id" cannot be replaced or removed by id
+        return str(job["id"]) if "id" in job else None
+
+    # ------------- catalog updates -------------
+    def add_jobs(self, jobs: list[dict]) -> None:
+        """Add jobs, replacing existing jobs with the same id."""
+        with self._lock:
+            incoming = {str(job["id"]): job for job in jobs if "id" in job}
+            kept = [job for job in self._jobs if self._job_id(job) not in incoming]
+            self._jobs = kept + [job for job in jobs if "id" not in job or incoming.get(str(job["id"])) is job]
+            self._invalidate()
+
+    def remove_jobs(self, job_ids: list) -> int:
+        """Remove jobs by id; returns how many were removed. Jobs without an id are kept."""
+        ids = {str(job_id) for job_id in job_ids}
+        with self._lock:
+            before = len(self._jobs)
+            self._jobs = [job for job in self._jobs if self._job_id(job) not in ids]
+            self._invalidate()
+            return before - len(self._jobs)
+
+    def _invalidate(self) -> None:
+        self._embeddings = None
+        self._tfidf = None
+        self._ann = None
+
+    # ------------- derived state -------------
+    # Each derived state records the job list it was built from; updates swap
+    # in a new list, so a query can tell whether its pieces belong together.
+    def _texts(self, jobs: list[dict]) -> list[str]:
+        return [job.get("description", "") for job in jobs]
+
+    def _get_embeddings(self):
+        state = self._embeddings
+        if state is None:
+            with self._lock:
+                state = self._embeddings
+                if state is None:
+                    jobs = self._jobs
+                    matrix = self.store.embed(self._texts(jobs))
+                    compressed = CompressedEmbeddings(matrix, self.embedding_dtype, self.pca_dim)
+                    state = self._embeddings = (jobs, matrix, compressed)
+        return state
+
+    def _get_tfidf(self):
+        state = self._tfidf
+        if state is None:
+            with self._lock:
+                state = self._tfidf
+                if state is None:
+                    jobs = self._jobs
+                    vectorizer, postings = None, None
+                    if jobs:
+                        vectorizer, matrix = self.tfidf_store.fit(self._texts(jobs))
+                        postings = InvertedIndex(matrix)
+                    state = self._tfidf = (jobs, vectorizer, postings)
+        return state
+
+    def warmup(self) -> None:
+        """Build the embedding matrix, ANN index and TF-IDF matrix up front."""
+        self._get_embeddings()
+        if self.ann_backend != "exact":
+            self._get_ann()
+        self._get_tfidf()
+
+    def _get_ann(self):
+        state = self._ann
+        if state is None:
+            jobs, matrix, _ = self._get_embeddings()
+            with self._lock:
+                state = self._ann
+                if state is None or state[0] is not jobs:
+                    state = self._ann = (jobs, build_ann_index(matrix, self.ann_backend, self.ann_params))
+        return state
+
+    def stats(self) -> dict:
+        embeddings = self._embeddings
+        return {
+            "jobs": len(self._jobs),
+            "ann_backend": self.ann_backend,
+            "embedding_dtype": self.embedding_dtype,
+            "pca_dim": self.pca_dim,
+            "embedding_bytes": embeddings[2].nbytes if embeddings else None,
+            "tfidf": self.tfidf_store.stats(),
+        }
+
+    # ------------- scoring -------------
+    def _snapshot(self, semantic: bool, ann: bool = False):
+        """TF-IDF, embedding and ANN state built from the same job list."""
+        while True:
+            tfidf_state = self._get_tfidf()
+            embedding_state = self._get_embeddings() if semantic else None
+            ann_state = self._get_ann() if ann else None
+            jobs = tfidf_state[0]
+            if all(state is None or state[0] is jobs for state in (embedding_state, ann_state)):
+                return tfidf_state, embedding_state, ann_state
+
+    def _encode(self, resume_text: str) -> np.ndarray:
+        return np.asarray(self.encoder.encode([resume_text]), dtype=np.float32)[0]
+
+    @staticmethod
+    def _semantic(state, query: np.ndarray, rows: np.ndarray | None = None) -> np.ndarray:
+        # Scored against the compressed matrix (float32 unless configured otherwise)
+        return state[2].scores(query, rows)
+
+    @staticmethod
+    def _tfidf_cosine(state, resume_text: str, rows: np.ndarray | None = None) -> np.ndarray:
+        jobs, vectorizer, postings = state
+        if not jobs:
+            return np.zeros(0)
+        return postings.scores(vectorizer.transform([resume_text]), rows)
+
+    @staticmethod
+    def _tfidf_top(state, resume_text: str, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """Best ``k`` jobs by TF-IDF alone, padded with zero-score jobs in catalog order."""
+        jobs, vectorizer, postings = state
+        if not jobs:
+            return np.zeros(0, dtype=np.int64), np.zeros(0)
+        rows, scores = postings.search(vectorizer.transform([resume_text]), k)
+        missing = min(k, len(jobs)) - len(rows)
+        if missing > 0:
+            # Same order as a full ranking: matching jobs first, then the rest by position
+            padding = np.setdiff1d(np.arange(len(rows) + missing), rows)[:missing]
+            rows, scores = np.concatenate([rows, padding]), np.concatenate([scores, np.zeros(missing)])
+        return rows, scores
+
+    def scores(self, resume_text: str, semantic: bool = True) -> tuple[list[dict], np.ndarray | None, np.ndarray]:
+        """
+        Score a resume text against every job (exact search).
+
+        Returns ``(jobs, semantic_scores, tfidf_scores)`` taken from one
+        consistent snapshot of the catalog; semantic_scores is None when
+        ``semantic`` is False (no embedding model needed).
+        """
+        tfidf_state, embedding_state, _ = self._snapshot(semantic)
+        semantic_scores = self._semantic(embedding_state, self._encode(resume_text)) if semantic else None
+        return tfidf_state[0], semantic_scores, self._tfidf_cosine(tfidf_state, resume_text)
+
+    def _candidate_scores(self, resume_text: str, top_n: int):
+        """
+        Approximate variant of ``scores`` for the ANN backends: semantic scores
+        are computed exactly, but only for the ANN's nearest jobs plus the best
+        TF-IDF matches. Returns ``(jobs, rows, semantic, tfidf)`` for those rows.
+        """
+        tfidf_state, embedding_state, (_, ann) = self._snapshot(semantic=True, ann=True)
+        query = self._encode(resume_text)
+        k = max(top_n * 4, self.ann_candidates)
+
+        nearest, _ = ann.search(query, k)
+        best_tfidf, _ = tfidf_state[2].search(tfidf_state[1].transform([resume_text]), k)
+        rows = np.union1d(nearest, best_tfidf)
+        semantic = self._semantic(embedding_state, query, rows)
+        return tfidf_state[0], rows, semantic, self._tfidf_cosine(tfidf_state, resume_text, rows)
+
+    def query(self, resume_skills: list[str], top_n: int | None = 5, mode: str = "hybrid") -> list[dict]:
+        """
+        Rank jobs for a resume.
+
+        Returns up to ``top_n`` (all when None) dicts with the job and its
+        score / semantic_score / tfidf_score, best first. ``mode`` is one of
+        QUERY_MODES; "tfidf" does not touch the embedding model. With an ANN
+        backend configured, semantic modes rank only the ANN candidates;
+        "tfidf" with a ``top_n`` reads only the postings of the resume terms.
+        """
+        if mode not in QUERY_MODES:
+            raise ValueError(f"mode must be one of {list(QUERY_MODES)}")
+        semantic_weight, tfidf_weight = QUERY_MODES[mode]
+        resume_text = " ".join(resume_skills)
+        if not semantic_weight and top_n is not None:
+            tfidf_state, _, _ = self._snapshot(semantic=False)
+            rows, tfidf = self._tfidf_top(tfidf_state, resume_text, top_n)
+            jobs, semantic = tfidf_state[0], None
+        elif semantic_weight and top_n is not None and self.ann_backend != "exact":
+            jobs, rows, semantic, tfidf = self._candidate_scores(resume_text, top_n)
+        else:
+            jobs, semantic, tfidf = self.scores(resume_text, semantic=bool(semantic_weight))
+            rows = np.arange(len(jobs))
+        scores = tfidf_weight * tfidf
+        if semantic is not None:
+            scores = scores + semantic_weight * semantic
+
+        order = top_k(scores, len(scores) if top_n is None else top_n)
+        return [{
+            "job": jobs[rows[i]],
+            "score": float(scores[i]),
+            "semantic_score": None if semantic is None else float(semantic[i]),
+            "tfidf_score": float(tfidf[i]),
+        } for i in order]
+
+
+_default_index = None
+_default_index_lock = threading.Lock()
+
+
+def get_job_index() -> JobIndex:
+    """Process-wide index over the bundled job catalog, loaded on first use."""
+    global _default_index
+    if _default_index is None:
+        with _default_index_lock:
+            if _default_index is None:
+                _default_index = JobIndex(load_catalog())
+    return _default_index
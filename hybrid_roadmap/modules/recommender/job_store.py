@@ -0,0 +1,140 @@
+"""
+Persistent job embedding store.
+
+Job description embeddings are computed once and saved as a float32 ``.npy``
+matrix next to a JSON manifest holding the sha256 of each row's text. Requests
+read the matrix through a memory map, so the catalog is neither re-encoded nor
+copied into every worker. When the catalog changes only added or edited job
+texts are encoded; rows for unchanged texts are reused and the files are
+replaced atomically.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+
+import numpy as np
+
+from .encoders import get_encoder
+from .model_registry import DEFAULT_MODEL
+
+DEFAULT_STORE_DIR = os.environ.get(
+    "JOB_EMBEDDINGS_DIR",
+    os.path.join(os.path.dirname(__file__), "..", "..", "data", "job_embeddings"),
+)
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class JobEmbeddingStore:
+    """float32 job embeddings on disk, one row per job text, reused across restarts."""
+
+    def __init__(self, directory: str = DEFAULT_STORE_DIR, model_name: str = DEFAULT_MODEL, encoder=None):
+        self.directory = directory
+        self.encoder = encoder or get_encoder(model_name)
+        # Keyed by backend and model: vectors from different encoders never mix
+        self.model_name = self.encoder.name
+        stem = re.sub(r"[^A-Za-z0-9_.-]+", "_", self.model_name)
+        self.matrix_path = os.path.join(directory, f"{stem}.npy")
+        self.manifest_path = os.path.join(directory, f"{stem}.json")
+        self._matrix = None
+        self._hashes: list[str] = []
+        self._lock = threading.Lock()
+        self.encoded = 0
+        self.reused = 0
+
+    def _load(self) -> None:
+        try:
+            with open(self.manifest_path, "r") as f:
+                manifest = json.load(f)
+            matrix = np.load(self.matrix_path, mmap_mode="r")
+        except (OSError, ValueError):
+            return
+        if manifest.get("model") != self.model_name or len(manifest.get("hashes", [])) != len(matrix):
+            print(f"⚠️ Ignoring inconsistent job embedding store at {self.directory}")
+            return
+        self._matrix = matrix
+        self._hashes = manifest["hashes"]
+
+    def _save(self, matrix: np.ndarray, hashes: list[str]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        # Write both files under temporary names first so readers never see a
+        # matrix that does not match its manifest
+        tmp_matrix = f"{self.matrix_path}.{os.getpid()}.tmp"
+        tmp_manifest = f"{self.manifest_path}.{os.getpid()}.tmp"
+        with open(tmp_matrix, "wb") as f:
+            np.save(f, matrix)
+        with open(tmp_manifest, "w") as f:
+            json.dump({"model": self.model_name, "dim": int(matrix.shape[1]), "hashes": hashes}, f)
+        os.replace(tmp_matrix, self.matrix_path)
+        os.replace(tmp_manifest, self.manifest_path)
+
+    def embed(self, texts: list[str]) -> np.ndarray:
+        """
+        Return the (len(texts), dim) float32 embedding matrix for ``texts``.
+
+        When the stored rows already match ``texts`` this is the memory-mapped
+        file itself; otherwise missing texts are encoded and the store rewritten.
+        """
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        hashes = [_text_hash(text) for text in texts]
+        with self._lock:
+            if self._matrix is None:
+                self._load()
+            if self._matrix is not None and hashes == self._hashes:
+                self.reused += len(hashes)
+                return self._matrix
+
+            rows = {}
+            if self._matrix is not None:
+                rows = {h: i for i, h in enumerate(self._hashes)}
+            missing = [i for i, h in enumerate(hashes) if h not in rows]
+            new_vectors = None
+            if missing:
+                new_vectors = np.asarray(self.encoder.encode([texts[i] for i in missing]), dtype=np.float32)
+
+            dim = new_vectors.shape[1] if new_vectors is not None else self._matrix.shape[1]
+            matrix = np.empty((len(texts), dim), dtype=np.float32)
+            for i, h in enumerate(hashes):
+                if h in rows:
+                    matrix[i] = self._matrix[rows[h]]
+            if missing:
+                matrix[missing] = new_vectors
+            self.encoded += len(missing)
+            self.reused += len(texts) - len(missing)
+
+            try:
+                self._save(matrix, hashes)
+                self._matrix = np.load(self.matrix_path, mmap_mode="r")
+            except OSError as e:
+                print(f"⚠️ Could not persist job embeddings to {self.directory}: {e}")
+                self._matrix = matrix
+            self._hashes = hashes
+            return self._matrix
+
+    def stats(self) -> dict:
+        return {
+            "model": self.model_name,
+            "jobs": len(self._hashes),
+            "encoded": self.encoded,
+            "reused": self.reused,
+        }
+
+
+_stores: dict[str, JobEmbeddingStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_job_store(model_name: str = DEFAULT_MODEL) -> JobEmbeddingStore:
+    """Return the process-wide job embedding store for ``model_name`` on the configured encoder."""
+    encoder = get_encoder(model_name)
+    store = _stores.get(encoder.name)
+    if store is None:
+        with _stores_lock:
+            store = _stores.setdefault(encoder.name, JobEmbeddingStore(encoder=encoder))
+    return store
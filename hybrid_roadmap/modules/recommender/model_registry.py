@@ -0,0 +1,44 @@
+"""
+Process-wide registry of sentence-transformer models.
+
+Every recommender and matcher asks the registry for its model instead of
+constructing its own, so each model is loaded once per process no matter how
+many modules or matcher instances use it. Loading is guarded by a lock, which
+makes first use safe under threaded Flask / gthread gunicorn workers.
+
+Nothing heavy happens at import time: sentence_transformers (and with it
+torch) is imported when a model is first requested. Call ``warmup()`` to pay
+that cost up front, e.g. from a gunicorn worker hook.
+"""
+
+import threading
+
+DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+_models: dict = {}
+_lock = threading.Lock()
+
+
+def get_model(name: str = DEFAULT_MODEL):
+    """Return the shared SentenceTransformer for ``name``, loading it on first use."""
+    model = _models.get(name)
+    if model is None:
+        with _lock:
+            model = _models.get(name)
+            if model is None:
+                from sentence_transformers import SentenceTransformer
+
+                model = SentenceTransformer(name)
+                _models[name] = model
+    return model
+
+
+def loaded_models() -> list[str]:
+    """Names of the models currently held in memory."""
+    return list(_models)
+
+
+def warmup(names: list[str] | None = None) -> None:
+    """Load the given models (default: the standard one) and run one encode each."""
+    for name in names or [DEFAULT_MODEL]:
+        get_model(name).encode(["warmup"])
@@ -0,0 +1,116 @@
+"""
+Compressed job embedding matrices.
+
+A catalog's embeddings can be held as float32 (as stored), float16, or int8
+with one float32 scale per vector, optionally after projecting onto the top
+principal components. Cosine scores are computed directly against the
+compressed matrix, block by block, so the full-precision matrix never has to
+stay resident in the worker.
+
+Configured with EMBEDDING_DTYPE (float32 / float16 / int8, default float32)
+and EMBEDDING_PCA_DIM (0 = no projection).
+"""
+
+import os
+
+import numpy as np
+
+EMBEDDING_DTYPES = ("float32", "float16", "int8")
+
+DEFAULT_DTYPE = os.environ.get("EMBEDDING_DTYPE", "float32")
+DEFAULT_PCA_DIM = int(os.environ.get("EMBEDDING_PCA_DIM", 0)) or None
+
+
+class PCAProjection:
+    """Mean-centred projection onto the top principal components of a sample."""
+
+    def __init__(self, vectors: np.ndarray, dim: int, sample_size: int = 20000, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        rows = rng.choice(len(vectors), min(len(vectors), sample_size), replace=False)
+        sample = np.asarray(vectors[np.sort(rows)], dtype=np.float32)
+        self.mean = sample.mean(axis=0)
+        _, _, vt = np.linalg.svd(sample - self.mean, full_matrices=False)
+        self.components = np.ascontiguousarray(vt[:dim], dtype=np.float32)
+
+    def transform(self, vectors: np.ndarray) -> np.ndarray:
+        return (np.asarray(vectors, dtype=np.float32) - self.mean) @ self.components.T
+
+
+class CompressedEmbeddings:
+    """Job embedding matrix in a chosen precision, scored by cosine similarity."""
+
+    def __init__(self, vectors: np.ndarray, dtype: str = DEFAULT_DTYPE, pca_dim: int | None = DEFAULT_PCA_DIM,
+                 block_rows: int = 2048):
+        if dtype not in EMBEDDING_DTYPES:
+            raise ValueError(f"dtype must be one of {EMBEDDING_DTYPES}")
+        self.dtype = dtype
+        self.block_rows = block_rows
+        self.projection = None
+        self.scales = None
+
+        if dtype == "float32" and not pca_dim:
+            # Keep the (possibly memory-mapped) matrix as is
+            self.codes = vectors
+            self.norms = np.linalg.norm(vectors, axis=1) if len(vectors) else np.zeros(0, dtype=np.float32)
+            return
+
+        if pca_dim and len(vectors) and pca_dim < vectors.shape[1]:
+            self.projection = PCAProjection(vectors, pca_dim)
+        dim = self.projection.components.shape[0] if self.projection else vectors.shape[1]
+        storage = np.int8 if dtype == "int8" else np.dtype(dtype)
+        self.codes = np.empty((len(vectors), dim), dtype=storage)
+        if dtype == "int8":
+            self.scales = np.empty(len(vectors), dtype=np.float32)
+        # Rows are unit-normalized before quantizing, so scores need no norms
+        self.norms = None
+        for start in range(0, len(vectors), block_rows):
+            block = np.asarray(vectors[start:start + block_rows], dtype=np.float32)
+            if self.projection:
+                block = self.projection.transform(block)
+            lengths = np.linalg.norm(block, axis=1, keepdims=True)
+            lengths[lengths == 0] = 1.0
+            block = block / lengths
+            if dtype == "int8":
+                scale = np.abs(block).max(axis=1) / 127.0
+                scale[scale == 0] = 1.0
+                self.codes[start:start + len(block)] = np.round(block / scale[:, None])
+                self.scales[start:start + len(block)] = scale
+            else:
+                self.codes[start:start + len(block)] = block
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def nbytes(self) -> int:
+        total = self.codes.nbytes
+        for extra in (self.scales, self.norms):
+            if extra is not None:
+                total += extra.nbytes
+        if self.projection:
+            total += self.projection.components.nbytes + self.projection.mean.nbytes
+        return total
+
+    def scores(self, query: np.ndarray, rows: np.ndarray | None = None) -> np.ndarray:
+        """Cosine similarity of ``query`` (a full-size embedding) with every row, or with ``rows``."""
+        query = np.asarray(query, dtype=np.float32)
+        if self.projection:
+            query = self.projection.transform(query[None, :])[0]
+        query_norm = float(np.linalg.norm(query))
+        count = len(self.codes) if rows is None else len(rows)
+        if not count or query_norm == 0:
+            return np.zeros(count)
+        query = query / query_norm
+
+        out = np.empty(count, dtype=np.float32)
+        for start in range(0, count, self.block_rows):
+            select = slice(start, start + self.block_rows) if rows is None else rows[start:start + self.block_rows]
+            block = np.asarray(self.codes[select], dtype=np.float32) @ query
+            if self.scales is not None:
+                block *= self.scales[select]
+            if self.norms is not None:
+                norms = self.norms[select]
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    block = np.where(norms > 0, block / norms, 0.0)
+            out[start:start + len(block)] = block
+        return out.astype(np.float64)
@@ -0,0 +1,119 @@
+"""
+Per-skill embedding cache.
+
+Resume and JD skill lists are drawn from a fixed taxonomy of a few hundred
+skills, so instead of encoding the joined skill string on every request we
+embed each taxonomy skill once and build a list's vector as the (weighted)
+mean of its skills' unit vectors. Skills outside the taxonomy are encoded on
+first sight and kept in a bounded LRU.
+"""
+
+import os
+import threading
+
+import numpy as np
+
+from modules.parsing.taxonomy import get_taxonomy
+from modules.utils.cache import LRUCache
+from .encoders import get_encoder
+from .model_registry import DEFAULT_MODEL
+
+DEFAULT_SKILLS_CSV = os.path.join(os.path.dirname(__file__), "..", "..", "data", "skills.csv")
+
+
+def _key(skill: str) -> str:
+    # all-MiniLM-L6-v2 is uncased, so case variants share one vector
+    return skill.lower().strip()
+
+
+class SkillEmbeddingCache:
+    """Unit-normalized embeddings for taxonomy skills, computed once per model and taxonomy."""
+
+    def __init__(self, model_name: str = DEFAULT_MODEL, skills_csv_path: str = DEFAULT_SKILLS_CSV,
+                 max_extra_skills: int = 10_000, encoder=None):
+        self.model_name = model_name
+        self.encoder = encoder or get_encoder(model_name)
+        self.skills_csv_path = skills_csv_path
+        self._taxonomy_version = None
+        self._vectors: dict[str, np.ndarray] = {}
+        self._extra = LRUCache(max_extra_skills)
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> str:
+        """Encoder and taxonomy the cached vectors were computed for."""
+        self._ensure_taxonomy()
+        return f"{self.encoder.name}:{self._taxonomy_version}"
+
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        vectors = np.asarray(self.encoder.encode(texts), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vectors / norms
+
+    def _ensure_taxonomy(self) -> None:
+        taxonomy = get_taxonomy(self.skills_csv_path)
+        if taxonomy.version == self._taxonomy_version:
+            return
+        with self._lock:
+            if taxonomy.version == self._taxonomy_version:
+                return
+            keys = sorted({_key(skill) for skill in taxonomy.skills if _key(skill)})
+            vectors = self._encode(keys) if keys else []
+            self._vectors = dict(zip(keys, vectors))
+            self._taxonomy_version = taxonomy.version
+
+    def vectors(self, skills: list[str]) -> np.ndarray:
+        """Return one unit vector per skill (rows in input order)."""
+        self._ensure_taxonomy()
+        keys = [_key(skill) for skill in skills]
+        found: dict[str, np.ndarray] = {}
+        missing = []
+        for key in keys:
+            if key in found:
+                continue
+            vector = self._vectors.get(key)
+            if vector is None:
+                vector = self._extra.get(key)
+            if vector is None:
+                missing.append(key)
+            else:
+                found[key] = vector
+        if missing:
+            unique = list(dict.fromkeys(missing))
+            for key, vector in zip(unique, self._encode(unique)):
+                self._extra.put(key, vector)
+                found[key] = vector
+        if not keys:
+            return np.zeros((0, 0), dtype=np.float32)
+        return np.stack([found[key] for key in keys])
+
+    def compose(self, skills: list[str], weights: dict[str, float] | None = None) -> np.ndarray:
+        """
+        Vector for a whole skill list: the mean of its skills' unit vectors,
+        weighted by ``weights`` (case-insensitive, default weight 1).
+        """
+        skills = [skill for skill in skills if isinstance(skill, str) and _key(skill)]
+        if not skills:
+            return np.zeros(0, dtype=np.float32)
+        vectors = self.vectors(skills)
+        if weights:
+            lookup = {_key(skill): float(w) for skill, w in weights.items()}
+            w = np.array([lookup.get(_key(skill), 1.0) for skill in skills], dtype=np.float32)
+        else:
+            w = np.ones(len(skills), dtype=np.float32)
+        return (w[:, None] * vectors).sum(axis=0) / max(float(w.sum()), 1e-12)
+
+
+_caches: dict[str, SkillEmbeddingCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_skill_embeddings(model_name: str = DEFAULT_MODEL) -> SkillEmbeddingCache:
+    """Return the process-wide skill embedding cache for ``model_name`` on the configured encoder."""
+    encoder = get_encoder(model_name)
+    cache = _caches.get(encoder.name)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.setdefault(encoder.name, SkillEmbeddingCache(model_name, encoder=encoder))
+    return cache
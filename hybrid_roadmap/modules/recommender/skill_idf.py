@@ -0,0 +1,105 @@
+"""
+Global IDF weights for resume / JD skill similarity.
+
+Comparing two skill lists with a TfidfVectorizer fitted on just those two
+documents yields IDF values that only say whether a term appears in one or
+both lists. SkillIdf computes document frequencies once, over the job
+catalog descriptions plus every taxonomy skill as its own document. A
+comparison then only tokenizes the two texts and takes the sparse dot
+product of their L2-normalized TF-IDF vectors.
+
+Tokenization and IDF smoothing match TfidfVectorizer's defaults
+(lower-cased ``\\b\\w\\w+\\b`` tokens, ``ln((1 + n) / (1 + df)) + 1``).
+Terms that appear in no document get the maximum IDF.
+"""
+
+import hashlib
+import math
+import re
+import threading
+from collections import Counter
+
+from modules.parsing.taxonomy import get_taxonomy
+from .job_index import load_catalog
+from .skill_embeddings import DEFAULT_SKILLS_CSV
+
+TOKEN_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class SkillIdf:
+    """Term -> IDF over the job catalog and skill taxonomy, rebuilt when the taxonomy changes."""
+
+    def __init__(self, job_texts: list[str] | None = None, skills_csv_path: str = DEFAULT_SKILLS_CSV):
+        self.skills_csv_path = skills_csv_path
+        self._job_texts = job_texts
+        self._taxonomy_version = None
+        self._state = None  # (idf dict, idf of unseen terms, version)
+        self._lock = threading.Lock()
+
+    def _build(self, taxonomy) -> tuple[dict[str, float], float, str]:
+        job_texts = self._job_texts
+        if job_texts is None:
+            job_texts = [job.get("description", "") for job in load_catalog()]
+        documents = list(job_texts) + list(taxonomy.skills)
+        df = Counter()
+        for document in documents:
+            df.update(set(tokenize(document)))
+        n = len(documents)
+        idf = {term: math.log((1 + n) / (1 + count)) + 1 for term, count in df.items()}
+        corpus = hashlib.sha256("\n".join(job_texts).encode("utf-8")).hexdigest()[:16]
+        return idf, math.log(1 + n) + 1, f"{corpus}:{taxonomy.version}"
+
+    def _get_state(self):
+        taxonomy = get_taxonomy(self.skills_csv_path)
+        state = self._state
+        if state is None or self._taxonomy_version != taxonomy.version:
+            with self._lock:
+                state = self._state
+                if state is None or self._taxonomy_version != taxonomy.version:
+                    state = self._state = self._build(taxonomy)
+                    self._taxonomy_version = taxonomy.version
+        return state
+
+    @property
+    def version(self) -> str:
+        """Job corpus and taxonomy the IDF weights were computed from."""
+        return self._get_state()[2]
+
+    def idf(self, term: str) -> float:
+        idf, unseen, _ = self._get_state()
+        return idf.get(term, unseen)
+
+    def vector(self, text: str) -> dict[str, float]:
+        """L2-normalized TF-IDF weights of ``text``'s terms."""
+        idf, unseen, _ = self._get_state()
+        weights = {term: count * idf.get(term, unseen) for term, count in Counter(tokenize(text)).items()}
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        return {term: w / norm for term, w in weights.items()} if norm else {}
+
+    @staticmethod
+    def dot(a: dict[str, float], b: dict[str, float]) -> float:
+        if len(a) > len(b):
+            a, b = b, a
+        return sum(w * b[term] for term, w in a.items() if term in b)
+
+    def similarity(self, text_a: str, text_b: str) -> float:
+        """Cosine similarity of the two texts' TF-IDF vectors under the global IDF."""
+        return self.dot(self.vector(text_a), self.vector(text_b))
+
+
+_default = None
+_default_lock = threading.Lock()
+
+
+def get_skill_idf() -> SkillIdf:
+    """Process-wide IDF over the bundled job catalog and the skills CSV."""
+    global _default
+    if _default is None:
+        with _default_lock:
+            if _default is None:
+                _default = SkillIdf()
+    return _default
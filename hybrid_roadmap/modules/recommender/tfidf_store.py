@@ -0,0 +1,129 @@
+"""
+Job-corpus TF-IDF, fitted once and persisted.
+
+``TFIDF_CONFIG`` is the only TF-IDF setting the job recommenders use. The
+vectorizer is fitted on the job descriptions alone and is saved to disk with
+the job matrix. The manifest records the corpus hash, the config and the
+scikit-learn version. Any later process with the same catalog loads both
+files instead of refitting, and a request only transforms the resume text.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+
+DEFAULT_STORE_DIR = os.environ.get(
+    "JOB_TFIDF_DIR",
+    os.path.join(os.path.dirname(__file__), "..", "..", "data", "job_tfidf"),
+)
+
+# English stop words are dropped; the vocabulary is not capped so that rare
+# skills in a large catalog keep their own terms
+TFIDF_CONFIG = {"lowercase": True, "stop_words": "english"}
+
+
+def make_tfidf_vectorizer():
+    """Unfitted vectorizer with the shared job TF-IDF settings."""
+    # scikit-learn is imported on first use to keep service startup fast
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    return TfidfVectorizer(**TFIDF_CONFIG)
+
+
+def _corpus_hash(texts: list[str]) -> str:
+    digest = hashlib.sha256()
+    for text in texts:
+        digest.update(hashlib.sha256(text.encode("utf-8")).digest())
+    return digest.hexdigest()
+
+
+class JobTfidfStore:
+    """Fitted job TF-IDF vectorizer and matrix on disk, reused while the corpus is unchanged."""
+
+    def __init__(self, directory: str = DEFAULT_STORE_DIR):
+        self.directory = directory
+        self.vectorizer_path = os.path.join(directory, "vectorizer.pkl")
+        self.matrix_path = os.path.join(directory, "matrix.npz")
+        self.manifest_path = os.path.join(directory, "manifest.json")
+        self._lock = threading.Lock()
+        self.fits = 0
+        self.loads = 0
+
+    def _manifest(self, texts: list[str]) -> dict:
+        import sklearn
+
+        return {
+            "corpus": _corpus_hash(texts),
+            "jobs": len(texts),
+            "config": TFIDF_CONFIG,
+            "sklearn": sklearn.__version__,
+        }
+
+    def _load(self, manifest: dict):
+        from scipy import sparse
+
+        try:
+            with open(self.manifest_path, "r") as f:
+                if json.load(f) != manifest:
+                    return None
+            # Only files this store wrote itself are unpickled
+            with open(self.vectorizer_path, "rb") as f:
+                vectorizer = pickle.load(f)
+            matrix = sparse.load_npz(self.matrix_path)
+        except (OSError, ValueError, pickle.UnpicklingError, EOFError):
+            return None
+        return vectorizer, matrix
+
+    def _save(self, manifest: dict, vectorizer, matrix) -> None:
+        from scipy import sparse
+
+        os.makedirs(self.directory, exist_ok=True)
+        suffix = f".{os.getpid()}.tmp"
+        with open(self.vectorizer_path + suffix, "wb") as f:
+            pickle.dump(vectorizer, f)
+        with open(self.matrix_path + suffix, "wb") as f:
+            sparse.save_npz(f, matrix)
+        with open(self.manifest_path + suffix, "w") as f:
+            json.dump(manifest, f)
+        # Manifest last: until it is replaced, the old manifest no longer matches
+        # the new corpus, so a concurrent reader refits instead of mixing files
+        os.replace(self.vectorizer_path + suffix, self.vectorizer_path)
+        os.replace(self.matrix_path + suffix, self.matrix_path)
+        os.replace(self.manifest_path + suffix, self.manifest_path)
+
+    def fit(self, texts: list[str]):
+        """Return ``(vectorizer, matrix)`` for ``texts``, loading from disk when possible."""
+        manifest = self._manifest(texts)
+        with self._lock:
+            loaded = self._load(manifest)
+            if loaded is not None:
+                self.loads += 1
+                return loaded
+            vectorizer = make_tfidf_vectorizer()
+            # Column-major, so each term's postings are contiguous for InvertedIndex
+            matrix = vectorizer.fit_transform(texts).tocsc()
+            self.fits += 1
+            try:
+                self._save(manifest, vectorizer, matrix)
+            except OSError as e:
+                print(f"⚠️ Could not persist job TF-IDF to {self.directory}: {e}")
+            return vectorizer, matrix
+
+    def stats(self) -> dict:
+        return {"config": TFIDF_CONFIG, "fits": self.fits, "loads": self.loads}
+
+
+_default_store = None
+_default_store_lock = threading.Lock()
+
+
+def get_tfidf_store() -> JobTfidfStore:
+    """Process-wide job TF-IDF store."""
+    global _default_store
+    if _default_store is None:
+        with _default_store_lock:
+            if _default_store is None:
+                _default_store = JobTfidfStore()
+    return _default_store
@@ -1,62 +1,104 @@
 import os
 import re
 import json
+import importlib.util
+import threading
 
+# The google-genai SDK takes ~0.5s to import, so only check that it is
+# installed here and create the client on first use.
 try:
-    from google import genai
-    from google.genai import errors
-    # configure with API key if provided
-    API_KEY = os.environ.get("GEMINI_API_KEY")
-    if API_KEY:
-        client = genai.Client(api_key=API_KEY)
-    else:
-        client = None
-    GEMINI_AVAILABLE = True
-except Exception:
-    client = None
-    errors = None
+    GEMINI_AVAILABLE = importlib.util.find_spec("google.genai") is not None
+except ImportError:
     GEMINI_AVAILABLE = False
 
+client = None
+_client_lock = threading.Lock()
+
+
+def _get_client():
+    """Return the shared Gemini client, or None if no API key is configured."""
+    global client
+    if client is None and GEMINI_AVAILABLE:
+        with _client_lock:
+            if client is None:
+                # configure with API key if provided
+                api_key = os.environ.get("GEMINI_API_KEY")
+                if api_key:
+                    try:
+                        from google import genai
+                        client = genai.Client(api_key=api_key)
+                    except Exception as e:
+                        print(f"⚠️  Could not create Gemini client: {e}")
+    return client
+
 
 def clean_json(text: str):
     match = re.search(r"\{[\s\S]*\}|\[[\s\S]*\]", text, re.DOTALL)
     return match.group(0) if match else text
 
 
+def _subtopics_prompt(skill: str) -> str:
+    return (
+        f"Generate a list of 5 to 8 MOST IMPORTANT subtopics required to master '{skill}'."
+        " Return ONLY a valid JSON ARRAY of strings, nothing else."
+        " Example: [\"Introduction\", \"Basics\", \"Advanced Concepts\"]"
+    )
+
+
+def _parse_subtopics(text: str):
+    cleaned = clean_json(text)
+    try:
+        return json.loads(cleaned)
+    except Exception:
+        lines = [l.strip('-• \n\r ') for l in cleaned.splitlines() if l.strip()]
+        return lines[:8]
+
+
+def _generation_error(e: Exception) -> RuntimeError:
+    error_msg = str(e)
+    if "429" in error_msg or "RESOURCE_EXHAUSTED" in error_msg:
+        print(f"⚠️  Gemini API quota exceeded. Please enable billing.")
+        return RuntimeError(f"Gemini quota exceeded: {error_msg[:100]}")
+    return RuntimeError(f"Gemini generation failed: {error_msg[:100]}")
+
+
 def generate_subtopics(skill: str):
     """
     Use Google Gemini to generate 5-8 subtopics for a skill.
     """
+    client = _get_client()
     if not GEMINI_AVAILABLE or not client:
         raise RuntimeError("Gemini client not available")
 
-    prompt = (
-        f"Generate a list of 5 to 8 MOST IMPORTANT subtopics required to master '{skill}'."
-        " Return ONLY a valid JSON ARRAY of strings, nothing else."
-        " Example: [\"Introduction\", \"Basics\", \"Advanced Concepts\"]"
-    )
-
     try:
         model_name = os.environ.get('GEMINI_MODEL', 'gemini-2.0-flash')
         response = client.models.generate_content(
             model=model_name,
-            contents=prompt
+            contents=_subtopics_prompt(skill)
         )
-        text = response.text
+        return _parse_subtopics(response.text)
+    except Exception as e:
+        raise _generation_error(e)
 
-        cleaned = clean_json(text)
-        try:
-            return json.loads(cleaned)
-        except Exception:
-            lines = [l.strip('-• \n\r ') for l in cleaned.splitlines() if l.strip()]
-            return lines[:8]
+
+async def generate_subtopics_async(skill: str):
+    """
+    ``generate_subtopics`` on the SDK's async client, so the ASGI app can
+    await the request instead of holding a worker thread for it.
+    """
+    client = _get_client()
+    if not GEMINI_AVAILABLE or not client:
+        raise RuntimeError("Gemini client not available")
+
+    try:
+        model_name = os.environ.get('GEMINI_MODEL', 'gemini-2.0-flash')
+        response = await client.aio.models.generate_content(
+            model=model_name,
+            contents=_subtopics_prompt(skill)
+        )
+        return _parse_subtopics(response.text)
     except Exception as e:
-        error_msg = str(e)
-        if "429" in error_msg or "RESOURCE_EXHAUSTED" in error_msg:
-            print(f"⚠️  Gemini API quota exceeded. Please enable billing.")
-            raise RuntimeError(f"Gemini quota exceeded: {error_msg[:100]}")
-        else:
-            raise RuntimeError(f"Gemini generation failed: {error_msg[:100]}")
+        raise _generation_error(e)
 
 
 def generate_detailed_roadmap(skill: str, days_available: int):
@@ -64,6 +106,7 @@ def generate_detailed_roadmap(skill: str, days_available: int):
     Generate a detailed learning roadmap with topics, subtopics, time periods, and documentation links.
     Returns structured roadmap with comprehensive learning path.
     """
+    client = _get_client()
     if not GEMINI_AVAILABLE or not client:
         raise RuntimeError("Gemini client not available")
 
@@ -1,5 +1,9 @@
 import os
 from .gemini_agent import generate_subtopics as gemini_generate, GEMINI_AVAILABLE
+from .gemini_agent import generate_subtopics_async as gemini_generate_async
+
+# Gemini requests one async roadmap request may have in flight at once
+GEMINI_CONCURRENCY = int(os.environ.get("GEMINI_CONCURRENCY", 4))
 
 
 def generate_subtopics(skill: str):
@@ -18,7 +22,13 @@ def generate_subtopics(skill: str):
         raise RuntimeError(f"Failed to generate subtopics: {str(e)}")
 
 
+async def generate_subtopics_async(skill: str):
+    """Awaitable ``generate_subtopics`` for the ASGI app."""
+    if not GEMINI_AVAILABLE:
+        raise RuntimeError("Gemini API is not available. Please configure GEMINI_API_KEY.")
 
-
-
-
+    try:
+        return await gemini_generate_async(skill)
+    except Exception as e:
+        print(f'⚠️  Gemini generation failed: {e}')
+        raise RuntimeError(f"Failed to generate subtopics: {str(e)}")
@@ -8,8 +8,9 @@ Implements smart parallel learning for multiple missing skills.
 import os
 import json
 import re
+import asyncio
 from datetime import datetime, timedelta
-from .llama_agent import generate_subtopics
+from .llama_agent import GEMINI_CONCURRENCY, generate_subtopics, generate_subtopics_async
 
 
 def calculate_days_until_deadline(deadline_str):
@@ -160,6 +161,17 @@ def distribute_skills_by_time(ranked_skills, days_available):
     return result
 
 
+def _fallback_subtopics(skill, error):
+    print(f"⚠️ AI generation failed for {skill}, using fallback: {error}")
+    return [
+        f"{skill} Fundamentals & Basics",
+        f"{skill} Core Concepts & Architecture",
+        f"{skill} Practical Implementation",
+        f"{skill} Advanced Patterns & Optimization",
+        f"{skill} Real-world Projects"
+    ]
+
+
 def generate_skill_roadmap(skill, days_available, parallel_info=None):
     """
     Generate detailed learning roadmap for a single skill.
@@ -168,15 +180,20 @@ def generate_skill_roadmap(skill, days_available, parallel_info=None):
     try:
         subtopics = generate_subtopics(skill)
     except Exception as e:
-        print(f"⚠️ AI generation failed for {skill}, using fallback: {e}")
-        subtopics = [
-            f"{skill} Fundamentals & Basics",
-            f"{skill} Core Concepts & Architecture",
-            f"{skill} Practical Implementation",
-            f"{skill} Advanced Patterns & Optimization",
-            f"{skill} Real-world Projects"
-        ]
-    
+        subtopics = _fallback_subtopics(skill, e)
+    return _skill_roadmap(skill, days_available, parallel_info, subtopics)
+
+
+async def generate_skill_roadmap_async(skill, days_available, parallel_info=None):
+    """``generate_skill_roadmap`` with the Gemini call awaited (ASGI app)."""
+    try:
+        subtopics = await generate_subtopics_async(skill)
+    except Exception as e:
+        subtopics = _fallback_subtopics(skill, e)
+    return _skill_roadmap(skill, days_available, parallel_info, subtopics)
+
+
+def _skill_roadmap(skill, days_available, parallel_info, subtopics):
     # Distribute days among subtopics
     estimated_days = parallel_info.get('estimated_days', days_available // 5) if parallel_info else days_available // 5
     days_per_subtopic = max(1, estimated_days // len(subtopics))
@@ -224,20 +241,8 @@ def generate_skill_roadmap(skill, days_available, parallel_info=None):
     return roadmap
 
 
-def build_personalized_job_roadmap(resume_skills, jd_skills, jd_skill_weights=None, deadline_str=None, days_fallback=30):
-    """
-    Master function: Build comprehensive personalized job roadmap.
-    
-    Args:
-        resume_skills: List of skills student has
-        jd_skills: List of skills required by job
-        jd_skill_weights: Dict of skill -> importance weight from JD parsing
-        deadline_str: ISO date string or days remaining until deadline
-        days_fallback: Default days if deadline can't be parsed
-    
-    Returns:
-        Comprehensive roadmap with all details, timing, and resources
-    """
+def _plan_roadmap(resume_skills, jd_skills, jd_skill_weights, deadline_str, days_fallback):
+    """Available days, matched / missing skills and the per-skill schedule."""
     # Calculate available time
     days_available = calculate_days_until_deadline(deadline_str) if deadline_str else days_fallback
     
@@ -253,6 +258,25 @@ def build_personalized_job_roadmap(resume_skills, jd_skills, jd_skill_weights=No
     
     # Distribute skills intelligently across available time
     skill_distribution = distribute_skills_by_time(ranked_missing, days_available)
+    return days_available, matched, missing, skill_distribution
+
+
+def build_personalized_job_roadmap(resume_skills, jd_skills, jd_skill_weights=None, deadline_str=None, days_fallback=30):
+    """
+    Master function: Build comprehensive personalized job roadmap.
+    
+    Args:
+        resume_skills: List of skills student has
+        jd_skills: List of skills required by job
+        jd_skill_weights: Dict of skill -> importance weight from JD parsing
+        deadline_str: ISO date string or days remaining until deadline
+        days_fallback: Default days if deadline can't be parsed
+    
+    Returns:
+        Comprehensive roadmap with all details, timing, and resources
+    """
+    days_available, matched, missing, skill_distribution = _plan_roadmap(
+        resume_skills, jd_skills, jd_skill_weights, deadline_str, days_fallback)
     
     # Generate detailed roadmap for each missing skill
     skill_roadmaps = []
@@ -264,6 +288,30 @@ def build_personalized_job_roadmap(resume_skills, jd_skills, jd_skill_weights=No
         )
         skill_roadmaps.append(skill_roadmap)
     
+    return _roadmap_response(resume_skills, jd_skills, days_available, matched, missing, skill_roadmaps)
+
+
+async def build_personalized_job_roadmap_async(resume_skills, jd_skills, jd_skill_weights=None, deadline_str=None,
+                                               days_fallback=30):
+    """
+    ``build_personalized_job_roadmap`` for the ASGI app. The Gemini calls for
+    the missing skills are awaited concurrently (at most GEMINI_CONCURRENCY
+    at a time) instead of one after another; the response is the same.
+    """
+    days_available, matched, missing, skill_distribution = _plan_roadmap(
+        resume_skills, jd_skills, jd_skill_weights, deadline_str, days_fallback)
+
+    limit = asyncio.Semaphore(GEMINI_CONCURRENCY)
+
+    async def generate(skill_info):
+        async with limit:
+            return await generate_skill_roadmap_async(skill_info['skill'], skill_info['estimated_days'], skill_info)
+
+    skill_roadmaps = list(await asyncio.gather(*(generate(skill_info) for skill_info in skill_distribution)))
+    return _roadmap_response(resume_skills, jd_skills, days_available, matched, missing, skill_roadmaps)
+
+
+def _roadmap_response(resume_skills, jd_skills, days_available, matched, missing, skill_roadmaps):
     # Build comprehensive response
     response = {
         "status": "success",
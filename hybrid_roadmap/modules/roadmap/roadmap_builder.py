@@ -1,41 +1,36 @@
 
 
 
+import asyncio
 import json
-from .llama_agent import generate_subtopics
+from .llama_agent import GEMINI_CONCURRENCY, generate_subtopics, generate_subtopics_async
 from .fallback_data import load_curated_data
 from .fetchers import fetch_youtube_links, fetch_github_projects
 from .hardcoded_roadmaps import get_hardcoded_roadmap, is_skill_hardcoded
 
-def build_roadmap_for_skill(skill: str):
-    """
-    Build roadmap for a skill.
-    First checks if hardcoded roadmap exists, otherwise generates dynamically.
-    """
-    # Check if hardcoded roadmap exists for this skill
-    if is_skill_hardcoded(skill):
-        hardcoded = get_hardcoded_roadmap(skill)
-        return {
-            "main_course": skill,
-            "is_hardcoded": True,
-            "duration_weeks": hardcoded.get("totalDays", 60) // 7,
-            "description": hardcoded.get("description", ""),
-            "phases": hardcoded.get("phases", []),
-            "projects": hardcoded.get("projects", [])
-        }
-    
-    # Fallback to dynamic generation
-    try:
-        subtopics = generate_subtopics(skill)
-    except Exception as e:
-        print(f"⚠️ Could not generate subtopics for {skill}: {e}")
-        subtopics = [
-            f"Fundamentals of {skill}",
-            f"Intermediate {skill} Concepts",
-            f"Advanced {skill} Topics",
-            f"Practical Projects in {skill}"
-        ]
+def _hardcoded_roadmap(skill: str):
+    hardcoded = get_hardcoded_roadmap(skill)
+    return {
+        "main_course": skill,
+        "is_hardcoded": True,
+        "duration_weeks": hardcoded.get("totalDays", 60) // 7,
+        "description": hardcoded.get("description", ""),
+        "phases": hardcoded.get("phases", []),
+        "projects": hardcoded.get("projects", [])
+    }
+
+
+def _fallback_subtopics(skill: str, error: Exception):
+    print(f"⚠️ Could not generate subtopics for {skill}: {error}")
+    return [
+        f"Fundamentals of {skill}",
+        f"Intermediate {skill} Concepts",
+        f"Advanced {skill} Topics",
+        f"Practical Projects in {skill}"
+    ]
+
 
+def _dynamic_roadmap(skill: str, subtopics: list[str]):
     final_output = {
         "main_course": skill,
         "is_hardcoded": False,
@@ -60,6 +55,37 @@ def build_roadmap_for_skill(skill: str):
     return final_output
 
 
+def build_roadmap_for_skill(skill: str):
+    """
+    Build roadmap for a skill.
+    First checks if hardcoded roadmap exists, otherwise generates dynamically.
+    """
+    # Check if hardcoded roadmap exists for this skill
+    if is_skill_hardcoded(skill):
+        return _hardcoded_roadmap(skill)
+
+    # Fallback to dynamic generation
+    try:
+        subtopics = generate_subtopics(skill)
+    except Exception as e:
+        subtopics = _fallback_subtopics(skill, e)
+
+    return _dynamic_roadmap(skill, subtopics)
+
+
+async def build_roadmap_for_skill_async(skill: str):
+    """``build_roadmap_for_skill`` with the Gemini call awaited (ASGI app)."""
+    if is_skill_hardcoded(skill):
+        return _hardcoded_roadmap(skill)
+
+    try:
+        subtopics = await generate_subtopics_async(skill)
+    except Exception as e:
+        subtopics = _fallback_subtopics(skill, e)
+
+    return _dynamic_roadmap(skill, subtopics)
+
+
 def build_roadmap_for_skills(skills: list[str]) -> dict:
     """
     Build roadmaps for multiple skills.
@@ -71,3 +97,17 @@ def build_roadmap_for_skills(skills: list[str]) -> dict:
     return result
 
 
+async def build_roadmap_for_skills_async(skills: list[str]) -> dict:
+    """
+    ``build_roadmap_for_skills`` for the ASGI app: the Gemini calls for the
+    skills without a hardcoded roadmap run concurrently, at most
+    GEMINI_CONCURRENCY at a time.
+    """
+    limit = asyncio.Semaphore(GEMINI_CONCURRENCY)
+
+    async def build(skill):
+        async with limit:
+            return await build_roadmap_for_skill_async(skill)
+
+    roadmaps = await asyncio.gather(*(build(skill) for skill in skills))
+    return dict(zip(skills, roadmaps))
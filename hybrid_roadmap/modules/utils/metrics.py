@@ -0,0 +1,59 @@
+"""
+Lightweight in-process metrics for the stats endpoints.
+
+- Histogram: thread-safe fixed-bucket histogram with count, sum and
+  approximate percentiles, cheap enough to record on every request
+"""
+
+import bisect
+import threading
+
+
+class Histogram:
+    """
+    Counts observations into buckets with the given upper bounds (inclusive);
+    values above the last bound land in an overflow bucket.
+    """
+
+    def __init__(self, bounds: list[float]):
+        self.bounds = sorted(bounds)
+        self._counts = [0] * (len(self.bounds) + 1)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self.count += 1
+            self.total += value
+            self.max = max(self.max, value)
+
+    def percentile(self, q: float) -> float | None:
+        """Upper bound of the bucket holding the q-th percentile (0-100)."""
+        with self._lock:
+            if not self.count:
+                return None
+            rank = q / 100 * self.count
+            seen = 0
+            for bound, count in zip(self.bounds + [self.max], self._counts):
+                seen += count
+                if seen >= rank and count:
+                    return min(bound, self.max)
+            return self.max
+
+    def stats(self) -> dict:
+        with self._lock:
+            buckets = {f"<={bound:g}": count for bound, count in zip(self.bounds, self._counts)}
+            buckets[f">{self.bounds[-1]:g}"] = self._counts[-1]
+            count, total, largest = self.count, self.total, self.max
+        return {
+            "count": count,
+            "mean": round(total / count, 4) if count else None,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "max": largest if count else None,
+            "buckets": buckets,
+        }
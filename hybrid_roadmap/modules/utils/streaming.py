@@ -0,0 +1,40 @@
+"""
+Newline-delimited JSON responses for the bulk routes.
+
+A route hands ``ndjson_response`` an iterator of record batches. Each batch
+is serialized and written as soon as it is produced, one JSON object per
+line, and the next batch is only computed once the server has taken the
+previous one. The response therefore buffers at most one batch, however
+many records it carries. An exception after the response has started
+cannot change the status code any more, so it is reported as a final
+``{"error": ...}`` line.
+
+``ndjson_lines`` is the framework-neutral part, shared with the ASGI app.
+Batch sizes for the streamed routes come from STREAM_CHUNK_SIZE (default 64).
+"""
+
+import json
+import os
+
+from flask import Response, stream_with_context
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+STREAM_CHUNK_SIZE = int(os.environ.get("STREAM_CHUNK_SIZE", 64))
+# Ask reverse proxies (nginx) not to buffer the stream
+NDJSON_HEADERS = {"X-Accel-Buffering": "no", "Cache-Control": "no-cache"}
+
+
+def ndjson_lines(batches):
+    """Yield one NDJSON chunk per non-empty batch, then an error line if ``batches`` fails."""
+    try:
+        for records in batches:
+            if records:
+                yield "".join(json.dumps(record) + "\n" for record in records)
+    except Exception as e:
+        yield json.dumps({"error": str(e)}) + "\n"
+
+
+def ndjson_response(batches) -> Response:
+    """Stream ``batches`` (an iterable of lists of JSON-serializable records) as NDJSON."""
+    return Response(stream_with_context(ndjson_lines(batches)), mimetype=NDJSON_MIMETYPE,
+                    headers=NDJSON_HEADERS)
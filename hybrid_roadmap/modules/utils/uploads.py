@@ -0,0 +1,58 @@
+import io
+
+from flask import Request
+from werkzeug.formparser import FormDataParser
+from werkzeug.http import parse_options_header
+
+DEFAULT_MAX_UPLOAD_BYTES = 10 * 1024 * 1024
+_CHUNK_SIZE = 64 * 1024
+
+
+class UploadTooLarge(ValueError):
+    """Raised when an uploaded file is bigger than the configured limit."""
+
+    def __init__(self, max_bytes: int):
+        super().__init__(f"Uploaded file exceeds the {max_bytes / (1024 * 1024):g} MB limit")
+        self.max_bytes = max_bytes
+
+
+class InMemoryRequest(Request):
+    """
+    Request class that keeps multipart file parts in memory.
+
+    Werkzeug spools uploads larger than 500 KB to a temporary file by default;
+    with this class they stay in a BytesIO. Pair it with MAX_CONTENT_LENGTH so
+    the body size stays bounded.
+    """
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return io.BytesIO()
+
+
+def read_upload(stream, max_bytes: int = DEFAULT_MAX_UPLOAD_BYTES) -> bytes:
+    """Read a file-like upload into memory, failing as soon as it passes ``max_bytes``."""
+    buffer = io.BytesIO()
+    while True:
+        chunk = stream.read(_CHUNK_SIZE)
+        if not chunk:
+            break
+        if buffer.tell() + len(chunk) > max_bytes:
+            raise UploadTooLarge(max_bytes)
+        buffer.write(chunk)
+    return buffer.getvalue()
+
+
+def _memory_stream(total_content_length, content_type, filename=None, content_length=None):
+    return io.BytesIO()
+
+
+def parse_multipart(body: bytes, content_type: str):
+    """
+    Parse a buffered multipart/form-data body into ``(form, files)`` with
+    werkzeug's parser, keeping file parts in memory like InMemoryRequest.
+    Used by the ASGI app, which reads the body itself (bounded) first.
+    """
+    mimetype, options = parse_options_header(content_type or "")
+    _, form, files = FormDataParser(stream_factory=_memory_stream).parse(
+        io.BytesIO(body), mimetype, len(body), options)
+    return form, files
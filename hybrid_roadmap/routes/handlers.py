@@ -0,0 +1,260 @@
+"""
+Route bodies shared by the Flask app (api.py) and the ASGI app (asgi.py).
+
+Each handler takes the decoded request (the JSON body, or the parsed resume
+skills plus the jd_text form field for the upload routes) and returns
+``(body, status)``. ``body`` is a JSON-serializable dict, or for streamed
+responses an iterator of record batches for modules.utils.streaming. The
+apps decode the request, decide where the handler runs and encode the
+result; they also turn unexpected exceptions into 500 responses.
+"""
+
+from itertools import chain
+
+from modules.parsing.jd_parser import parse_jd, jd_cache_stats
+from modules.parsing.resume_parser import resume_cache_stats
+from modules.parsing.taxonomy import get_taxonomy
+from modules.recommender.bulk_match import BulkMatcher
+from modules.recommender.encoders import encoder_stats, warmup as warmup_models
+from modules.recommender.jd_reume import (SEMANTIC_MODES, match_resume_jd_semantic, match_resumes_jd_semantic,
+                                          match_cache_stats)
+from modules.recommender.job_index import get_job_index
+from modules.recommender.job_semantic import recommend_jobs_semantic
+from modules.recommender.job_store import get_job_store
+from modules.recommender.skill_idf import get_skill_idf
+from modules.utils.streaming import STREAM_CHUNK_SIZE
+
+SKILLS_CSV = "data/skills.csv"
+
+
+def warmup():
+    """
+    Load the skill taxonomy, the skill IDF weights, the embedding model and the
+    job index (embeddings and TF-IDF) before serving traffic. Heavy libraries
+    are otherwise imported on the first request that needs them.
+    """
+    get_taxonomy(SKILLS_CSV)
+    get_skill_idf().idf("warmup")
+    try:
+        warmup_models()
+        get_job_index().warmup()
+    except Exception as e:
+        print(f"⚠️ Model warmup failed, models will load on first use: {e}")
+
+
+def _semantic_mode_error(data):
+    semantic_mode = data.get("semantic_mode")
+    if semantic_mode is not None and semantic_mode not in SEMANTIC_MODES:
+        return {"error": f"semantic_mode must be one of {list(SEMANTIC_MODES)}"}, 400
+    return None
+
+
+def _is_number(value) -> bool:
+    return not isinstance(value, bool) and isinstance(value, (int, float))
+
+
+def _is_weights(value) -> bool:
+    """A skill -> weight object with numeric weights."""
+    return isinstance(value, dict) and all(_is_number(weight) for weight in value.values())
+
+
+def parse_jd_body(data):
+    if not data or "jd_text" not in data:
+        return {"error": "jd_text is required"}, 400
+
+    jd_skill_weights = parse_jd(data["jd_text"], SKILLS_CSV)
+
+    return {
+        "status": "success",
+        "jd_skill_weights": jd_skill_weights
+    }, 200
+
+
+def match_jd_resume_body(resume_skills, jd_text):
+    if not jd_text:
+        return {"error": "jd_text is required"}, 400
+
+    jd_skill_weights = parse_jd(jd_text, SKILLS_CSV)
+    jd_skills = list(jd_skill_weights.keys())
+
+    match_result = match_resume_jd_semantic(resume_skills, jd_skills)
+
+    return {
+        "status": "success",
+        "resume_skills": resume_skills,
+        "jd_skills": jd_skills,
+        "match_result": match_result
+    }, 200
+
+
+def match_skills_body(data):
+    print("Request received in match-skills")
+    print(f"Data received: {data}")
+
+    if not data:
+        return {"error": "JSON data required"}, 400
+
+    resume_skills = data.get("resume_skills", [])
+    jd_skills = data.get("jd_skills", [])
+
+    if not resume_skills or not isinstance(resume_skills, list):
+        return {"error": "resume_skills must be a non-empty list"}, 400
+
+    if not jd_skills or not isinstance(jd_skills, list):
+        return {"error": "jd_skills must be a non-empty list"}, 400
+
+    error = _semantic_mode_error(data)
+    if error:
+        return error
+
+    match_result = match_resume_jd_semantic(resume_skills, jd_skills,
+                                            semantic_mode=data.get("semantic_mode"))
+
+    return {
+        "status": "success",
+        "resume_skills": resume_skills,
+        "jd_skills": jd_skills,
+        "match_result": match_result
+    }, 200
+
+
+def match_skills_batch_body(data):
+    if not data:
+        return {"error": "JSON data required"}, 400
+
+    jd_skills = data.get("jd_skills", [])
+    jd_skill_weights = data.get("jd_skill_weights")
+    students = data.get("students", [])
+    threshold = data.get("threshold")
+
+    if not jd_skills or not isinstance(jd_skills, list):
+        return {"error": "jd_skills must be a non-empty list"}, 400
+
+    if jd_skill_weights is not None and not _is_weights(jd_skill_weights):
+        return {"error": "jd_skill_weights must be an object of numbers"}, 400
+
+    if not isinstance(students, list) or not students:
+        return {"error": "students must be a non-empty list"}, 400
+
+    for i, student in enumerate(students):
+        skills = student.get("skills") if isinstance(student, dict) else None
+        if not skills or not isinstance(skills, list):
+            return {"error": f"students[{i}].skills must be a non-empty list"}, 400
+
+    if threshold is not None and not _is_number(threshold):
+        return {"error": "threshold must be a number"}, 400
+
+    error = _semantic_mode_error(data)
+    if error:
+        return error
+
+    def batches(size):
+        for start in range(0, len(students), size):
+            chunk = students[start:start + size]
+            match_results = match_resumes_jd_semantic([student["skills"] for student in chunk], jd_skills,
+                                                      jd_skill_weights, semantic_mode=data.get("semantic_mode"))
+            yield [
+                {"index": start + i, "id": student.get("id"), "match_result": match_result}
+                for i, (student, match_result) in enumerate(zip(chunk, match_results))
+                if threshold is None or match_result["match_percentage"] >= threshold
+            ]
+
+    if data.get("stream"):
+        return chain(batches(STREAM_CHUNK_SIZE), [[{"status": "success", "total": len(students)}]]), 200
+
+    return {
+        "status": "success",
+        "jd_skills": jd_skills,
+        "total": len(students),
+        "results": [result for batch in batches(len(students)) for result in batch]
+    }, 200
+
+
+def match_matrix_body(data):
+    if not data:
+        return {"error": "JSON data required"}, 400
+
+    students = data.get("students", [])
+    jobs = data.get("jobs", [])
+    top_k = data.get("top_k", 5)
+
+    for name, items in (("students", students), ("jobs", jobs)):
+        if not isinstance(items, list) or not items:
+            return {"error": f"{name} must be a non-empty list"}, 400
+        for i, item in enumerate(items):
+            skills = item.get("skills") if isinstance(item, dict) else None
+            if not skills or not isinstance(skills, list):
+                return {"error": f"{name}[{i}].skills must be a non-empty list"}, 400
+
+    for i, job in enumerate(jobs):
+        skill_weights = job.get("skill_weights")
+        if skill_weights is not None and not _is_weights(skill_weights):
+            return {"error": f"jobs[{i}].skill_weights must be an object of numbers"}, 400
+
+    if isinstance(top_k, bool) or not isinstance(top_k, int) or top_k < 1:
+        return {"error": "top_k must be a positive integer"}, 400
+
+    error = _semantic_mode_error(data)
+    if error:
+        return error
+
+    matcher = BulkMatcher([job["skills"] for job in jobs], [job.get("skill_weights") for job in jobs],
+                          semantic_mode=data.get("semantic_mode"),
+                          max_chunk_rows=STREAM_CHUNK_SIZE if data.get("stream") else None)
+    def batches():
+        for side, start, block in matcher.iter_top_k([student["skills"] for student in students], top_k):
+            if side == "students":
+                yield "students", [
+                    {"id": student.get("id"),
+                     "top_jobs": [{**entry, "job": jobs[entry["job"]].get("id")} for entry in matches]}
+                    for student, matches in zip(students[start:], block)
+                ]
+            else:
+                yield "jobs", [
+                    {"id": job.get("id"),
+                     "top_students": [{**entry, "student": students[entry["student"]].get("id")}
+                                      for entry in matches]}
+                    for job, matches in zip(jobs, block)
+                ]
+
+    if data.get("stream"):
+        # One record type per line: {"student": {...}} or {"job": {...}}
+        records = ([{side[:-1]: record} for record in block] for side, block in batches())
+        return chain(records, [[{"status": "success"}]]), 200
+
+    result = {"status": "success", "students": [], "jobs": []}
+    for side, block in batches():
+        result[side].extend(block)
+    return result, 200
+
+
+def full_process_body(resume_skills, jd_text):
+    jd_skills = None
+    match_result = None
+
+    if jd_text:
+        jd_skill_weights = parse_jd(jd_text, SKILLS_CSV)
+        jd_skills = list(jd_skill_weights.keys())
+        match_result = match_resume_jd_semantic(resume_skills, jd_skills)
+
+    recommended_jobs = recommend_jobs_semantic(resume_skills, top_n=5)
+
+    return {
+        "status": "success",
+        "resume_skills": resume_skills,
+        "jd_skills": jd_skills,
+        "match_result": match_result,
+        "recommended_jobs": recommended_jobs
+    }, 200
+
+
+def cache_stats_body():
+    return {
+        "status": "success",
+        "resume_cache": resume_cache_stats(),
+        "jd_cache": jd_cache_stats(),
+        "match_cache": match_cache_stats(),
+        "job_embeddings": get_job_store().stats(),
+        "job_index": get_job_index().stats(),
+        "encoder": encoder_stats()
+    }, 200
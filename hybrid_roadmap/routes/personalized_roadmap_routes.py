@@ -26,51 +26,15 @@ def generate_personalized_job_roadmap():
     """
     try:
         data = request.get_json()
-        
-        # Validate required fields
-        if not data:
-            return jsonify({"error": "Request body is required"}), 400
-        
-        resume_skills = data.get("resume_skills", [])
-        jd_skills = data.get("jd_skills", [])
-        
-        if not isinstance(resume_skills, list):
-            return jsonify({"error": "resume_skills must be a list"}), 400
-        
-        if not isinstance(jd_skills, list):
-            return jsonify({"error": "jd_skills must be a list"}), 400
-        
-        if len(jd_skills) == 0:
-            return jsonify({"error": "jd_skills cannot be empty"}), 400
-        
-        # Optional fields
-        jd_skill_weights = data.get("jd_skill_weights", {})
-        deadline = data.get("deadline", None)
-        job_title = data.get("job_title", "Unknown Job")
-        company = data.get("company", "Unknown Company")
-        
-        # Validate deadline if provided
-        days_fallback = 30
-        if deadline:
-            if isinstance(deadline, (int, float)):
-                if deadline <= 0:
-                    return jsonify({"error": "deadline days must be greater than 0"}), 400
-                days_fallback = int(deadline)
+        roadmap_args, error = personalized_roadmap_args(data)
+        if error:
+            return jsonify({"error": error}), 400
         
         # Generate roadmap
-        roadmap = build_personalized_job_roadmap(
-            resume_skills=resume_skills,
-            jd_skills=jd_skills,
-            jd_skill_weights=jd_skill_weights,
-            deadline_str=deadline,
-            days_fallback=days_fallback
-        )
+        roadmap = build_personalized_job_roadmap(**roadmap_args)
         
         # Add job context
-        roadmap["job_context"] = {
-            "title": job_title,
-            "company": company
-        }
+        roadmap["job_context"] = job_context(data)
         
         return jsonify({
             "status": "success",
@@ -82,6 +46,55 @@ def generate_personalized_job_roadmap():
         return jsonify({"error": str(e)}), 500
 
 
+def personalized_roadmap_args(data):
+    """
+    Validate a /personalized-job-roadmap body (shared with the ASGI app).
+    Returns ``(build_personalized_job_roadmap kwargs, None)`` or ``(None, error)``.
+    """
+    # Validate required fields
+    if not data:
+        return None, "Request body is required"
+    
+    resume_skills = data.get("resume_skills", [])
+    jd_skills = data.get("jd_skills", [])
+    
+    if not isinstance(resume_skills, list):
+        return None, "resume_skills must be a list"
+    
+    if not isinstance(jd_skills, list):
+        return None, "jd_skills must be a list"
+    
+    if len(jd_skills) == 0:
+        return None, "jd_skills cannot be empty"
+    
+    # Optional fields
+    jd_skill_weights = data.get("jd_skill_weights", {})
+    deadline = data.get("deadline", None)
+    
+    # Validate deadline if provided
+    days_fallback = 30
+    if deadline:
+        if isinstance(deadline, (int, float)):
+            if deadline <= 0:
+                return None, "deadline days must be greater than 0"
+            days_fallback = int(deadline)
+    
+    return {
+        "resume_skills": resume_skills,
+        "jd_skills": jd_skills,
+        "jd_skill_weights": jd_skill_weights,
+        "deadline_str": deadline,
+        "days_fallback": days_fallback
+    }, None
+
+
+def job_context(data):
+    return {
+        "title": data.get("job_title", "Unknown Job"),
+        "company": data.get("company", "Unknown Company")
+    }
+
+
 @personalized_roadmap_bp.route("/roadmap-preview", methods=["POST"])
 def roadmap_preview():
     """
@@ -89,39 +102,43 @@ def roadmap_preview():
     Useful for quick checks before detailed generation.
     """
     try:
-        data = request.get_json()
-        
-        resume_skills = data.get("resume_skills", [])
-        jd_skills = data.get("jd_skills", [])
-        deadline = data.get("deadline", 30)
-        
-        if not jd_skills:
-            return jsonify({"error": "jd_skills required"}), 400
-        
-        # Quick analysis without full roadmap generation
-        resume_set = set(s.lower() for s in resume_skills)
-        jd_set = set(s.lower() for s in jd_skills)
-        
-        matched = list(resume_set.intersection(jd_set))
-        missing = [s for s in jd_skills if s.lower() not in resume_set]
-        
-        days = deadline if isinstance(deadline, int) else 30
-        
-        preview = {
-            "status": "success",
-            "summary": {
-                "matched_count": len(matched),
-                "missing_count": len(missing),
-                "match_percentage": round((len(matched) / len(jd_skills) * 100), 2) if jd_skills else 0,
-                "days_available": days,
-                "parallel_streams": min(3, max(1, len(missing) // 2))
-            },
-            "missing_skills": missing,
-            "matched_skills": matched,
-            "estimated_learning_hours": len(missing) * 40  # ~40 hours per skill avg
-        }
-        
-        return jsonify(preview), 200
+        body, status = roadmap_preview_body(request.get_json())
+        return jsonify(body), status
     
     except Exception as e:
         return jsonify({"error": str(e)}), 500
+
+
+def roadmap_preview_body(data):
+    """Response body and status for /roadmap-preview (shared with the ASGI app)."""
+    resume_skills = data.get("resume_skills", [])
+    jd_skills = data.get("jd_skills", [])
+    deadline = data.get("deadline", 30)
+    
+    if not jd_skills:
+        return {"error": "jd_skills required"}, 400
+    
+    # Quick analysis without full roadmap generation
+    resume_set = set(s.lower() for s in resume_skills)
+    jd_set = set(s.lower() for s in jd_skills)
+    
+    matched = list(resume_set.intersection(jd_set))
+    missing = [s for s in jd_skills if s.lower() not in resume_set]
+    
+    days = deadline if isinstance(deadline, int) else 30
+    
+    preview = {
+        "status": "success",
+        "summary": {
+            "matched_count": len(matched),
+            "missing_count": len(missing),
+            "match_percentage": round((len(matched) / len(jd_skills) * 100), 2) if jd_skills else 0,
+            "days_available": days,
+            "parallel_streams": min(3, max(1, len(missing) // 2))
+        },
+        "missing_skills": missing,
+        "matched_skills": matched,
+        "estimated_learning_hours": len(missing) * 40  # ~40 hours per skill avg
+    }
+    
+    return preview, 200
@@ -0,0 +1,69 @@
+"""
+Checks for the nearest-neighbour indexes and the ANN path of the job index
+"""
+
+import numpy as np
+
+from modules.recommender import job_index, job_store
+from modules.recommender.ann import ExactIndex, IVFIndex, build_ann_index
+from modules.recommender.tfidf_store import JobTfidfStore
+
+
+def _clustered(n=3000, dim=32, clusters=40, seed=0):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim))
+    return (centers[rng.integers(clusters, size=n)] + 0.3 * rng.normal(size=(n, dim))).astype(np.float32)
+
+
+def test_ivf_recall_and_full_probe_matches_exact():
+    vectors = _clustered()
+    queries = _clustered(n=50, seed=1)
+    exact = ExactIndex(vectors)
+    ivf = IVFIndex(vectors, nprobe=16)
+
+    recall = []
+    for q in queries:
+        truth, truth_scores = exact.search(q, 10)
+        found, _ = ivf.search(q, 10)
+        recall.append(len(set(truth) & set(found)) / 10)
+        # Probing every cell is an exhaustive search
+        all_ids, all_scores = ivf.search(q, 10, nprobe=ivf.nlist)
+        assert np.allclose(all_scores, truth_scores, atol=1e-5)
+    assert np.mean(recall) >= 0.9
+
+
+def test_missing_optional_backend_falls_back_to_ivf():
+    vectors = _clustered(n=200)
+    for backend in ("faiss", "hnswlib"):
+        index = build_ann_index(vectors, backend, {"m": 16, "nprobe": 4})
+        assert len(index) == 200
+
+
+def test_job_index_ann_query_matches_exact(tmp_path):
+    vectors = _clustered(n=500, dim=16)
+    jobs = [{"id": str(i), "title": f"Job {i}", "description": f"job{i} python"} for i in range(len(vectors))]
+    lookup = {job["description"]: v for job, v in zip(jobs, vectors)}
+
+    class TableEncoder:
+        name = "table"
+
+        def encode(self, texts):
+            return np.stack([lookup.get(text, vectors[7]) for text in texts])
+
+    store = job_store.JobEmbeddingStore(str(tmp_path), encoder=TableEncoder())
+
+    tfidf = JobTfidfStore(str(tmp_path / "tfidf"))
+
+    exact = job_index.JobIndex(jobs, store=store, tfidf_store=tfidf, ann_backend="exact")
+    ann = job_index.JobIndex(jobs, store=store, tfidf_store=tfidf, ann_backend="ivf", ann_params={"nprobe": 64})
+    expected = exact.query(["anything"], top_n=5, mode="semantic")
+    found = ann.query(["anything"], top_n=5, mode="semantic")
+    assert [r["job"]["id"] for r in found] == [r["job"]["id"] for r in expected]
+    assert np.allclose([r["score"] for r in found], [r["score"] for r in expected])
+
+
+if __name__ == "__main__":
+    # The job index test relies on pytest's tmp_path fixture
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-q"]))
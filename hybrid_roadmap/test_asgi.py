@@ -0,0 +1,135 @@
+"""
+Checks that the ASGI app (asgi.py) answers like the Flask app (api.py)
+"""
+
+import asyncio
+import io
+import time
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from modules.recommender import encoders, job_index
+from modules.recommender.job_store import JobEmbeddingStore
+from modules.recommender.tfidf_store import JobTfidfStore
+from modules.roadmap import gemini_agent, llama_agent
+
+RESUME = "Bhoomika_agrawal.resume.pdf"
+JD_TEXT = "We are hiring a backend engineer with Python, SQL, Docker and AWS experience."
+STUDENTS = [{"id": f"s{i}", "skills": skills} for i, skills in enumerate(
+    [["Python", "SQL"], ["Java"], ["Python", "Docker"], ["Excel", "SQL"], ["React"]] * 3
+)]
+JOBS = [{"id": "j1", "skills": ["Python", "SQL", "Docker"]}, {"id": "j2", "skills": ["Java", "Spring"]}]
+
+
+def _clients(monkeypatch, tmp_path):
+    monkeypatch.setattr(encoders, "DEFAULT_BACKEND", "stub")
+    # Recommendations persist job embeddings / TF-IDF under tmp_path, not data/
+    index = job_index.JobIndex(job_index.load_catalog(), store=JobEmbeddingStore(str(tmp_path / "embeddings")),
+                               tfidf_store=JobTfidfStore(str(tmp_path / "tfidf")))
+    monkeypatch.setattr(job_index, "_default_index", index)
+    from api import app as flask_app
+    from asgi import app as asgi_app
+
+    return flask_app.test_client(), TestClient(asgi_app)
+
+
+def test_json_routes_match_flask(monkeypatch, tmp_path):
+    flask, asgi = _clients(monkeypatch, tmp_path)
+    requests = [
+        ("/parse-jd", {"jd_text": JD_TEXT}),
+        ("/parse-jd", {}),
+        ("/match-skills", {"resume_skills": ["Python", "Excel"], "jd_skills": ["Python", "SQL"]}),
+        ("/match-skills", {"resume_skills": [], "jd_skills": ["Python"]}),
+        ("/match-skills-batch", {"jd_skills": JOBS[0]["skills"], "students": STUDENTS, "threshold": 50}),
+        ("/match-skills-batch", {"jd_skills": ["Python"], "students": [{"id": "x", "skills": []}]}),
+        ("/match-matrix", {"students": STUDENTS, "jobs": JOBS, "top_k": 2}),
+        ("/match-matrix", {"students": STUDENTS, "jobs": JOBS, "top_k": 0}),
+        ("/api/roadmap-preview", {"resume_skills": ["Python"], "jd_skills": ["Python", "Docker"], "deadline": 20}),
+        ("/api/personalized-job-roadmap", {"resume_skills": ["Python"], "jd_skills": []}),
+        ("/api/generate-roadmap", {}),
+    ]
+    for route, body in requests:
+        expected, actual = flask.post(route, json=body), asgi.post(route, json=body)
+        assert (actual.status_code, actual.json()) == (expected.status_code, expected.get_json()), route
+    assert asgi.get("/cache-stats").json().keys() == flask.get("/cache-stats").get_json().keys()
+
+
+def test_streamed_routes_match_flask(monkeypatch, tmp_path):
+    flask, asgi = _clients(monkeypatch, tmp_path)
+    monkeypatch.setattr("routes.handlers.STREAM_CHUNK_SIZE", 4)
+    for route, body in (
+        ("/match-skills-batch", {"jd_skills": JOBS[0]["skills"], "students": STUDENTS, "stream": True}),
+        ("/match-matrix", {"students": STUDENTS, "jobs": JOBS, "top_k": 2, "stream": True}),
+    ):
+        expected, actual = flask.post(route, json=body), asgi.post(route, json=body)
+        assert actual.headers["content-type"] == expected.mimetype
+        assert actual.text == expected.get_data(as_text=True)
+
+
+def test_upload_routes_match_flask(monkeypatch, tmp_path):
+    flask, asgi = _clients(monkeypatch, tmp_path)
+    with open(RESUME, "rb") as f:
+        data = f.read()
+    for route in ("/parse-resume", "/match-jd-resume", "/full-process"):
+        expected = flask.post(route, data={"file": (io.BytesIO(data), RESUME), "jd_text": JD_TEXT},
+                              content_type="multipart/form-data")
+        actual = asgi.post(route, files={"file": (RESUME, data, "application/pdf")}, data={"jd_text": JD_TEXT})
+        assert (actual.status_code, actual.json()) == (expected.status_code, expected.get_json()), route
+
+        missing = asgi.post(route, data={"jd_text": JD_TEXT})
+        assert missing.status_code == 400
+
+    too_large = asgi.post("/parse-resume", files={"file": ("big.pdf", b"x" * (11 * 1024 * 1024), "application/pdf")})
+    assert too_large.status_code == 413
+
+
+class _FakeGemini:
+    """Gemini client stand-in: every call takes ``delay`` seconds."""
+
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.in_flight = self.peak = 0
+        self.models = SimpleNamespace(generate_content=self._generate)
+        self.aio = SimpleNamespace(models=SimpleNamespace(generate_content=self._generate_async))
+
+    def _generate(self, model, contents):
+        time.sleep(self.delay)
+        return SimpleNamespace(text='["Basics", "Core Concepts", "Projects"]')
+
+    async def _generate_async(self, model, contents):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return SimpleNamespace(text='["Basics", "Core Concepts", "Projects"]')
+
+
+def test_roadmap_gemini_calls_are_awaited_concurrently(monkeypatch, tmp_path):
+    flask, asgi = _clients(monkeypatch, tmp_path)
+    gemini = _FakeGemini(delay=0.2)
+    monkeypatch.setattr(gemini_agent, "client", gemini)
+    monkeypatch.setattr(gemini_agent, "GEMINI_AVAILABLE", True)
+    monkeypatch.setattr(llama_agent, "GEMINI_AVAILABLE", True)
+
+    body = {"resume_skills": ["Python"], "jd_skills": ["Python", "Go", "Rust", "Kafka", "Terraform"], "deadline": 40}
+    expected = flask.post("/api/personalized-job-roadmap", json=body).get_json()
+    start = time.perf_counter()
+    actual = asgi.post("/api/personalized-job-roadmap", json=body).json()
+    elapsed = time.perf_counter() - start
+
+    # Four missing skills, all in flight at once: about one call's latency, not four
+    assert gemini.peak == 4 and elapsed < 0.6
+    for roadmap in (expected, actual):
+        del roadmap["roadmap"]["timeline"]["start_date"], roadmap["roadmap"]["timeline"]["target_completion"]
+    assert actual == expected
+
+    skills = {"skills": ["Go", "Rust"]}
+    assert asgi.post("/api/generate-roadmap", json=skills).json() == flask.post("/api/generate-roadmap", json=skills).get_json()
+
+
+if __name__ == "__main__":
+    # These tests rely on pytest's monkeypatch and tmp_path fixtures
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,84 @@
+"""
+Checks for cross-request encode batching and the metrics histograms
+"""
+
+import threading
+import time
+
+import numpy as np
+
+from modules.recommender.batching import BatchingEncoder
+from modules.recommender.encoders import StubEncoder
+from modules.utils.metrics import Histogram
+
+
+class SlowEncoder(StubEncoder):
+    """Stub encoder with a fixed per-call cost that records batch sizes"""
+
+    def __init__(self):
+        super().__init__(dim=16)
+        self.calls = []
+
+    def encode(self, texts):
+        self.calls.append(len(texts))
+        time.sleep(0.01)
+        return super().encode(texts)
+
+
+def test_concurrent_callers_share_batches():
+    inner = SlowEncoder()
+    batcher = BatchingEncoder(inner, max_batch_size=64, max_wait_ms=20)
+    texts = [[f"skill{i} python", f"skill{i} sql"] for i in range(24)]
+    results = [None] * len(texts)
+
+    def call(i):
+        results[i] = batcher.encode(texts[i])
+
+    threads = [threading.Thread(target=call, args=(i,)) for i in range(len(texts))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    reference = StubEncoder(dim=16)
+    for pair, vectors in zip(texts, results):
+        assert np.array_equal(vectors, reference.encode(pair))
+    assert sum(inner.calls) == 48
+    assert len(inner.calls) < len(texts)
+
+    stats = batcher.stats()
+    assert stats["batch_size"]["count"] == len(inner.calls)
+    assert stats["queue_wait_ms"]["count"] == len(texts)
+
+
+def test_batch_size_limit_and_errors():
+    inner = SlowEncoder()
+    batcher = BatchingEncoder(inner, max_batch_size=4, max_wait_ms=50)
+    futures = [batcher.submit(["a", "b"]) for _ in range(4)]
+    assert all(f.result().shape == (2, 16) for f in futures)
+    assert max(inner.calls) <= 4
+
+    class Broken:
+        name = "broken"
+
+        def encode(self, texts):
+            raise RuntimeError("model unavailable")
+
+    future = BatchingEncoder(Broken()).submit(["x"])
+    assert isinstance(future.exception(timeout=1), RuntimeError)
+
+
+def test_histogram_buckets_and_percentiles():
+    histogram = Histogram([1, 10, 100])
+    for value in [0.5, 5, 5, 50, 500]:
+        histogram.observe(value)
+    stats = histogram.stats()
+    assert stats["buckets"] == {"<=1": 1, "<=10": 2, "<=100": 1, ">100": 1}
+    assert stats["p50"] == 10 and stats["max"] == 500
+
+
+if __name__ == "__main__":
+    test_concurrent_callers_share_batches()
+    test_batch_size_limit_and_errors()
+    test_histogram_buckets_and_percentiles()
+    print("✅ All batching tests passed!")
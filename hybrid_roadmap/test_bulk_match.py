@@ -0,0 +1,92 @@
+"""
+Checks for the students x jobs match matrix
+"""
+
+import random
+
+import numpy as np
+
+from modules.parsing.taxonomy import get_taxonomy
+from modules.recommender import encoders
+from modules.recommender.ann import top_k
+from modules.recommender.bulk_match import BulkMatcher, _top_k_columns
+from modules.recommender.jd_reume import match_resume_jd_semantic
+
+
+def _skill_lists(count, seed):
+    rng = random.Random(seed)
+    skills = get_taxonomy("data/skills.csv").skills[:40]
+    return [rng.sample(skills, rng.randint(1, 8)) for _ in range(count)]
+
+
+def test_top_k_columns_matches_stable_sort():
+    rng = np.random.default_rng(0)
+    scores = np.round(rng.random((50, 7)), 1)  # plenty of ties
+    for k in (1, 3, 50, 80):
+        expected = np.stack([top_k(scores[:, col], k) for col in range(scores.shape[1])], axis=1)
+        assert np.array_equal(_top_k_columns(scores, k), expected)
+
+
+def test_scores_match_single_pair_results(monkeypatch):
+    monkeypatch.setattr(encoders, "DEFAULT_BACKEND", "stub")
+    students, jobs = _skill_lists(12, seed=1), _skill_lists(5, seed=2)
+    weights = [{skill: 1.0 + i % 3 for i, skill in enumerate(job)} for job in jobs]
+    for mode in ("joined", "composed"):
+        for job_weights in (None, weights):
+            matcher = BulkMatcher(jobs, job_weights, semantic_mode=mode)
+            (_, scores), = matcher.blocks(students)
+            for i, student in enumerate(students):
+                for j, job in enumerate(jobs):
+                    single = match_resume_jd_semantic(student, job, job_weights and job_weights[j], mode)
+                    assert abs(scores["hybrid"][i, j] - single["hybrid_score"]) <= 1e-4
+                    assert abs(scores["tfidf"][i, j] - single["tfidf_score"]) <= 1e-4
+                    assert abs(scores["semantic"][i, j] - single["semantic_score"]) <= 1e-4
+                    assert scores["overlap"][i, j] == single["overlap_score"]
+
+
+def test_chunked_top_k_matches_full_matrix(monkeypatch):
+    monkeypatch.setattr(encoders, "DEFAULT_BACKEND", "stub")
+    students, jobs = _skill_lists(90, seed=3), _skill_lists(17, seed=4)
+    full = BulkMatcher(jobs, semantic_mode="composed")
+    (_, scores), = full.blocks(students)
+
+    # Force many chunks of a few students each
+    chunked = BulkMatcher(jobs, semantic_mode="composed", block_bytes=17 * 8 * 8 * 7)
+    assert chunked.chunk_rows() == 7
+    result = chunked.top_k(students, k=4)
+
+    hybrid = scores["hybrid"]
+    for i, row in enumerate(result["students"]):
+        assert [entry["job"] for entry in row] == top_k(hybrid[i], 4).tolist()
+    for j, column in enumerate(result["jobs"]):
+        assert [entry["student"] for entry in column] == top_k(hybrid[:, j], 4).tolist()
+        assert [entry["hybrid_score"] for entry in column] == hybrid[top_k(hybrid[:, j], 4), j].tolist()
+
+
+def test_match_matrix_route(monkeypatch):
+    monkeypatch.setattr(encoders, "DEFAULT_BACKEND", "stub")
+    from api import app
+
+    students = [{"id": "s1", "skills": ["Python", "SQL"]}, {"id": "s2", "skills": ["Java"]}]
+    jobs = [{"id": "j1", "skills": ["Java", "Spring"]}, {"id": "j2", "skills": ["Python", "SQL"]}]
+    response = app.test_client().post("/match-matrix", json={"students": students, "jobs": jobs, "top_k": 1})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert [(s["id"], s["top_jobs"][0]["job"]) for s in body["students"]] == [("s1", "j2"), ("s2", "j1")]
+    assert [(j["id"], j["top_students"][0]["student"]) for j in body["jobs"]] == [("j1", "s2"), ("j2", "s1")]
+    assert body["students"][0]["top_jobs"][0]["match_percentage"] == 100.0
+
+    weighted = [jobs[0], {**jobs[1], "skill_weights": {"Python": 3, "SQL": 1.5}}]
+    assert app.test_client().post("/match-matrix", json={"students": students, "jobs": weighted}).status_code == 200
+    for skill_weights in (["Python"], {"Python": "x"}, {"Python": False}):
+        invalid = [jobs[0], {**jobs[1], "skill_weights": skill_weights}]
+        response = app.test_client().post("/match-matrix", json={"students": students, "jobs": invalid})
+        assert response.status_code == 400, skill_weights
+        assert response.get_json()["error"] == "jobs[1].skill_weights must be an object of numbers"
+
+
+if __name__ == "__main__":
+    # These tests rely on pytest's monkeypatch fixture
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,83 @@
+"""
+Checks for the shared caches and the parsed resume / JD caches
+"""
+
+import time
+
+from modules.parsing import jd_parser, resume_parser
+from modules.utils.cache import LRUCache, SQLiteCache, TieredCache
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert (stats["hits"], stats["misses"]) == (3, 1)
+
+
+def test_lru_byte_bound_and_expiry():
+    cache = LRUCache(max_entries=10, max_bytes=10, sizeof=lambda key, value: len(value))
+    cache.put("a", "xxxx")
+    cache.put("b", "xxxx")
+    cache.put("c", "xxxx")
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 8
+
+    cache = LRUCache(max_entries=10, ttl=0.01)
+    cache.put("a", 1)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert cache.stats()["expired"] == 1
+
+
+def test_sqlite_tier_survives_new_memory_tier(tmp_path):
+    path = str(tmp_path / "cache.db")
+    first = TieredCache(LRUCache(4), SQLiteCache(path))
+    first.put("key", ["Python", "SQL"])
+
+    # A fresh process starts with an empty memory tier
+    second = TieredCache(LRUCache(4), SQLiteCache(path))
+    assert second.get("key") == ["Python", "SQL"]
+    assert second.stats()["disk"]["hits"] == 1
+    assert second.get("key") == ["Python", "SQL"]
+    assert second.stats()["memory"]["hits"] == 1
+
+
+def test_resume_cache_hit_on_same_bytes():
+    with open("Bhoomika_agrawal.resume.pdf", "rb") as f:
+        data = f.read()
+    resume_parser._resume_cache.clear()
+
+    first = resume_parser.parse_resume(data, "data/skills.csv", filename="a.pdf")
+    second = resume_parser.parse_resume(data, "data/skills.csv", filename="b.pdf")
+    assert first == second
+    stats = resume_parser.resume_cache_stats()["memory"]
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+def test_jd_cache_keyed_by_normalized_text():
+    jd_parser._jd_cache.clear()
+    first = jd_parser.parse_jd("Must have: Python, SQL.\nNice to have: Docker", "data/skills.csv")
+    second = jd_parser.parse_jd("  MUST HAVE:   python, sql. nice to have: docker ", "data/skills.csv")
+    assert first == second == {"Python": 3, "SQL": 3, "Docker": 2}
+    stats = jd_parser.jd_cache_stats()
+    assert (stats["hits"], stats["misses"]) == (1, 1)
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    test_lru_evicts_least_recently_used()
+    test_lru_byte_bound_and_expiry()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_sqlite_tier_survives_new_memory_tier(Path(tmp))
+    test_resume_cache_hit_on_same_bytes()
+    test_jd_cache_keyed_by_normalized_text()
+    print("✅ All cache tests passed!")
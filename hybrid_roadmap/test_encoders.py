@@ -0,0 +1,39 @@
+"""
+Checks for the pluggable sentence encoders
+"""
+
+import numpy as np
+
+from modules.recommender import encoders
+from modules.recommender.encoders import StubEncoder, get_encoder
+from modules.recommender.jd_reume import match_resume_jd_semantic
+
+
+def test_stub_encoder_is_deterministic_and_word_based():
+    first = StubEncoder().encode(["Python SQL", "python sql", "Java Spring", ""])
+    second = StubEncoder().encode(["Python SQL"])
+    assert first.shape == (4, 384) and first.dtype == np.float32
+    assert np.array_equal(first[0], second[0])
+    assert np.allclose(first[0], first[1])
+    assert first[0] @ first[2] < 0.5
+    assert not first[3].any()
+
+
+def test_get_encoder_shares_instances():
+    assert get_encoder(backend="stub") is get_encoder(backend="stub")
+    assert get_encoder(backend="stub").name == "stub:384"
+
+
+def test_matching_runs_on_configured_backend(monkeypatch):
+    monkeypatch.setattr(encoders, "DEFAULT_BACKEND", "stub")
+    for mode in ("joined", "composed"):
+        result = match_resume_jd_semantic(["Python", "SQL"], ["Python", "Docker"], semantic_mode=mode)
+        assert result["matched_skills"] == ["Python"]
+        assert 0 < result["semantic_score"] < 1
+
+
+if __name__ == "__main__":
+    # The matching test relies on pytest's monkeypatch fixture
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-q"]))
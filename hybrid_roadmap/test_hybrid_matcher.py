@@ -0,0 +1,57 @@
+"""
+Checks for the vectorized ranking in HybridJobMatcher
+"""
+
+import numpy as np
+
+from modules.recommender.hybrid_matcher import HybridJobMatcher
+
+
+def _scores(n=500, seed=0):
+    rng = np.random.default_rng(seed)
+    jobs = [{"id": i, "title": f"Job {i}", "company": "Acme", "description": "..."} for i in range(n)]
+    # Coarse values so many jobs tie on the rounded hybrid score
+    semantic = np.round(rng.random(n), 2)
+    tfidf = np.where(rng.random(n) < 0.7, 0.0, np.round(rng.random(n), 2))
+    return jobs, semantic, tfidf
+
+
+def _sorted_ranking(matcher, jobs, semantic, tfidf, start, stop):
+    # Per-job scores and a full stable sort, as ranking worked before vectorization
+    hybrid = [matcher.calculate_hybrid_score(s, t) for s, t in zip(semantic, tfidf)]
+    order = sorted(range(len(jobs)), key=lambda i: hybrid[i], reverse=True)
+    ranked = [matcher._match(jobs[i], i, semantic[i], tfidf[i], hybrid[i], rank) for rank, i in enumerate(order, 1)]
+    return ranked[start:stop]
+
+
+def test_ranking_matches_full_sort():
+    matcher = HybridJobMatcher()
+    jobs, semantic, tfidf = _scores()
+    for start, stop in [(0, 5), (0, 1), (10, 60), (0, None), (495, 600)]:
+        fast = matcher._rank_matches(jobs, semantic, tfidf, start, stop)
+        assert fast == _sorted_ranking(matcher, jobs, semantic.tolist(), tfidf.tolist(), start, stop)
+
+
+def test_all_matches_is_opt_in_and_paginated():
+    fixed = _scores(n=30)
+
+    class FixedIndex:
+        def scores(self, resume_text, semantic=True):
+            return fixed
+
+    matcher = HybridJobMatcher(index=FixedIndex())
+    result = matcher.recommend_jobs_hybrid(["Python"], top_n=3)
+    assert "all_matches" not in result
+    assert [m["rank"] for m in result["matches"]] == [1, 2, 3]
+
+    page = matcher.recommend_jobs_hybrid(["Python"], top_n=3, include_all=True, offset=10, limit=5)
+    assert [m["rank"] for m in page["all_matches"]] == [11, 12, 13, 14, 15]
+    assert page["all_matches_page"] == {"offset": 10, "limit": 5, "total": 30}
+    full = matcher.recommend_jobs_hybrid(["Python"], top_n=3, include_all=True)
+    assert full["all_matches"][10:15] == page["all_matches"]
+
+
+if __name__ == "__main__":
+    test_ranking_matches_full_sort()
+    test_all_matches_is_opt_in_and_paginated()
+    print("✅ All hybrid matcher tests passed!")
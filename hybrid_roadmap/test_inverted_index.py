@@ -0,0 +1,56 @@
+"""
+Checks for posting-list TF-IDF scoring
+"""
+
+import numpy as np
+from sklearn.metrics.pairwise import cosine_similarity
+
+from modules.recommender.ann import top_k
+from modules.recommender.inverted_index import InvertedIndex
+from modules.recommender.tfidf_store import make_tfidf_vectorizer
+
+SKILLS = ["python", "sql", "excel", "docker", "kubernetes", "react", "java", "spark", "tableau", "aws",
+          "pytorch", "django", "terraform", "go", "rust", "figma", "linux", "kafka", "airflow", "scala"]
+QUERIES = ["Python SQL", "Kafka", "Rust Go Linux Docker", "COBOL Fortran", "Python python AWS", ""]
+
+
+def _corpus(n=400, seed=0):
+    rng = np.random.default_rng(seed)
+    # Zipf-like skill frequencies, as in real postings
+    p = 1.0 / np.arange(1, len(SKILLS) + 1)
+    return [" ".join(rng.choice(SKILLS, size=rng.integers(1, 8), p=p / p.sum())) for _ in range(n)]
+
+
+def test_scores_match_cosine_similarity():
+    texts = _corpus()
+    vectorizer = make_tfidf_vectorizer()
+    matrix = vectorizer.fit_transform(texts)
+    index = InvertedIndex(matrix)
+    rows = np.array([0, 5, 17, 399])
+
+    for text in QUERIES:
+        query = vectorizer.transform([text])
+        expected = cosine_similarity(query, matrix)[0]
+        assert np.allclose(index.scores(query), expected, atol=1e-12)
+        assert np.allclose(index.scores(query, rows), expected[rows], atol=1e-12)
+
+
+def test_search_matches_full_ranking():
+    texts = _corpus()
+    vectorizer = make_tfidf_vectorizer()
+    matrix = vectorizer.fit_transform(texts)
+    index = InvertedIndex(matrix)
+
+    for text in QUERIES:
+        query = vectorizer.transform([text])
+        dense = cosine_similarity(query, matrix)[0]
+        expected = [i for i in top_k(dense, 10) if dense[i] > 0]
+        found, scores = index.search(query, 10)
+        assert found.tolist() == expected
+        assert np.allclose(scores, dense[expected], atol=1e-12)
+
+
+if __name__ == "__main__":
+    test_scores_match_cosine_similarity()
+    test_search_matches_full_ranking()
+    print("✅ All inverted index tests passed!")
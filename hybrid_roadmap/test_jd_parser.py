@@ -0,0 +1,88 @@
+"""
+Parity checks between the single-pass JD segmenter and the original regex implementation
+"""
+
+import json
+import random
+
+from modules.parsing.jd_parser import (
+    CONTEXT_RULES,
+    SECTION_RULES,
+    _weight_jd_skills_regex,
+    parse_jd,
+    weight_jd_skills,
+)
+from modules.parsing.taxonomy import get_taxonomy
+
+TAXONOMY = get_taxonomy("data/skills.csv")
+
+SAMPLE_JDS = [
+    """
+    We are hiring a Data Analyst.
+    Must have: Python, SQL, Excel.
+    Good to have: Tableau, Power BI, Git.
+    Optional: Docker
+    """,
+    """
+    Technical Skills: React, Node.js, MongoDB, AWS
+    Experience: 2+ years building REST APIs with Express.
+    Required qualifications: Git, Docker. Preferred: Kubernetes, Terraform.
+    Responsibilities: own CI/CD, mentor juniors. Strong experience in Java and Spring Boot.
+    """,
+    "Minimum qualifications: C++ and Linux. Nice-to-have: Rust, Go. Knowledge of pythonexperience",
+    "skills & technologies:javaexperience with flask. competencies mandatory sqlrequired",
+    "",
+]
+
+
+def _random_jd(rng: random.Random, words: int = 120) -> str:
+    phrases = [p for _, _, headers, stops in SECTION_RULES for p in headers + stops]
+    phrases += [p for _, _, headers in CONTEXT_RULES for p in headers]
+    skills = [s.lower() for s in TAXONOMY.skills]
+    glue = ["", " ", ", ", ": ", ".", "-", "/", " and ", "\n", "x"]
+    parts = []
+    for _ in range(words):
+        roll = rng.random()
+        if roll < 0.3:
+            parts.append(rng.choice(phrases))
+        elif roll < 0.7:
+            parts.append(rng.choice(skills))
+        else:
+            parts.append(rng.choice(["team", "years", "build", "the", "apis", "a"]))
+        parts.append(rng.choice(glue))
+    return "".join(parts)
+
+
+def test_matches_regex_on_samples():
+    for jd in SAMPLE_JDS:
+        assert weight_jd_skills(jd, TAXONOMY.matcher) == _weight_jd_skills_regex(jd, TAXONOMY.matcher), jd
+
+
+def test_matches_regex_on_sample_job_descriptions():
+    with open("modules/recommender/sample_jds.json", "r") as f:
+        jobs = json.load(f)
+    for job in jobs:
+        jd = job["description"]
+        assert weight_jd_skills(jd, TAXONOMY.matcher) == _weight_jd_skills_regex(jd, TAXONOMY.matcher), jd
+
+
+def test_matches_regex_on_random_jds():
+    rng = random.Random(11)
+    for _ in range(300):
+        jd = _random_jd(rng)
+        assert weight_jd_skills(jd, TAXONOMY.matcher) == _weight_jd_skills_regex(jd, TAXONOMY.matcher), jd
+
+
+def test_parse_jd_weights():
+    weights = parse_jd(SAMPLE_JDS[0], "data/skills.csv")
+    assert weights["Python"] == 3
+    assert weights["Tableau"] == 2
+    assert list(weights)[:3] == ["Excel", "Python", "SQL"]
+
+
+if __name__ == "__main__":
+    test_matches_regex_on_samples()
+    test_matches_regex_on_sample_job_descriptions()
+    test_matches_regex_on_random_jds()
+    test_parse_jd_weights()
+    print("✅ All JD parser tests passed!")
@@ -0,0 +1,98 @@
+"""
+Checks for the shared job index and the recommenders built on it
+"""
+
+import numpy as np
+from sklearn.metrics.pairwise import cosine_similarity
+
+from modules.recommender import job_index, job_store
+from modules.recommender.job_index import JobIndex, load_catalog
+from modules.recommender.job_tfidf import recommend_jobs
+from modules.recommender.tfidf_store import JobTfidfStore, make_tfidf_vectorizer
+
+JOBS = [
+    {"id": "1", "title": "Data Analyst", "description": "SQL Excel Tableau reporting dashboards"},
+    {"id": "2", "title": "Backend Engineer", "description": "Python Django REST APIs PostgreSQL Docker"},
+    {"id": "3", "title": "ML Engineer", "description": "Python PyTorch machine learning model deployment"},
+]
+
+
+class BagOfWordsModel:
+    """Deterministic encoder with a tiny fixed vocabulary"""
+
+    name = "bag-of-words"
+    vocab = ["python", "sql", "docker", "machine", "excel"]
+
+    def encode(self, texts):
+        return np.array([[text.lower().count(word) for word in self.vocab] + [0.1] for text in texts],
+                        dtype=np.float32)
+
+
+def _index(tmp_path, jobs=JOBS):
+    return JobIndex(jobs, store=job_store.JobEmbeddingStore(str(tmp_path), encoder=BagOfWordsModel()),
+                    tfidf_store=JobTfidfStore(str(tmp_path / "tfidf")))
+
+
+def test_scores_match_per_request_computation(tmp_path):
+    index = _index(tmp_path)
+    resume = "Python SQL Docker"
+    texts = [job["description"] for job in JOBS]
+
+    jobs, semantic, tfidf = index.scores(resume)
+    assert [job["id"] for job in jobs] == ["1", "2", "3"]
+
+    model = BagOfWordsModel()
+    expected = cosine_similarity(model.encode([resume]), model.encode(texts))[0]
+    assert np.allclose(semantic, expected, atol=1e-6)
+
+    vectorizer = make_tfidf_vectorizer().fit(texts)
+    expected = cosine_similarity(vectorizer.transform([resume]), vectorizer.transform(texts))[0]
+    assert np.allclose(tfidf, expected)
+
+
+def test_add_and_remove_jobs(tmp_path):
+    index = _index(tmp_path)
+    assert index.query(["Excel"], top_n=1, mode="tfidf")[0]["job"]["id"] == "1"
+
+    index.add_jobs([{"id": "4", "title": "BI Developer", "description": "Excel Excel Power BI"}])
+    index.remove_jobs(["1"])
+    results = index.query(["Excel"], top_n=None, mode="semantic")
+    assert [r["job"]["id"] for r in results][0] == "4"
+    assert len(results) == 3
+    assert all(r["semantic_score"] is not None for r in results)
+
+
+def test_jobs_without_id_are_not_matched_by_position(tmp_path):
+    first = {"title": "Job A", "description": "SQL Excel"}
+    second = {"title": "Job B", "description": "Python Docker"}
+    index = _index(tmp_path, [first, second])
+
+    assert index.remove_jobs(["0", "1"]) == 0
+    index.add_jobs([{"id": "0", "title": "Job C", "description": "Python SQL"}])
+    assert [job["title"] for job in index.jobs] == ["Job A", "Job B", "Job C"]
+    assert index.remove_jobs(["0"]) == 1
+    assert index.jobs == [first, second]
+
+
+def test_tfidf_top_n_matches_full_ranking(tmp_path):
+    index = _index(tmp_path)
+    for skills in (["Python", "Docker"], ["Excel"], ["COBOL"]):
+        full = index.query(skills, top_n=None, mode="tfidf")
+        for top_n in (1, 2, 5):
+            assert index.query(skills, top_n=top_n, mode="tfidf") == full[:top_n]
+
+
+def test_recommend_jobs_view(tmp_path, monkeypatch):
+    # The shared index over the bundled catalog, persisted under tmp_path
+    monkeypatch.setattr(job_index, "_default_index", _index(tmp_path, load_catalog()))
+    results = recommend_jobs(["Python", "SQL"], top_n=2)
+    assert len(results) == 2
+    assert set(results[0]) == {"id", "title", "description", "score"}
+    assert results[0]["score"] >= results[1]["score"]
+
+
+if __name__ == "__main__":
+    # These tests rely on pytest's tmp_path and monkeypatch fixtures
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,57 @@
+"""
+Checks for the persistent job embedding store
+"""
+
+import numpy as np
+
+from modules.recommender import job_store
+
+
+class CountingEncoder:
+    """Deterministic encoder that records what it encodes"""
+
+    name = "counting"
+
+    def __init__(self):
+        self.seen = []
+
+    def encode(self, texts):
+        self.seen.extend(texts)
+        return np.array([[len(text), text.count("a"), 1.0] for text in texts], dtype=np.float32)
+
+
+def _store(tmp_path):
+    encoder = CountingEncoder()
+    return job_store.JobEmbeddingStore(str(tmp_path), encoder=encoder), encoder
+
+
+def test_embeddings_persist_and_are_memory_mapped(tmp_path):
+    store, model = _store(tmp_path)
+    first = np.array(store.embed(["data analyst", "backend engineer"]))
+    assert model.seen == ["data analyst", "backend engineer"]
+
+    # A new process opens the saved matrix instead of encoding again
+    reopened, model = _store(tmp_path)
+    matrix = reopened.embed(["data analyst", "backend engineer"])
+    assert model.seen == []
+    assert isinstance(matrix, np.memmap) and matrix.dtype == np.float32
+    assert np.array_equal(matrix, first)
+
+
+def test_only_added_or_changed_jobs_are_encoded(tmp_path):
+    store, model = _store(tmp_path)
+    store.embed(["data analyst", "backend engineer", "ml engineer"])
+    model.seen.clear()
+
+    matrix = store.embed(["ml engineer", "data analyst (remote)", "data analyst"])
+    assert model.seen == ["data analyst (remote)"]
+    assert matrix.shape == (3, 3)
+    assert np.array_equal(matrix[0], model.encode(["ml engineer"])[0])
+    assert store.stats()["jobs"] == 3
+
+
+if __name__ == "__main__":
+    # These tests rely on pytest's tmp_path fixture
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,77 @@
+"""
+Checks for batch resume/JD matching and the /match-skills-batch route
+"""
+
+from modules.recommender import encoders
+from modules.recommender.jd_reume import match_resume_jd_semantic, match_resumes_jd_semantic
+
+JD_SKILLS = ["Python", "SQL", "Docker", "Machine Learning"]
+STUDENTS = [
+    {"id": "a", "skills": ["Python", "SQL", "Docker"]},
+    {"id": "b", "skills": ["java", "Spring Boot"]},
+    {"id": "c", "skills": ["python", "machine learning", "Pandas"]},
+    {"id": "d", "skills": ["Excel"]},
+]
+
+
+def test_batch_results_match_single_pairs(monkeypatch):
+    monkeypatch.setattr(encoders, "DEFAULT_BACKEND", "stub")
+    weights = {"Python": 1.0, "SQL": 0.5, "Docker": 0.5, "Machine Learning": 2.0}
+    for mode in ("joined", "composed"):
+        for jd_weights in (None, weights):
+            batch = match_resumes_jd_semantic([s["skills"] for s in STUDENTS], JD_SKILLS, jd_weights, mode)
+            single = [match_resume_jd_semantic(s["skills"], JD_SKILLS, jd_weights, mode) for s in STUDENTS]
+            assert batch == single
+
+
+def test_weighted_overlap_uses_case_insensitive_weights(monkeypatch):
+    monkeypatch.setattr(encoders, "DEFAULT_BACKEND", "stub")
+    result = match_resume_jd_semantic(["python"], ["Python", "SQL"], {"Python": 3.0, "SQL": 1.0}, "composed")
+    assert result["overlap_score"] == 0.75
+
+
+def test_match_skills_batch_route(monkeypatch):
+    monkeypatch.setattr(encoders, "DEFAULT_BACKEND", "stub")
+    from api import app
+
+    client = app.test_client()
+    response = client.post("/match-skills-batch", json={"jd_skills": JD_SKILLS, "students": STUDENTS})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["total"] == 4 and [r["id"] for r in body["results"]] == ["a", "b", "c", "d"]
+    for student, result in zip(STUDENTS, body["results"]):
+        single = client.post("/match-skills", json={"resume_skills": student["skills"], "jd_skills": JD_SKILLS})
+        assert result["match_result"] == single.get_json()["match_result"]
+
+    filtered = client.post("/match-skills-batch", json={"jd_skills": JD_SKILLS, "students": STUDENTS, "threshold": 50})
+    assert [(r["index"], r["id"]) for r in filtered.get_json()["results"]] == [(0, "a"), (2, "c")]
+
+    invalid = client.post("/match-skills-batch", json={"jd_skills": JD_SKILLS, "students": [{"id": "x", "skills": []}]})
+    assert invalid.status_code == 400
+    for weights in ({"Python": "x"}, {"Python": True}, ["Python"]):
+        invalid = client.post("/match-skills-batch", json={"jd_skills": JD_SKILLS, "students": STUDENTS,
+                                                           "jd_skill_weights": weights})
+        assert invalid.status_code == 400 and "jd_skill_weights" in invalid.get_json()["error"], weights
+
+
+def test_unknown_semantic_mode_is_rejected(monkeypatch):
+    monkeypatch.setattr(encoders, "DEFAULT_BACKEND", "stub")
+    from api import app
+
+    client = app.test_client()
+    for route, body in (
+        ("/match-skills", {"resume_skills": ["Python"], "jd_skills": JD_SKILLS}),
+        ("/match-skills-batch", {"jd_skills": JD_SKILLS, "students": STUDENTS}),
+        ("/match-matrix", {"students": STUDENTS, "jobs": [{"id": "j", "skills": JD_SKILLS}]}),
+    ):
+        response = client.post(route, json={**body, "semantic_mode": "bogus"})
+        assert response.status_code == 400, route
+        assert "semantic_mode" in response.get_json()["error"]
+        assert client.post(route, json={**body, "semantic_mode": "composed"}).status_code == 200, route
+
+
+if __name__ == "__main__":
+    # These tests rely on pytest's monkeypatch fixture
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,79 @@
+"""
+Checks for the memoized resume/JD pair scores
+"""
+
+from modules.recommender import encoders, jd_reume
+from modules.recommender.jd_reume import match_cache_stats, match_resume_jd_semantic, match_resumes_jd_semantic
+
+JD_SKILLS = ["Python", "SQL", "Docker", "Machine Learning"]
+WEIGHTS = {"Python": 1.0, "SQL": 0.5, "Docker": 0.5, "Machine Learning": 2.0}
+
+
+def test_reordered_pairs_hit_the_cache(monkeypatch):
+    monkeypatch.setattr(encoders, "DEFAULT_BACKEND", "stub")
+    jd_reume._match_cache.clear()
+    first = match_resume_jd_semantic(["Python", "Pandas", "SQL"], JD_SKILLS, WEIGHTS)
+    again = match_resume_jd_semantic(["SQL", "Python", "Pandas"], list(reversed(JD_SKILLS)), dict(reversed(WEIGHTS.items())))
+    assert again == first
+    stats = match_cache_stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_cached_results_equal_fresh_scores(monkeypatch):
+    monkeypatch.setattr(encoders, "DEFAULT_BACKEND", "stub")
+    resumes = [["python", "docker"], ["Java"], ["SQL", "Machine Learning", "Excel"]]
+    for mode in ("joined", "composed"):
+        jd_reume._match_cache.clear()
+        fresh = jd_reume._score_resumes(resumes, JD_SKILLS, WEIGHTS, mode)
+        assert match_resumes_jd_semantic(resumes, JD_SKILLS, WEIGHTS, mode) == fresh
+        assert match_resumes_jd_semantic(resumes, JD_SKILLS, WEIGHTS, mode) == fresh
+        assert match_cache_stats()["hits"] == len(resumes)
+
+
+def test_key_covers_weights_mode_and_model(monkeypatch):
+    monkeypatch.setattr(encoders, "DEFAULT_BACKEND", "stub")
+    jd_reume._match_cache.clear()
+    match_resume_jd_semantic(["Python"], JD_SKILLS)
+    match_resume_jd_semantic(["Python"], JD_SKILLS, WEIGHTS)
+    match_resume_jd_semantic(["Python"], JD_SKILLS, semantic_mode="composed")
+    monkeypatch.setattr(encoders, "_encoders", {("stub", encoders.DEFAULT_MODEL): encoders.StubEncoder(dim=8)})
+    match_resume_jd_semantic(["Python"], JD_SKILLS)
+    assert match_cache_stats()["misses"] == 4 and match_cache_stats()["hits"] == 0
+
+
+def test_misses_are_scored_in_caller_order(monkeypatch):
+    # Caching only changes the key, never what the encoder sees
+    class RecordingEncoder(encoders.StubEncoder):
+        def __init__(self):
+            super().__init__()
+            self.texts = []
+
+        def encode(self, texts):
+            self.texts.extend(texts)
+            return super().encode(texts)
+
+    encoder = RecordingEncoder()
+    monkeypatch.setattr(encoders, "DEFAULT_BACKEND", "stub")
+    monkeypatch.setattr(encoders, "_encoders", {("stub", encoders.DEFAULT_MODEL): encoder})
+    jd_reume._match_cache.clear()
+    cached = match_resume_jd_semantic(["SQL", "Python"], ["Docker", "Python"])
+    assert encoder.texts == ["Docker Python", "SQL Python"]
+
+    monkeypatch.setattr(jd_reume, "MATCH_CACHE_SIZE", 0)
+    encoder.texts.clear()
+    assert match_resume_jd_semantic(["SQL", "Python"], ["Docker", "Python"]) == cached
+    assert encoder.texts == ["Docker Python", "SQL Python"]
+
+
+def test_callers_cannot_modify_cached_results(monkeypatch):
+    monkeypatch.setattr(encoders, "DEFAULT_BACKEND", "stub")
+    jd_reume._match_cache.clear()
+    match_resume_jd_semantic(["Python"], JD_SKILLS)["missing_skills"].append("Go")
+    assert "Go" not in match_resume_jd_semantic(["Python"], JD_SKILLS)["missing_skills"]
+
+
+if __name__ == "__main__":
+    # These tests rely on pytest's monkeypatch fixture
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-q"]))
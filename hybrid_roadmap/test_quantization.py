@@ -0,0 +1,54 @@
+"""
+Checks for compressed (float16 / int8 / PCA) job embeddings
+"""
+
+import numpy as np
+
+from modules.recommender.quantization import CompressedEmbeddings
+
+
+def _embeddings(n=2000, dim=64, seed=0):
+    # Most variance in a 24-dim subspace, like sentence embeddings' decaying spectrum
+    rng = np.random.default_rng(seed)
+    basis = rng.normal(size=(24, dim))
+    centers = rng.normal(size=(50, 24))
+
+    def sample(count):
+        latent = centers[rng.integers(50, size=count)] + 0.5 * rng.normal(size=(count, 24))
+        return (latent @ basis + 0.05 * rng.normal(size=(count, dim))).astype(np.float32)
+
+    return sample(n), sample(20)
+
+
+def _cosine(vectors, query):
+    return vectors @ query / (np.linalg.norm(vectors, axis=1) * np.linalg.norm(query))
+
+
+def test_float32_is_exact_cosine():
+    vectors, queries = _embeddings()
+    compressed = CompressedEmbeddings(vectors, "float32", None)
+    assert compressed.codes is vectors
+    for q in queries:
+        assert np.allclose(compressed.scores(q), _cosine(vectors, q), atol=1e-6)
+        rows = np.array([5, 3, 1999])
+        assert np.allclose(compressed.scores(q, rows), _cosine(vectors, q)[rows], atol=1e-6)
+
+
+def test_compressed_forms_keep_scores_and_top10():
+    vectors, queries = _embeddings()
+    for dtype, pca_dim, atol, ratio in [("float16", None, 1e-3, 2), ("int8", None, 2e-2, 3.5), ("int8", 32, None, 6)]:
+        compressed = CompressedEmbeddings(vectors, dtype, pca_dim, block_rows=300)
+        assert vectors.nbytes / compressed.nbytes >= ratio
+        recall = []
+        for q in queries:
+            exact, approx = _cosine(vectors, q), compressed.scores(q)
+            if atol is not None:
+                assert np.allclose(approx, exact, atol=atol)
+            recall.append(len(set(np.argsort(-exact)[:10]) & set(np.argsort(-approx)[:10])) / 10)
+        assert np.mean(recall) >= 0.9
+
+
+if __name__ == "__main__":
+    test_float32_is_exact_cosine()
+    test_compressed_forms_keep_scores_and_top10()
+    print("✅ All quantization tests passed!")
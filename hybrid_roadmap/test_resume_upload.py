@@ -0,0 +1,44 @@
+"""
+Checks for parsing resumes straight from memory
+"""
+
+import io
+
+import pytest
+
+from modules.parsing.resume_parser import parse_resume
+from modules.utils.uploads import UploadTooLarge, read_upload
+
+RESUME = "Bhoomika_agrawal.resume.pdf"
+SKILLS_CSV = "data/skills.csv"
+
+
+def test_bytes_and_stream_match_path():
+    expected = parse_resume(RESUME, SKILLS_CSV)
+    with open(RESUME, "rb") as f:
+        data = f.read()
+    assert parse_resume(data, SKILLS_CSV, filename=RESUME) == expected
+    assert parse_resume(io.BytesIO(data), SKILLS_CSV) == expected
+
+
+def test_unknown_format_rejected():
+    with pytest.raises(ValueError):
+        parse_resume(b"plain text resume", SKILLS_CSV, filename="resume.txt")
+    # The extension decides when there is a filename, as it did for paths
+    with open(RESUME, "rb") as f:
+        data = f.read()
+    with pytest.raises(ValueError):
+        parse_resume(data, SKILLS_CSV, filename="resume.txt")
+
+
+def test_read_upload_enforces_limit():
+    assert read_upload(io.BytesIO(b"x" * 100), max_bytes=100) == b"x" * 100
+    with pytest.raises(UploadTooLarge):
+        read_upload(io.BytesIO(b"x" * 101), max_bytes=100)
+
+
+if __name__ == "__main__":
+    test_bytes_and_stream_match_path()
+    test_unknown_format_rejected()
+    test_read_upload_enforces_limit()
+    print("✅ All resume upload tests passed!")
@@ -0,0 +1,84 @@
+"""
+Checks for the per-skill embedding cache behind semantic_mode="composed"
+"""
+
+import numpy as np
+
+from modules.parsing.taxonomy import get_taxonomy
+from modules.recommender import encoders, jd_reume
+from modules.recommender.encoders import StubEncoder
+from modules.recommender.skill_embeddings import SkillEmbeddingCache, get_skill_embeddings
+
+TAXONOMY = get_taxonomy("data/skills.csv")
+
+
+class CountingEncoder(StubEncoder):
+    """Stub encoder that records every text it is asked to encode."""
+
+    def __init__(self):
+        super().__init__()
+        self.encoded = []
+
+    def encode(self, texts):
+        self.encoded.extend(texts)
+        return super().encode(texts)
+
+
+def _unit(text: str) -> np.ndarray:
+    return StubEncoder().encode([text])[0]
+
+
+def test_taxonomy_skills_are_encoded_once():
+    encoder = CountingEncoder()
+    cache = SkillEmbeddingCache(encoder=encoder)
+    cache.vectors(TAXONOMY.skills)
+    cache.vectors(["Python", "SQL"])
+    cache.compose(TAXONOMY.skills[:20], {"Python": 3.0})
+
+    keys = {skill.lower().strip() for skill in TAXONOMY.skills}
+    assert sorted(encoder.encoded) == sorted(keys)
+    assert len(cache._extra) == 0
+
+
+def test_unknown_skills_go_to_the_bounded_lru():
+    encoder = CountingEncoder()
+    cache = SkillEmbeddingCache(encoder=encoder, max_extra_skills=2)
+    cache.vectors(["Python"])
+    encoder.encoded.clear()
+
+    cache.vectors(["Quantum Basket Weaving", "quantum basket weaving", "Python"])
+    assert encoder.encoded == ["quantum basket weaving"]
+    cache.vectors(["Quantum Basket Weaving"])
+    assert encoder.encoded == ["quantum basket weaving"]
+
+    cache.vectors(["Zorblang", "Flimflam Ops"])
+    assert len(cache._extra) == 2
+    assert cache._extra.get("quantum basket weaving") is None
+
+
+def test_composed_vector_is_weighted_mean_of_unit_vectors(monkeypatch):
+    monkeypatch.setattr(encoders, "DEFAULT_BACKEND", "stub")
+    cache = SkillEmbeddingCache(encoder=StubEncoder())
+    skills = ["Python", "SQL", "Machine Learning"]
+    weights = {"python": 3.0, "Machine Learning": 2.0}
+
+    expected = (3.0 * _unit("python") + 1.0 * _unit("sql") + 2.0 * _unit("machine learning")) / 6.0
+    assert np.allclose(cache.compose(skills, weights), expected, atol=1e-6)
+    assert np.allclose(cache.compose(skills), (_unit("python") + _unit("sql") + _unit("machine learning")) / 3.0,
+                       atol=1e-6)
+
+    # The composed semantic score uses jd_skill_weights on the JD side only
+    resume = ["Python", "Docker"]
+    jd_weights = {"Python": 3.0, "SQL": 1.0, "Machine Learning": 2.0}
+    resume_vec = get_skill_embeddings().compose(resume)
+    jd_vec = get_skill_embeddings().compose(skills, jd_weights)
+    cosine = resume_vec @ jd_vec / (np.linalg.norm(resume_vec) * np.linalg.norm(jd_vec))
+    assert np.isclose(jd_reume._semantic_score(resume, skills, jd_weights, "composed"), cosine, atol=1e-6)
+    assert not np.isclose(jd_reume._semantic_score(resume, skills, None, "composed"), cosine, atol=1e-6)
+
+
+if __name__ == "__main__":
+    # The composed-score test relies on pytest's monkeypatch fixture
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-q"]))
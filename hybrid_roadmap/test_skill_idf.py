@@ -0,0 +1,58 @@
+"""
+Checks for the global-IDF skill similarity
+"""
+
+import math
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from modules.recommender.skill_idf import SkillIdf
+
+JOB_TEXTS = [
+    "Python Django REST APIs PostgreSQL Docker",
+    "Python PyTorch machine learning model deployment",
+    "SQL Excel Tableau reporting dashboards",
+]
+TAXONOMY = ["Python", "SQL", "Docker", "Kubernetes", "Machine Learning"]
+
+
+def _write_taxonomy(path, skills):
+    path.write_text("skill,category\n" + "".join(f"{skill},Tech\n" for skill in skills))
+    return str(path)
+
+
+def test_matches_tfidf_vectorizer_fitted_on_the_same_corpus(tmp_path):
+    idf = SkillIdf(JOB_TEXTS, _write_taxonomy(tmp_path / "skills.csv", TAXONOMY))
+    vectorizer = TfidfVectorizer().fit(JOB_TEXTS + TAXONOMY)
+
+    for a, b in [("Python SQL Docker", "Python Kubernetes"), ("Excel", "SQL Excel Excel"), ("Python", "Tableau")]:
+        matrix = vectorizer.transform([a, b])
+        expected = float((matrix[0] @ matrix[1].T).toarray()[0, 0])
+        assert math.isclose(idf.similarity(a, b), expected, abs_tol=1e-12)
+
+
+def test_rare_and_unseen_terms_weigh_more(tmp_path):
+    idf = SkillIdf(JOB_TEXTS, _write_taxonomy(tmp_path / "skills.csv", TAXONOMY))
+    assert idf.idf("python") < idf.idf("kubernetes") < idf.idf("cobol")
+    assert idf.similarity("COBOL", "cobol") == 1.0
+    assert idf.similarity("", "Python") == 0.0
+    # Sharing the rare skill counts for more than sharing the common one
+    assert idf.similarity("Python Kubernetes", "Kubernetes Excel") > idf.similarity("Python Kubernetes", "Python Excel")
+
+
+def test_rebuilt_when_taxonomy_changes(tmp_path):
+    path = _write_taxonomy(tmp_path / "skills.csv", TAXONOMY)
+    idf = SkillIdf(JOB_TEXTS, path)
+    version, before = idf.version, idf.idf("rust")
+    _write_taxonomy(tmp_path / "skills.csv", TAXONOMY + ["Rust", "Rust Embedded"])
+    assert idf.version != version
+    assert idf.idf("rust") < before
+    assert np.isclose(idf.idf("python"), math.log(11 / 4) + 1)
+
+
+if __name__ == "__main__":
+    # These tests rely on pytest's tmp_path fixture
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-q"]))
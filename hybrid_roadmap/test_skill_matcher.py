@@ -0,0 +1,81 @@
+"""
+Parity checks between the compiled skill matcher and the original regex loop
+"""
+
+import random
+
+from modules.parsing.taxonomy import get_taxonomy
+from modules.parsing.resume_parser import _extract_text_from_pdf
+from modules.parsing.skill_extractor import extract_skills, extract_skills_many, _extract_skills_regex
+from modules.parsing.skill_matcher import get_matcher
+
+SKILLS = get_taxonomy("data/skills.csv").skills
+
+SAMPLE_TEXTS = [
+    "Must have: Python, SQL, Excel. Good to have: Tableau, Power BI, Git. Optional: Docker",
+    "Experience with Node.js / React, CI/CD pipelines and scikit-learn (NumPy, Pandas).",
+    "C, C++ and C# developer; knows R and Go. Not cpp, not golang, not c-sharp.",
+    "machine-learning, deep/learning, data   structures, spring--boot, ruby on   rails",
+    "Node.jsx react-native .NET ASP.NET asp net TypeScript's javascript_es6",
+    "Spring Boot/Microservices; REST APIs; Google-Cloud; Power_BI; Backup & Recovery",
+    "",
+]
+
+
+def test_matches_regex_on_samples():
+    for text in SAMPLE_TEXTS:
+        assert extract_skills(text, SKILLS) == _extract_skills_regex(text, SKILLS), text
+
+
+def test_matches_regex_on_resume():
+    text = _extract_text_from_pdf("Bhoomika_agrawal.resume.pdf")
+    assert extract_skills(text, SKILLS) == _extract_skills_regex(text, SKILLS)
+
+
+def test_separator_and_boundary_rules():
+    skills = ["Machine Learning", "C", "C++", "Node.js", "CI/CD", "a  b"]
+    assert extract_skills("machine-learning", skills) == ["Machine Learning"]
+    assert extract_skills("machine / - learning", skills) == ["Machine Learning"]
+    assert extract_skills("machinelearning", skills) == []
+    assert extract_skills("c++", skills) == ["C", "C++"]
+    assert extract_skills("node.jsx ci-cd", skills) == []
+    assert extract_skills("a b", skills) == _extract_skills_regex("a b", skills)
+    assert extract_skills("a  -b", skills) == _extract_skills_regex("a  -b", skills)
+
+
+def test_matches_regex_on_random_text():
+    rng = random.Random(7)
+    alphabet = list("abcdefghijklmnopqrstuvwxyz0123456789 ./-+#,&_")
+    vocab = [s.lower() for s in SKILLS] + ["-", "/", " ", ".", "x"]
+    for _ in range(200):
+        parts = [rng.choice(vocab) if rng.random() < 0.6 else rng.choice(alphabet) for _ in range(30)]
+        text = "".join(parts)
+        assert extract_skills(text, SKILLS) == _extract_skills_regex(text, SKILLS), text
+
+
+def test_batch_matches_single_document_calls():
+    texts = SAMPLE_TEXTS * 5
+    expected = [extract_skills(text, SKILLS) for text in texts]
+    assert extract_skills_many(texts, SKILLS) == expected
+    # Force the process pool with small chunks to check ordering across workers
+    assert extract_skills_many(texts, SKILLS, chunk_size=3, max_workers=2, parallel_min_texts=1) == expected
+
+
+def test_matcher_follows_list_contents():
+    skills = ["Python"]
+    assert extract_skills("python rust", skills) == ["Python"]
+    skills.append("Rust")
+    assert extract_skills("python rust", skills) == ["Python", "Rust"]
+    assert get_matcher(skills) is get_matcher(list(skills))
+    taxonomy = get_taxonomy("data/skills.csv")
+    assert get_matcher(taxonomy.matcher) is taxonomy.matcher
+
+
+if __name__ == "__main__":
+    test_matches_regex_on_samples()
+    test_matches_regex_on_resume()
+    test_separator_and_boundary_rules()
+    test_matches_regex_on_random_text()
+    test_batch_matches_single_document_calls()
+    test_matcher_follows_list_contents()
+    print("✅ All skill matcher tests passed!")
@@ -0,0 +1,64 @@
+"""
+Checks for the NDJSON streaming variants of the bulk routes
+"""
+
+import json
+
+from modules.recommender import encoders
+from modules.utils import streaming
+
+STUDENTS = [{"id": f"s{i}", "skills": skills} for i, skills in enumerate(
+    [["Python", "SQL"], ["Java"], ["Python", "Docker"], ["Excel", "SQL"], ["React"]] * 3
+)]
+JOBS = [{"id": "j1", "skills": ["Python", "SQL", "Docker"]}, {"id": "j2", "skills": ["Java", "Spring"]}]
+
+
+def _lines(response):
+    assert response.mimetype == streaming.NDJSON_MIMETYPE
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_match_skills_batch_stream_matches_buffered(monkeypatch):
+    monkeypatch.setattr(encoders, "DEFAULT_BACKEND", "stub")
+    from api import app
+
+    client = app.test_client()
+    body = {"jd_skills": JOBS[0]["skills"], "students": STUDENTS, "threshold": 50}
+    buffered = client.post("/match-skills-batch", json=body).get_json()
+    lines = _lines(client.post("/match-skills-batch", json={**body, "stream": True}))
+    assert lines[:-1] == buffered["results"]
+    assert lines[-1] == {"status": "success", "total": len(STUDENTS)}
+
+
+def test_match_matrix_stream_matches_buffered(monkeypatch):
+    monkeypatch.setattr(encoders, "DEFAULT_BACKEND", "stub")
+    monkeypatch.setattr("routes.handlers.STREAM_CHUNK_SIZE", 4)
+    from api import app
+
+    client = app.test_client()
+    body = {"students": STUDENTS, "jobs": JOBS, "top_k": 2}
+    buffered = client.post("/match-matrix", json=body).get_json()
+    lines = _lines(client.post("/match-matrix", json={**body, "stream": True}))
+    assert [line["student"] for line in lines if "student" in line] == buffered["students"]
+    assert [line["job"] for line in lines if "job" in line] == buffered["jobs"]
+    assert lines[-1] == {"status": "success"}
+
+
+def test_errors_after_the_first_batch_end_the_stream():
+    from flask import Flask
+
+    def batches():
+        yield [{"n": 1}, {"n": 2}]
+        raise RuntimeError("encoder went away")
+
+    with Flask(__name__).test_request_context():
+        response = streaming.ndjson_response(batches())
+        chunks = list(response.response)
+    assert chunks == ['{"n": 1}\n{"n": 2}\n', '{"error": "encoder went away"}\n']
+
+
+if __name__ == "__main__":
+    # These tests rely on pytest's monkeypatch fixture
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,48 @@
+"""
+Checks for the shared skill taxonomy registry
+"""
+
+import os
+
+from modules.parsing.taxonomy import TaxonomyRegistry, get_taxonomy
+
+
+def test_loaded_once_per_path():
+    assert get_taxonomy("data/skills.csv") is get_taxonomy("data/skills.csv")
+
+
+def test_normalized_forms_and_categories():
+    taxonomy = get_taxonomy("data/skills.csv")
+    assert taxonomy.canonical("  python ") == "Python"
+    assert taxonomy.category("PYTHON") == "Programming Language"
+    assert taxonomy.canonical("not a skill") is None
+
+
+def test_reload_on_mtime_change(tmp_path):
+    path = tmp_path / "skills.csv"
+    path.write_text("skill,category\nPython,Language\n", encoding="utf-8")
+    registry = TaxonomyRegistry()
+
+    first = registry.get(str(path))
+    assert first.skills == ["Python"]
+    assert registry.get(str(path)) is first
+
+    path.write_text("skill,category\nPython,Language\nRust,Language\n", encoding="utf-8")
+    os.utime(path, ns=(first.mtime_ns + 1_000_000, first.mtime_ns + 1_000_000))
+
+    second = registry.get(str(path))
+    assert second is not first
+    assert second.skills == ["Python", "Rust"]
+    assert second.version != first.version
+    assert second.matcher.extract("rust and python") == ["Python", "Rust"]
+
+
+if __name__ == "__main__":
+    import tempfile
+    from pathlib import Path
+
+    test_loaded_once_per_path()
+    test_normalized_forms_and_categories()
+    with tempfile.TemporaryDirectory() as tmp:
+        test_reload_on_mtime_change(Path(tmp))
+    print("✅ All taxonomy tests passed!")
@@ -0,0 +1,52 @@
+"""
+Checks for the persisted job TF-IDF store
+"""
+
+import numpy as np
+
+from modules.recommender.hybrid_matcher import HybridJobMatcher
+from modules.recommender.tfidf_store import JobTfidfStore, make_tfidf_vectorizer
+
+TEXTS = [
+    "SQL Excel Tableau reporting dashboards",
+    "Python Django REST APIs PostgreSQL Docker",
+    "Python PyTorch machine learning model deployment",
+]
+
+
+def test_fitted_once_and_reloaded(tmp_path):
+    store = JobTfidfStore(str(tmp_path))
+    vectorizer, matrix = store.fit(TEXTS)
+    assert store.stats()["fits"] == 1
+
+    # A new process loads the saved vectorizer and matrix instead of refitting
+    reopened = JobTfidfStore(str(tmp_path))
+    loaded_vectorizer, loaded_matrix = reopened.fit(TEXTS)
+    assert (reopened.stats()["fits"], reopened.stats()["loads"]) == (0, 1)
+    assert (loaded_matrix != matrix).nnz == 0
+    query = "Python Docker"
+    assert np.allclose(loaded_vectorizer.transform([query]).toarray(), vectorizer.transform([query]).toarray())
+
+
+def test_changed_corpus_is_refitted(tmp_path):
+    JobTfidfStore(str(tmp_path)).fit(TEXTS)
+    store = JobTfidfStore(str(tmp_path))
+    _, matrix = store.fit(TEXTS + ["Kubernetes Terraform AWS"])
+    assert store.stats()["fits"] == 1
+    assert matrix.shape[0] == 4
+
+
+def test_adhoc_scores_ignore_resume_vocabulary():
+    # The resume is only transformed, so its terms do not shift the job IDF
+    scores = HybridJobMatcher().calculate_tfidf_scores("Python Docker Rust Go", TEXTS)
+    vectorizer = make_tfidf_vectorizer().fit(TEXTS)
+    expected = (vectorizer.transform(TEXTS) @ vectorizer.transform(["Python Docker"]).T).toarray().ravel()
+    assert np.allclose(scores, expected)
+    assert scores[0] == 0.0 and scores[1] > scores[2] > 0
+
+
+if __name__ == "__main__":
+    # These tests rely on pytest's tmp_path fixture
+    import pytest
+
+    raise SystemExit(pytest.main([__file__, "-q"]))
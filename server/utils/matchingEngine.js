@@ -192,6 +192,74 @@ const performMLMatching = async (resumeSkills, jdSkills) => {
   }
 };
 
+/**
+ * Match many students' skills against the same JD skills in one ML call
+ * Calls Python API: /match-skills-batch (the JD is embedded once)
+ *
+ * Each result is what matchStudentWithJD returns for that skill list.
+ * Falls back to one matchStudentWithJD call per student if the batch call fails.
+ *
+ * @param {Array<Array<String>>} skillLists - One skills array per student
+ * @param {Array<String>} jdSkills - Job's required skills array
+ * @returns {Array<Object>} Matching results in the same order as skillLists
+ */
+const matchStudentsWithJD = async (skillLists, jdSkills) => {
+  const cleanedJD = cleanSkillArray(jdSkills);
+  const cleanedLists = skillLists.map(cleanSkillArray);
+
+  // Without JD skills or student skills there is nothing to send to the ML service
+  const results = await Promise.all(cleanedLists.map(skills =>
+    cleanedJD.length === 0 || skills.length === 0 ? matchStudentWithJD(skills, cleanedJD) : null
+  ));
+  const pending = cleanedLists
+    .map((skills, index) => ({ skills, index }))
+    .filter(({ index }) => results[index] === null);
+  if (pending.length === 0) return results;
+
+  const ML_API_URL = process.env.ML_API_URL || 'http://127.0.0.1:5002';
+
+  try {
+    console.log(`Sending ML batch request for ${pending.length} students to ${ML_API_URL}/match-skills-batch...`);
+    const response = await axios.post(
+      `${ML_API_URL}/match-skills-batch`,
+      {
+        jd_skills: cleanedJD,
+        students: pending.map(({ skills, index }) => ({ id: index, skills }))
+      },
+      {
+        timeout: 300000 // 5 minutes timeout for ML service
+      }
+    );
+
+    if (response.data.status !== 'success' || !Array.isArray(response.data.results)) {
+      throw new Error('ML API returned invalid response structure');
+    }
+
+    for (const { id, match_result: result } of response.data.results) {
+      results[id] = {
+        status: 'success',
+        method: 'ml-semantic',
+        matched_skills: result.matched_skills || [],
+        missing_skills: result.missing_skills || [],
+        match_percentage: Math.round(result.match_percentage || 0),
+        semantic_score: result.semantic_score || null,
+        tfidf_score: result.tfidf_score || null,
+        hybrid_score: result.hybrid_score || null
+      };
+    }
+  } catch (error) {
+    console.error('⚠️ ML batch API error, matching students one by one:', error.message);
+  }
+
+  // Anything the batch call did not return is matched individually
+  for (const { skills, index } of pending) {
+    if (results[index] === null) {
+      results[index] = await matchStudentWithJD(skills, cleanedJD);
+    }
+  }
+  return results;
+};
+
 /**
  * Match ALL students against a Job Description
  * This is the main batch matching function
@@ -248,28 +316,47 @@ const matchStudentsBatch = async (students, jdSkills, threshold = 75) => {
     skipped: []
   };
 
+  const eligible = [];
   for (const student of students) {
-    try {
-      // Validate student data
-      if (!student._id || !student.email) {
-        results.skipped.push({
-          reason: 'Invalid student data',
-          student: student
-        });
-        continue;
-      }
+    // Validate student data
+    if (!student._id || !student.email) {
+      results.skipped.push({
+        reason: 'Invalid student data',
+        student: student
+      });
+      continue;
+    }
 
-      // Skip students without skills
-      if (!student.skills || !Array.isArray(student.skills) || student.skills.length === 0) {
-        results.skipped.push({
-          reason: 'No skills',
-          studentId: student._id
-        });
-        continue;
-      }
+    // Skip students without skills
+    if (!student.skills || !Array.isArray(student.skills) || student.skills.length === 0) {
+      results.skipped.push({
+        reason: 'No skills',
+        studentId: student._id
+      });
+      continue;
+    }
 
-      // Perform matching using ML service (jd_reume.py via /match-skills endpoint)
-      const matchResult = await matchStudentWithJD(student.skills, jdSkills);
+    eligible.push(student);
+  }
+
+  // Perform matching using ML service (jd_reume.py via /match-skills-batch endpoint)
+  let matchResults;
+  try {
+    matchResults = await matchStudentsWithJD(eligible.map(student => student.skills), jdSkills);
+  } catch (error) {
+    console.error('Batch matching error:', error.message);
+    for (const student of eligible) {
+      results.failed.push({
+        studentId: student._id,
+        error: error.message
+      });
+    }
+    return results;
+  }
+
+  for (const [i, student] of eligible.entries()) {
+    try {
+      const matchResult = matchResults[i];
 
       // Add to results if above threshold
       if (matchResult.match_percentage >= threshold) {
@@ -311,6 +398,18 @@ const matchStudentsBatch = async (students, jdSkills, threshold = 75) => {
 const computeMatchesForAllStudents = async (students, jdSkills) => {
   const allMatches = [];
 
+  // Score every student with skills in one batch ML call up front
+  const withSkills = students.filter(student =>
+    student._id && student.email && Array.isArray(student.skills) && student.skills.length > 0
+  );
+  let batchResults = new Map();
+  try {
+    const matchResults = await matchStudentsWithJD(withSkills.map(student => student.skills), jdSkills);
+    batchResults = new Map(withSkills.map((student, i) => [student, matchResults[i]]));
+  } catch (err) {
+    console.error('Batch matching error, matching students one by one:', err.message);
+  }
+
   for (const student of students) {
     try {
       if (!student._id || !student.email) {
@@ -340,7 +439,7 @@ const computeMatchesForAllStudents = async (students, jdSkills) => {
         continue;
       }
 
-      const result = await matchStudentWithJD(student.skills, jdSkills);
+      const result = batchResults.get(student) || await matchStudentWithJD(student.skills, jdSkills);
 
       allMatches.push({
         studentId: student._id,
@@ -377,6 +476,7 @@ module.exports = {
   calculateSimpleMatchPercentage,
   getMatchedUnmatchedSkills,
   matchStudentWithJD,
+  matchStudentsWithJD,
   performSimpleMatching,
   performMLMatching,
   matchAllStudentsWithJD,